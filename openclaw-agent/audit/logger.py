@@ -5,33 +5,40 @@ Append-only JSONL audit trail.  Every inbound request and its outcome
 are recorded with a UTC timestamp, the resolved tier, and the result
 or rejection reason.
 
-The log file lives under config.AUDIT_LOG_DIR and is created on first write.
+Records are handed to a bounded in-memory queue and written in batches
+by a background flusher (see ``start_audit_flusher``), so the action
+path never waits on disk I/O.  If the flusher is not running, records
+are written directly.
+
+The log file is config.AUDIT_LOG_PATH; its directory is created by config
+at import and the file itself on first write.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import time
 from datetime import datetime, timezone
 from typing import Any
 
-from config import AUDIT_LOG_DIR, AUDIT_LOG_FILE
+from config import (
+    AUDIT_BATCH_MS,
+    AUDIT_BATCH_SIZE,
+    AUDIT_LOG_PATH,
+    AUDIT_QUEUE_MAXSIZE,
+)
+from utils import fastjson
 
 logger = logging.getLogger("chathan.audit")
 
-_log_path: str | None = None
 _write_lock = asyncio.Lock()
 
-
-def _ensure_log_dir() -> str:
-    global _log_path
-    if _log_path is None:
-        os.makedirs(AUDIT_LOG_DIR, exist_ok=True)
-        _log_path = os.path.join(AUDIT_LOG_DIR, AUDIT_LOG_FILE)
-    return _log_path
+_audit_queue: asyncio.Queue[str] | None = None
+_flusher_task: asyncio.Task | None = None
+_dropped_count = 0
+_dropped_reported = 0
 
 
 def _build_entry(
@@ -68,6 +75,7 @@ async def log_event(
     duration_ms: float | None = None,
 ) -> None:
     """Append one audit record to the JSONL log file."""
+    global _dropped_count
     entry = _build_entry(
         request_id=request_id,
         action=action,
@@ -77,13 +85,20 @@ async def log_event(
         detail=detail,
         duration_ms=duration_ms,
     )
-    line = json.dumps(entry, default=str) + "\n"
-    path = _ensure_log_dir()
-
-    async with _write_lock:
-        # Run blocking I/O in a thread so we never stall the event loop.
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, _append_line, path, line)
+    line = fastjson.dumps(entry, default=str) + "\n"
+
+    if _flusher_task is not None and not _flusher_task.done():
+        try:
+            _audit_queue.put_nowait(line)
+        except asyncio.QueueFull:
+            # Counted only; the flusher logs one summary per batch so an
+            # overloaded worker is not also flooded with warnings.
+            _dropped_count += 1
+    else:
+        async with _write_lock:
+            # Run blocking I/O in a thread so we never stall the event loop.
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _append_line, AUDIT_LOG_PATH, line)
 
     logger.info(
         "audit | %s | %s | %s | %s",
@@ -94,6 +109,86 @@ async def log_event(
     )
 
 
-def _append_line(path: str, line: str) -> None:
-    with open(path, "a", encoding="utf-8") as fh:
-        fh.write(line)
+def dropped_count() -> int:
+    """Number of audit records dropped because the queue was full."""
+    return _dropped_count
+
+
+def start_audit_flusher() -> asyncio.Task:
+    """Start the background batch writer on the running event loop."""
+    global _audit_queue, _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+        _flusher_task = asyncio.create_task(_audit_flusher(_audit_queue))
+    return _flusher_task
+
+
+async def stop_audit_flusher() -> None:
+    """Stop the background writer, flushing any queued records first."""
+    global _flusher_task
+    task, _flusher_task = _flusher_task, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def _report_drops() -> None:
+    """Log the records dropped since the last report as a single warning."""
+    global _dropped_reported
+    dropped = _dropped_count
+    if dropped != _dropped_reported:
+        logger.warning(
+            "Audit queue full — dropped %d record(s) (total dropped: %d)",
+            dropped - _dropped_reported,
+            dropped,
+        )
+        _dropped_reported = dropped
+
+
+async def _audit_flusher(queue: asyncio.Queue[str]) -> None:
+    loop = asyncio.get_running_loop()
+    path = AUDIT_LOG_PATH
+    window = AUDIT_BATCH_MS / 1000
+    batch: list[str] = []
+    try:
+        while True:
+            batch.append(await queue.get())
+            deadline = loop.time() + window
+            while len(batch) < AUDIT_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            data = "".join(batch)
+            batch.clear()
+            try:
+                await loop.run_in_executor(None, _append_line, path, data)
+            except OSError:
+                logger.exception("Failed to write audit batch")
+            _report_drops()
+    except asyncio.CancelledError:
+        # Flush whatever is still pending before shutting down.
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch:
+            _append_line(path, "".join(batch))
+        _report_drops()
+        raise
+
+
+def _append_line(path: str | os.PathLike, line: str) -> None:
+    # O_APPEND makes each write land atomically at the end of the file.
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        data = memoryview(line.encode("utf-8"))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
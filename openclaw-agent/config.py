@@ -10,6 +10,9 @@ environment variables or a secrets manager — never hardcode them.
 
 import os
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 
 # ---------------------------------------------------------------------------
@@ -48,7 +51,7 @@ class Tier(str, Enum):
 # Action → Tier mapping
 # Only actions listed here are permitted. Everything else is BLOCKED.
 # ---------------------------------------------------------------------------
-AUTO_ACTIONS: set[str] = {
+AUTO_ACTIONS: frozenset[str] = frozenset({
     "git_status",
     "web_search",
     "run_tests",
@@ -59,9 +62,9 @@ AUTO_ACTIONS: set[str] = {
     "list_directory",
     "ollama_chat",
     "check_coding_agents",
-}
+})
 
-CONFIRM_ACTIONS: set[str] = {
+CONFIRM_ACTIONS: frozenset[str] = frozenset({
     "git_commit",
     "install_dependencies",
     "file_write",
@@ -76,7 +79,7 @@ CONFIRM_ACTIONS: set[str] = {
     "docker_compose_up",
     "close_app",
     "zip_project",
-}
+})
 
 # Hardcoded allowlist of process names that close_app can terminate.
 # Only these executables can be closed — anything else is rejected.
@@ -94,7 +97,7 @@ CLOSEABLE_APPS: dict[str, str] = {
 }
 
 # Explicitly listed so the validator can log attempts against known-bad ops.
-BLOCKED_ACTIONS: set[str] = {
+BLOCKED_ACTIONS: frozenset[str] = frozenset({
     "shell_exec",
     "format_disk",
     "modify_registry",
@@ -102,7 +105,15 @@ BLOCKED_ACTIONS: set[str] = {
     "firewall_change",
     "download_exec",
     "eval_code",
-}
+})
+
+# Single-lookup tier table.  Callers use ``ACTION_TIERS.get(name, Tier.BLOCKED)``
+# so unknown actions are blocked by construction.
+ACTION_TIERS: Mapping[str, Tier] = MappingProxyType({
+    **{a: Tier.BLOCKED for a in BLOCKED_ACTIONS},
+    **{a: Tier.CONFIRM for a in CONFIRM_ACTIONS},
+    **{a: Tier.AUTO for a in AUTO_ACTIONS},
+})
 
 
 # ---------------------------------------------------------------------------
@@ -156,11 +167,22 @@ EMERGENCY_STOP: bool = False
 # ---------------------------------------------------------------------------
 # Logging / Audit
 # ---------------------------------------------------------------------------
-AUDIT_LOG_DIR: str = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    "logs",
-)
+_HERE: Path = Path(__file__).resolve().parent
+AUDIT_LOG_DIR: Path = _HERE / "logs"
+AUDIT_LOG_DIR.mkdir(parents=True, exist_ok=True)
 AUDIT_LOG_FILE: str = "audit.jsonl"
+AUDIT_LOG_PATH: Path = AUDIT_LOG_DIR / AUDIT_LOG_FILE
+
+# Audit records are queued and flushed in batches by a background task:
+# up to AUDIT_BATCH_SIZE lines or AUDIT_BATCH_MS of wall time per write.
+# When the queue is full new records are dropped and counted.
+AUDIT_BATCH_SIZE: int = int(
+    os.environ.get("SKYNET_AUDIT_BATCH_SIZE", os.environ.get("OPENCLAW_AUDIT_BATCH_SIZE", "256")),
+)
+AUDIT_BATCH_MS: int = int(
+    os.environ.get("SKYNET_AUDIT_BATCH_MS", os.environ.get("OPENCLAW_AUDIT_BATCH_MS", "50")),
+)
+AUDIT_QUEUE_MAXSIZE: int = 10_000
 LOG_LEVEL: str = os.environ.get(
     "SKYNET_LOG_LEVEL", os.environ.get("OPENCLAW_LOG_LEVEL", "INFO"),
 )
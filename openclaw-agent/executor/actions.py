@@ -16,14 +16,23 @@ SECURITY INVARIANTS
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import contextlib
+import functools
 import os
 import re
 import logging
 import shutil
-from html import unescape
-from urllib import parse, request
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from utils import fastjson
+
+if TYPE_CHECKING:
+    import http.client
 
 logger = logging.getLogger("chathan.executor")
 
@@ -44,57 +53,149 @@ _CODING_AGENT_PREFIX_ARGS: dict[str, list[str]] = {
 _CODING_AGENT_TIMEOUT_SECONDS = 1800
 _BRAVE_SEARCH_API_KEY = os.environ.get("BRAVE_SEARCH_API_KEY", "")
 _WEB_SEARCH_TIMEOUT_SECONDS = 15
+_WEB_SEARCH_MAX_REDIRECTS = 3
+
+# Idle keep-alive HTTPS connections reused across web searches, per host.
+# The lock only guards check-out/check-in; requests run outside it so
+# concurrent searches never wait on each other's network I/O.
+# Web-search modules (urllib, http.client, gzip) are imported lazily inside
+# the helpers so workers that never search skip their import cost.
+_HTTPS_IDLE: dict[str, list[http.client.HTTPSConnection]] = {}
+_HTTPS_MAX_IDLE_PER_HOST = 4
+_HTTPS_LOCK = threading.Lock()
+
+# Patterns used on every call of their respective actions — compiled once.
+# ``\Z`` rather than ``$``: ``$`` also matches before a trailing newline.
+_REPO_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+\Z")
+_DOCKER_TAG_RE = re.compile(r"^[a-zA-Z0-9._/:@-]+\Z")
 
 
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
 
+# Dedicated pool for local filesystem I/O so file actions never queue behind
+# slow work (web search, zipping) on the loop's default executor.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="openclaw-io")
+atexit.register(_IO_POOL.shutdown, wait=False, cancel_futures=True)
+# file_write payloads up to this many bytes are written on the loop thread.
+_INLINE_WRITE_THRESHOLD = 4096
+
+# Bound concurrent fork/exec so a burst of requests cannot exhaust memory.
+# Commands allowed to outlive the default timeout (installs, docker builds,
+# coding agents) get their own bound so quick actions never queue behind them.
+_MAX_CONCURRENT_SUBPROCS = int(
+    os.environ.get("SKYNET_MAX_SUBPROCS") or os.environ.get("OPENCLAW_MAX_SUBPROCS") or "4"
+)
+_MAX_CONCURRENT_LONG_SUBPROCS = int(
+    os.environ.get("SKYNET_MAX_LONG_SUBPROCS")
+    or os.environ.get("OPENCLAW_MAX_LONG_SUBPROCS")
+    or "2"
+)
+_SUBPROC_SEM = asyncio.Semaphore(_MAX_CONCURRENT_SUBPROCS)
+_LONG_SUBPROC_SEM = asyncio.Semaphore(_MAX_CONCURRENT_LONG_SUBPROCS)
+
+# Output limits are in characters.  Pipes keep at most _UTF8_MAX_BYTES bytes
+# per character, so the decode is bounded by the limit, not the output size,
+# and even all-multibyte output still fills the full character budget.
+_STDOUT_CAP = 8192
+_STDERR_CAP = 4096
+_UTF8_MAX_BYTES = 4
+_PIPE_READ_SIZE = 64 * 1024
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, bool]:
+    """
+    Read *stream* to EOF, keeping at most *limit* bytes.
+
+    The remainder is drained and discarded so the child never blocks on a
+    full pipe, but it is never accumulated in memory.
+    """
+    buf = bytearray()
+    truncated = False
+    while chunk := await stream.read(_PIPE_READ_SIZE):
+        room = limit - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+        if len(chunk) > room:
+            truncated = True
+    return bytes(buf), truncated
+
+
+def _decode_capped(data: bytes, truncated: bool, max_chars: int) -> str:
+    text = data.decode("utf-8", errors="replace")
+    if truncated or len(text) > max_chars:
+        return f"{text[:max_chars]}\n... (truncated)"
+    return text
+
+
 async def _run(
     args: list[str],
     *,
     cwd: str | None = None,
     timeout: int = _SUBPROCESS_TIMEOUT,
+    long_running: bool = False,
 ) -> dict[str, Any]:
     """
     Run a fixed argument list as an async subprocess.
 
     Returns a dict with ``returncode``, ``stdout``, and ``stderr``.
+    Output is capped at 8 KB (stdout) / 4 KB (stderr) while it is read.
+    *long_running* runs, and any with a *timeout* above the default, take a
+    slot from the long-running pool instead of the quick one.
     """
     logger.debug("exec: %s  (cwd=%s)", args, cwd)
-    proc = await asyncio.create_subprocess_exec(
-        *args,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=cwd,
-    )
-    try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout,
+    long_running = long_running or timeout > _SUBPROCESS_TIMEOUT
+    sem = _LONG_SUBPROC_SEM if long_running else _SUBPROC_SEM
+    async with sem:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
         )
-    except asyncio.TimeoutError:
-        proc.kill()
-        await proc.communicate()
-        return {
-            "returncode": -1,
-            "stdout": "",
-            "stderr": f"Process timed out after {timeout}s and was killed.",
-        }
+        try:
+            async with asyncio.timeout(timeout):
+                (stdout_bytes, stdout_cut), (stderr_bytes, stderr_cut), _ = await asyncio.gather(
+                    _read_capped(proc.stdout, _UTF8_MAX_BYTES * _STDOUT_CAP),
+                    _read_capped(proc.stderr, _UTF8_MAX_BYTES * _STDERR_CAP),
+                    proc.wait(),
+                )
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+            return {
+                "returncode": -1,
+                "stdout": "",
+                "stderr": f"Process timed out after {timeout}s and was killed.",
+            }
 
     return {
         "returncode": proc.returncode,
-        "stdout": stdout_bytes.decode("utf-8", errors="replace")[:8192],
-        "stderr": stderr_bytes.decode("utf-8", errors="replace")[:4096],
+        "stdout": _decode_capped(stdout_bytes, stdout_cut, _STDOUT_CAP),
+        "stderr": _decode_capped(stderr_bytes, stderr_cut, _STDERR_CAP),
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _which_cached(binary: str) -> str | None:
+    """
+    Memoised ``shutil.which`` — avoids re-walking ``$PATH`` on every call.
+
+    Call ``_which_cached.cache_clear()`` to force a rescan after installing
+    or moving a binary.
+    """
+    return shutil.which(binary)
+
+
 def _require_param(params: dict[str, Any], key: str) -> str:
     """Extract a required string parameter or raise."""
     value = params.get(key)
-    if not value or not isinstance(value, str):
-        raise ValueError(f"Missing required parameter: '{key}'")
-    return value
+    # Params come from JSON, so an exact type check suffices.
+    if type(value) is str and value:
+        return value
+    raise ValueError(f"Missing required parameter: '{key}'")
 
 
 # ------------------------------------------------------------------
@@ -194,15 +295,17 @@ async def file_read(params: dict[str, Any]) -> dict[str, Any]:
     filepath = _require_param(params, "file")
     loop = asyncio.get_running_loop()
     try:
-        content = await loop.run_in_executor(None, _read_file_sync, filepath)
+        content = await loop.run_in_executor(_IO_POOL, _read_file_sync, filepath)
         return {"returncode": 0, "stdout": content, "stderr": ""}
     except OSError as exc:
         return {"returncode": 1, "stdout": "", "stderr": str(exc)}
 
 
 def _read_file_sync(filepath: str) -> str:
+    # Read one char past the cap so truncation is detectable without
+    # decoding the rest of the file.
     with open(filepath, "r", encoding="utf-8", errors="replace") as fh:
-        content = fh.read()
+        content = fh.read(65536 + 1)
     if len(content) > 65536:
         return content[:65536] + "\n... (truncated at 64 KB)"
     return content
@@ -215,7 +318,7 @@ async def list_directory(params: dict[str, Any]) -> dict[str, Any]:
     loop = asyncio.get_running_loop()
     try:
         listing = await loop.run_in_executor(
-            None, _list_dir_sync, directory, recursive, 0,
+            _IO_POOL, _list_dir_sync, directory, recursive, 0,
         )
         return {"returncode": 0, "stdout": listing, "stderr": ""}
     except OSError as exc:
@@ -249,23 +352,87 @@ async def web_search(params: dict[str, Any]) -> dict[str, Any]:
         return {"returncode": 1, "stdout": "", "stderr": f"Web search failed: {exc}"}
 
 
+def _https_get(url: str, headers: dict[str, str]) -> str:
+    """
+    GET *url* over a pooled keep-alive HTTPS connection and return the body.
+
+    Idle connections are pooled per host so repeat searches skip the TCP/TLS
+    handshake.  A stale pooled connection is dropped and retried once on a
+    fresh one; timeouts are not retried.  Raises ``OSError`` on non-2xx
+    responses.
+    """
+    import gzip
+    import http.client
+    from urllib import parse
+
+    for _ in range(_WEB_SEARCH_MAX_REDIRECTS + 1):
+        parts = parse.urlsplit(url)
+        if parts.scheme != "https":
+            raise OSError(f"Refusing non-HTTPS URL: {url}")
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        for attempt in range(2):
+            with _HTTPS_LOCK:
+                idle = _HTTPS_IDLE.get(parts.netloc)
+                conn = idle.pop() if idle and not attempt else None
+            reused = conn is not None
+            if conn is None:
+                conn = http.client.HTTPSConnection(
+                    parts.netloc, timeout=_WEB_SEARCH_TIMEOUT_SECONDS,
+                )
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except TimeoutError:
+                conn.close()
+                raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # Only a pooled connection can have gone stale; retry that once.
+                if attempt or not reused:
+                    raise
+                continue
+            with _HTTPS_LOCK:
+                idle = _HTTPS_IDLE.setdefault(parts.netloc, [])
+                keep = not resp.will_close and len(idle) < _HTTPS_MAX_IDLE_PER_HOST
+                if keep:
+                    idle.append(conn)
+            if not keep:
+                conn.close()
+            break
+
+        if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            url = parse.urljoin(url, resp.getheader("Location"))
+            continue
+        if resp.status >= 400:
+            raise OSError(f"HTTP {resp.status} from {parts.netloc}")
+        if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body.decode("utf-8", errors="replace")
+
+    raise OSError(f"Too many redirects fetching {url}")
+
+
 def _brave_web_search_sync(query: str, num_results: int, api_key: str) -> str:
+    from urllib import parse
+
     url = (
         "https://api.search.brave.com/res/v1/web/search?"
         f"q={parse.quote_plus(query)}&count={num_results}"
     )
-    req = request.Request(
+    payload = _https_get(
         url,
-        headers={
+        {
             "Accept": "application/json",
             "Accept-Encoding": "gzip",
             "X-Subscription-Token": api_key,
             "User-Agent": "SKYNET-Worker/1.0",
         },
     )
-    with request.urlopen(req, timeout=_WEB_SEARCH_TIMEOUT_SECONDS) as resp:
-        payload = resp.read().decode("utf-8", errors="replace")
-    data = json.loads(payload)
+    data = fastjson.loads(payload)
     results = data.get("web", {}).get("results", []) if isinstance(data, dict) else []
     if not results:
         return "No results found."
@@ -279,50 +446,79 @@ def _brave_web_search_sync(query: str, num_results: int, api_key: str) -> str:
     return "\n".join(lines)
 
 
+class _DDGResultParser(HTMLParser):
+    """
+    Single-pass collector for ``(href, title)`` pairs from DDG Lite markup.
+
+    Anchors carrying the ``result-link`` class go to ``results``; every
+    other anchor with an ``href`` goes to ``anchors`` for the loose
+    fallback.  Parsing stops doing work once ``limit`` results are found.
+    """
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.results: list[tuple[str, str]] = []
+        self.anchors: list[tuple[str, str]] = []
+        self._href: str | None = None
+        self._is_result = False
+        self._title: list[str] = []
+        self._done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._done or tag != "a":
+            return
+        attr_map = dict(attrs)
+        href = (attr_map.get("href") or "").strip()
+        if not href:
+            return
+        self._href = href
+        self._is_result = "result-link" in (attr_map.get("class") or "").split()
+        self._title = []
+
+    def handle_data(self, data: str) -> None:
+        if self._href is not None and not self._done:
+            self._title.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "a" or self._href is None or self._done:
+            return
+        pair = (self._href, "".join(self._title).strip())
+        if self._is_result:
+            self.results.append(pair)
+            if len(self.results) >= self.limit:
+                self._done = True
+        else:
+            self.anchors.append(pair)
+        self._href = None
+
+
 def _ddg_web_search_sync(query: str, num_results: int) -> str:
+    from urllib import parse
+
     url = f"https://lite.duckduckgo.com/lite/?q={parse.quote_plus(query)}"
-    req = request.Request(url, headers={"User-Agent": "SKYNET-Worker/1.0"})
-    with request.urlopen(req, timeout=_WEB_SEARCH_TIMEOUT_SECONDS) as resp:
-        page = resp.read().decode("utf-8", errors="replace")
+    page = _https_get(url, {"User-Agent": "SKYNET-Worker/1.0"})
 
-    results: list[str] = []
+    parser = _DDGResultParser(num_results)
+    parser.feed(page)
+    parser.close()
 
-    # DDG Lite result links vary in quote style/order:
-    #   <a ... class='result-link' href='...'> OR href before class
-    link_pattern = re.compile(
-        r"<a(?=[^>]*class=['\"]result-link['\"])(?=[^>]*href=['\"]([^'\"]+)['\"])[^>]*>(.*?)</a>",
-        re.IGNORECASE | re.DOTALL,
-    )
-    for match in link_pattern.finditer(page):
-        raw_link = (match.group(1) or "").strip()
-        title_html = match.group(2) or ""
-        if not raw_link:
-            continue
+    results: list[str] = []
+    for raw_link, title_text in parser.results:
         link = _normalize_ddg_result_url(raw_link)
         if not link:
             continue
-        title_text = unescape(re.sub(r"<[^>]+>", "", title_html)).strip()
-        if not title_text:
-            title_text = "No title"
-        results.append(f"- {title_text}\n  URL: {link}")
-        if len(results) >= num_results:
-            break
+        results.append(f"- {title_text or 'No title'}\n  URL: {link}")
 
     if results:
         return "\n".join(results)
 
     # Loose fallback for non-standard markup.
-    links = re.findall(
-        r"<a[^>]+href=['\"]([^'\"]+)['\"][^>]*>(.*?)</a>",
-        page,
-        re.IGNORECASE | re.DOTALL,
-    )
-    for raw_link, title_html in links:
+    for raw_link, title_text in parser.anchors:
         link = _normalize_ddg_result_url(raw_link)
         if not link or "duckduckgo.com" in link:
             continue
-        title_text = unescape(re.sub(r"<[^>]+>", "", title_html)).strip() or "No title"
-        results.append(f"- {title_text}\n  URL: {link}")
+        results.append(f"- {title_text or 'No title'}\n  URL: {link}")
         if len(results) >= num_results:
             break
 
@@ -331,6 +527,8 @@ def _ddg_web_search_sync(query: str, num_results: int) -> str:
 
 def _normalize_ddg_result_url(raw_link: str) -> str:
     """Extract real destination URL from DDG redirect links."""
+    from urllib import parse
+
     link = (raw_link or "").strip()
     if not link:
         return ""
@@ -348,25 +546,42 @@ def _normalize_ddg_result_url(raw_link: str) -> str:
     return link
 
 
+_LIST_MAX_DEPTH = 3
+_LIST_MAX_ENTRIES = 500
+_LIST_PREFIX: tuple[str, ...] = tuple("  " * i for i in range(_LIST_MAX_DEPTH + 1))
+
+
+def _sorted_entries(directory: str) -> list[os.DirEntry]:
+    with os.scandir(directory) as it:
+        return sorted(it, key=lambda e: e.name)
+
+
 def _list_dir_sync(directory: str, recursive: bool, depth: int) -> str:
-    MAX_DEPTH = 3
-    MAX_ENTRIES = 500
-    entries: list[str] = []
-    count = 0
-    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
-        if count >= MAX_ENTRIES:
-            entries.append("... (truncated)")
-            break
-        prefix = "  " * depth
+    lines: list[str] = []
+    # Explicit DFS stack of [entry iterator, depth, emitted count] frames so
+    # every line lands in one accumulator and is joined exactly once.
+    stack: list[list[Any]] = [[iter(_sorted_entries(directory)), depth, 0]]
+    while stack:
+        frame = stack[-1]
+        entry = next(frame[0], None)
+        if entry is None:
+            stack.pop()
+            continue
+        if frame[2] >= _LIST_MAX_ENTRIES:
+            lines.append("... (truncated)")
+            stack.pop()
+            continue
+        level = frame[1]
+        prefix = _LIST_PREFIX[level]
+        frame[2] += 1
         if entry.is_dir():
-            entries.append(f"{prefix}[DIR] {entry.name}/")
-            if recursive and depth < MAX_DEPTH:
-                entries.append(_list_dir_sync(entry.path, True, depth + 1))
+            lines.append(f"{prefix}[DIR] {entry.name}/")
+            if recursive and level < _LIST_MAX_DEPTH:
+                stack.append([iter(_sorted_entries(entry.path)), level + 1, 0])
         else:
-            size = entry.stat().st_size
-            entries.append(f"{prefix}{entry.name}  ({size} bytes)")
-        count += 1
-    return "\n".join(entries)
+            size = entry.stat(follow_symlinks=False).st_size
+            lines.append(f"{prefix}{entry.name}  ({size} bytes)")
+    return "\n".join(lines)
 
 
 # ------------------------------------------------------------------
@@ -378,12 +593,9 @@ async def git_commit(params: dict[str, Any]) -> dict[str, Any]:
     cwd = _require_param(params, "working_dir")
     message = _require_param(params, "message")
 
-    # Stage tracked changes only (no untracked files).
-    stage_result = await _run(["git", "add", "-u"], cwd=cwd)
-    if stage_result["returncode"] != 0:
-        return stage_result
-
-    return await _run(["git", "commit", "-m", message], cwd=cwd)
+    # ``-a`` stages tracked changes only (no untracked files), same as a
+    # separate ``git add -u`` but without a second process spawn.
+    return await _run(["git", "commit", "-a", "-m", message], cwd=cwd)
 
 
 async def install_dependencies(params: dict[str, Any]) -> dict[str, Any]:
@@ -420,23 +632,57 @@ async def file_write(params: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(content, str):
         return {"returncode": 1, "stdout": "", "stderr": "content must be a string."}
 
-    # Limit file size to 1 MB to prevent abuse.
-    if len(content.encode("utf-8")) > 1_048_576:
+    # Limit file size to 1 MB to prevent abuse.  A UTF-8 encoding is never
+    # shorter than the str, so oversized content is rejected before encoding;
+    # otherwise encode exactly once and write those bytes.
+    if len(content) > 1_048_576:
+        return {"returncode": 1, "stdout": "", "stderr": "Content exceeds 1 MB limit."}
+    data = content.encode("utf-8")
+    if len(data) > 1_048_576:
         return {"returncode": 1, "stdout": "", "stderr": "Content exceeds 1 MB limit."}
 
-    loop = asyncio.get_running_loop()
     try:
-        await loop.run_in_executor(None, _write_file_sync, filepath, content)
+        if len(data) <= _INLINE_WRITE_THRESHOLD:
+            # Tiny writes finish faster than a thread handoff.
+            _write_file_sync(filepath, data)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_IO_POOL, _write_file_sync, filepath, data)
     except OSError as exc:
         return {"returncode": 1, "stdout": "", "stderr": str(exc)}
 
-    return {"returncode": 0, "stdout": f"Wrote {len(content)} bytes to {filepath}.", "stderr": ""}
+    return {"returncode": 0, "stdout": f"Wrote {len(data)} bytes to {filepath}.", "stderr": ""}
+
+
+# Directories already ensured by file_write, so repeated writes into the same
+# tree skip the makedirs syscalls.  Guarded because writes run on _IO_POOL.
+_DIR_CACHE: set[str] = set()
+_DIR_CACHE_LOCK = threading.Lock()
 
 
-def _write_file_sync(filepath: str, content: str) -> None:
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as fh:
-        fh.write(content)
+def _ensure_dir(directory: str) -> None:
+    with _DIR_CACHE_LOCK:
+        if directory in _DIR_CACHE:
+            return
+    os.makedirs(directory, exist_ok=True)
+    with _DIR_CACHE_LOCK:
+        _DIR_CACHE.add(directory)
+
+
+def _write_file_sync(filepath: str, data: bytes) -> None:
+    directory = os.path.dirname(filepath) or "."
+    _ensure_dir(directory)
+    try:
+        fh = open(filepath, "wb", buffering=1 << 20)
+    except FileNotFoundError:
+        # The cached directory was removed since; forget it and recreate.
+        with _DIR_CACHE_LOCK:
+            _DIR_CACHE.discard(directory)
+        _ensure_dir(directory)
+        fh = open(filepath, "wb", buffering=1 << 20)
+    # Buffer sized to the 1 MB write cap so a full payload is one syscall.
+    with fh:
+        fh.write(data)
 
 
 async def create_directory(params: dict[str, Any]) -> dict[str, Any]:
@@ -444,7 +690,7 @@ async def create_directory(params: dict[str, Any]) -> dict[str, Any]:
     directory = _require_param(params, "directory")
     loop = asyncio.get_running_loop()
     try:
-        await loop.run_in_executor(None, os.makedirs, directory, 0o755, True)
+        await loop.run_in_executor(_IO_POOL, os.makedirs, directory, 0o755, True)
         return {"returncode": 0, "stdout": f"Created {directory}", "stderr": ""}
     except OSError as exc:
         return {"returncode": 1, "stdout": "", "stderr": str(exc)}
@@ -453,6 +699,10 @@ async def create_directory(params: dict[str, Any]) -> dict[str, Any]:
 async def git_init(params: dict[str, Any]) -> dict[str, Any]:
     """Initialize a new git repository and set default branch to main."""
     cwd = _require_param(params, "working_dir")
+    result = await _run(["git", "init", "-b", "main"], cwd=cwd)
+    if result["returncode"] == 0:
+        return result
+    # git < 2.28 has no ``init -b``; fall back to init + checkout.
     result = await _run(["git", "init"], cwd=cwd)
     if result["returncode"] == 0:
         await _run(["git", "checkout", "-b", "main"], cwd=cwd)
@@ -480,7 +730,7 @@ async def gh_create_repo(params: dict[str, Any]) -> dict[str, Any]:
     description = params.get("description", "")
     private = params.get("private", False) is True
 
-    if not re.match(r"^[a-zA-Z0-9._-]+$", repo_name):
+    if not _REPO_NAME_RE.match(repo_name):
         return {"returncode": 1, "stdout": "", "stderr": "Invalid repo name characters."}
 
     visibility = "--private" if private else "--public"
@@ -498,11 +748,15 @@ async def open_in_vscode(params: dict[str, Any]) -> dict[str, Any]:
 
 
 async def check_coding_agents(params: dict[str, Any]) -> dict[str, Any]:
-    """Detect available coding agent CLIs on the laptop."""
-    del params
+    """
+    Detect available coding agent CLIs on the laptop.
+
+    Pass ``refresh=True`` to discard cached lookups and rescan.
+    """
+    if params.get("refresh", False) is True:
+        refresh_agents()
     lines = []
-    for name, binary in _CODING_AGENT_BINARIES.items():
-        resolved = shutil.which(binary)
+    for name, (resolved, binary) in _RESOLVED_AGENTS.items():
         if resolved:
             lines.append(f"{name}: available ({resolved})")
         else:
@@ -514,17 +768,46 @@ async def check_coding_agents(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _resolve_coding_binary(name: str) -> tuple[str, str]:
+def _resolve_coding_binary_uncached(
+    name: str, which: Callable[[str], str | None] = _which_cached,
+) -> tuple[str, str]:
     """Resolve configured binary path for a coding agent."""
     binary = _CODING_AGENT_BINARIES[name]
     if os.path.isabs(binary):
         if os.path.exists(binary):
             return binary, binary
         return "", binary
-    resolved = shutil.which(binary)
+    resolved = which(binary)
     return (resolved or "", binary)
 
 
+# (resolved, configured) per coding agent, resolved once at import.
+_RESOLVED_AGENTS: dict[str, tuple[str, str]] = {}
+
+
+def refresh_agents() -> None:
+    """Re-resolve every coding agent binary (e.g. after installing one)."""
+    _which_cached.cache_clear()
+    _RESOLVED_AGENTS.update(
+        {name: _resolve_coding_binary_uncached(name) for name in _CODING_AGENT_BINARIES}
+    )
+
+
+refresh_agents()
+
+
+def _resolve_coding_binary(name: str) -> tuple[str, str]:
+    """Return the cached ``(resolved, configured)`` binary for a coding agent."""
+    cached = _RESOLVED_AGENTS[name]
+    if cached[0]:
+        return cached
+    # A miss may be stale if the CLI was installed after startup.  Rescan
+    # PATH for this binary only; clearing the shared ``which`` cache would
+    # make every miss rescan every other binary too.
+    _RESOLVED_AGENTS[name] = fresh = _resolve_coding_binary_uncached(name, shutil.which)
+    return fresh
+
+
 async def run_coding_agent(params: dict[str, Any]) -> dict[str, Any]:
     """
     Run a local coding agent CLI in non-interactive mode.
@@ -556,7 +839,7 @@ async def run_coding_agent(params: dict[str, Any]) -> dict[str, Any]:
         }
 
     args = [resolved, *_CODING_AGENT_PREFIX_ARGS[agent], prompt]
-    return await _run(args, cwd=cwd, timeout=timeout)
+    return await _run(args, cwd=cwd, timeout=timeout, long_running=True)
 
 
 async def docker_build(params: dict[str, Any]) -> dict[str, Any]:
@@ -564,7 +847,7 @@ async def docker_build(params: dict[str, Any]) -> dict[str, Any]:
     cwd = _require_param(params, "working_dir")
     tag = params.get("tag", "chathan-build:latest")
 
-    if not re.match(r"^[a-zA-Z0-9._/:@-]+$", tag):
+    if not _DOCKER_TAG_RE.match(tag):
         return {"returncode": 1, "stdout": "", "stderr": "Invalid Docker tag characters."}
 
     return await _run(["docker", "build", "-t", tag, "."], cwd=cwd, timeout=600)
@@ -599,6 +882,14 @@ async def close_app(params: dict[str, Any]) -> dict[str, Any]:
     return await _run(["taskkill", "/F", "/IM", exe_name])
 
 
+_ZIP_EXCLUDE_DIRS = frozenset(
+    {"node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build", ".next"}
+)
+_ZIP_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
+_ZIP_SPOOL_SIZE = 1024 * 1024     # Spill to disk past 1 MB.
+_B64_CHUNK = 57 * 1024            # Multiple of 3 keeps base64 chunks joinable.
+
+
 async def zip_project(params: dict[str, Any]) -> dict[str, Any]:
     """
     Create a zip archive of a project directory and return as base64.
@@ -607,28 +898,53 @@ async def zip_project(params: dict[str, Any]) -> dict[str, Any]:
     .git, venv, .venv, dist, build.
     Cap: 10 MB after compression.
     """
-    import base64
-    import io
-    import zipfile
-
     working_dir = _require_param(params, "working_dir")
 
     if not os.path.isdir(working_dir):
         return {"returncode": 1, "stdout": "", "stderr": f"Not a directory: {working_dir}"}
 
-    EXCLUDE_DIRS = {"node_modules", "__pycache__", ".git", "venv", ".venv", "dist", "build", ".next"}
-    MAX_ZIP_SIZE = 10 * 1024 * 1024  # 10 MB
+    # Compression and encoding are CPU-bound; keep them off the event loop
+    # so WebSocket pings and other actions stay responsive.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _zip_project_sync, working_dir)
+
+
+def _iter_project_files(working_dir: str):
+    """
+    Yield file paths under *working_dir*, skipping ``_ZIP_EXCLUDE_DIRS``.
+
+    Uses ``os.scandir`` with an explicit stack so entry types come from the
+    directory listing itself rather than a separate stat per entry.
+    Symlinks are not followed.  Unreadable directories are skipped.
+    """
+    stack = [working_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _ZIP_EXCLUDE_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def _zip_project_sync(working_dir: str) -> dict[str, Any]:
+    import binascii
+    import tempfile
+    import zipfile
 
-    buf = io.BytesIO()
     file_count = 0
 
-    try:
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            for root, dirs, files in os.walk(working_dir):
-                # Skip excluded directories.
-                dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-                for fname in files:
-                    fpath = os.path.join(root, fname)
+    # Archive into a spooled temp file so large projects spill to disk
+    # instead of holding the whole zip in memory.
+    with tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_SIZE) as spool:
+        try:
+            with zipfile.ZipFile(spool, "w", zipfile.ZIP_DEFLATED) as zf:
+                for fpath in _iter_project_files(working_dir):
                     arcname = os.path.relpath(fpath, working_dir)
                     try:
                         zf.write(fpath, arcname)
@@ -637,22 +953,25 @@ async def zip_project(params: dict[str, Any]) -> dict[str, Any]:
                         continue  # Skip unreadable files.
 
                     # Check size periodically.
-                    if buf.tell() > MAX_ZIP_SIZE:
+                    if spool.tell() > _ZIP_MAX_SIZE:
                         return {
                             "returncode": 1,
                             "stdout": "",
-                            "stderr": f"Zip exceeds {MAX_ZIP_SIZE // (1024*1024)} MB limit.",
+                            "stderr": f"Zip exceeds {_ZIP_MAX_SIZE // (1024*1024)} MB limit.",
                         }
-    except Exception as exc:
-        return {"returncode": 1, "stdout": "", "stderr": f"Zip error: {exc}"}
+        except Exception as exc:
+            return {"returncode": 1, "stdout": "", "stderr": f"Zip error: {exc}"}
 
-    zip_bytes = buf.getvalue()
-    encoded = base64.b64encode(zip_bytes).decode("ascii")
+        zip_size = spool.tell()
+        spool.seek(0)
+        encoded_parts: list[str] = []
+        while chunk := spool.read(_B64_CHUNK):
+            encoded_parts.append(binascii.b2a_base64(chunk, newline=False).decode("ascii"))
 
     return {
         "returncode": 0,
-        "stdout": encoded,
-        "stderr": f"Zipped {file_count} files ({len(zip_bytes)} bytes)",
+        "stdout": "".join(encoded_parts),
+        "stderr": f"Zipped {file_count} files ({zip_size} bytes)",
     }
 
 
@@ -694,3 +1013,10 @@ ACTION_REGISTRY: dict[str, Any] = {
     "close_app": close_app,
     "zip_project": zip_project,
 }
+
+
+# Frozen action name -> executor table.  Tiers live only in config.ACTION_TIERS
+# and are resolved by security.validator.validate_action.
+ACTION_DISPATCH: Mapping[str, Callable[[dict[str, Any]], Any]] = MappingProxyType(
+    dict(ACTION_REGISTRY)
+)
@@ -30,6 +30,7 @@ if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
 import config  # noqa: E402 — must come after path fixup
+from audit.logger import start_audit_flusher, stop_audit_flusher  # noqa: E402
 from connection.websocket_client import run_agent  # noqa: E402
 
 
@@ -65,6 +66,9 @@ def _print_banner() -> None:
     )
 
 
+_IS_WIN = sys.platform == "win32"
+
+
 def _install_signal_handlers(loop: asyncio.AbstractEventLoop) -> None:
     """Graceful shutdown on Ctrl+C / SIGTERM."""
     def _shutdown(sig: signal.Signals) -> None:
@@ -73,9 +77,14 @@ def _install_signal_handlers(loop: asyncio.AbstractEventLoop) -> None:
             task.cancel()
 
     # Windows does not support add_signal_handler on the default event loop,
-    # so fall back to signal.signal for SIGINT (Ctrl+C).
-    if sys.platform == "win32":
-        signal.signal(signal.SIGINT, lambda s, f: _shutdown(signal.Signals(s)))
+    # so fall back to signal.signal for SIGINT (Ctrl+C).  The handler can
+    # interrupt the loop mid-step, so hand the cancellation to the loop
+    # rather than touching tasks from inside the handler.
+    if _IS_WIN:
+        signal.signal(
+            signal.SIGINT,
+            lambda s, f: loop.call_soon_threadsafe(_shutdown, signal.Signals(s)),
+        )
     else:
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, _shutdown, sig)
@@ -98,10 +107,13 @@ async def _main() -> None:
 
     logger.info("Agent starting.  Press Ctrl+C to stop.")
 
+    start_audit_flusher()
     try:
         await run_agent()
     except asyncio.CancelledError:
         logger.info("Agent stopped.")
+    finally:
+        await stop_audit_flusher()
 
 
 if __name__ == "__main__":
@@ -23,7 +23,7 @@ from typing import Any
 
 from audit.logger import log_event
 from config import Tier
-from executor.actions import ACTION_REGISTRY
+from executor.actions import ACTION_DISPATCH
 from executor.locks import acquire_lock, release_lock
 from security.rate_limiter import RateLimitExceeded, SlidingWindowRateLimiter
 from security.validator import (
@@ -119,7 +119,7 @@ async def route(message: dict[str, Any]) -> dict[str, Any]:
         validate_path_params(params)
 
         # ---- Gate 3: Ensure executor exists ----
-        executor_fn = ACTION_REGISTRY.get(action)
+        executor_fn = ACTION_DISPATCH.get(action)
         if executor_fn is None:
             raise SecurityViolation(
                 f"No executor registered for action '{action}'.",
@@ -19,10 +19,9 @@ from typing import Any
 
 import config
 from config import (
+    ACTION_TIERS,
     ALLOWED_ROOTS,
-    AUTO_ACTIONS,
     BLOCKED_ACTIONS,
-    CONFIRM_ACTIONS,
     Tier,
 )
 
@@ -77,13 +76,9 @@ def check_emergency_stop() -> None:
 
 def resolve_tier(action: str) -> Tier:
     """Return the risk tier for *action*, or BLOCKED if unknown."""
-    if action in AUTO_ACTIONS:
-        return Tier.AUTO
-    if action in CONFIRM_ACTIONS:
-        return Tier.CONFIRM
     # Anything not explicitly allowed is blocked, whether it appears in
     # BLOCKED_ACTIONS or is completely unknown.
-    return Tier.BLOCKED
+    return ACTION_TIERS.get(action, Tier.BLOCKED)
 
 
 def validate_action(action: str) -> Tier:
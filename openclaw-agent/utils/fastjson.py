@@ -0,0 +1,36 @@
+"""
+CHATHAN Worker — JSON Codec
+
+Thin wrapper that uses ``orjson`` when it is installed and falls back to
+the stdlib ``json`` module otherwise.  Both functions speak ``str`` so
+callers do not need to care which backend is active.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Encode *obj* as compact JSON text."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few inputs json accepts (e.g. ints > 64 bit).
+            pass
+    # Match orjson's output: no whitespace after separators, raw UTF-8.
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
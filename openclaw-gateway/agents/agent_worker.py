@@ -25,6 +25,11 @@ from .specialized import SpecializedAgent
 
 logger = logging.getLogger("skynet.agents.worker")
 
+# Progress events are written in batches of up to this many rows, or
+# whatever has arrived within the window, in one transaction.
+_EVENT_BATCH_SIZE = 32
+_EVENT_BATCH_WINDOW_SECONDS = 0.1
+
 
 class AgentWorker:
     """
@@ -59,9 +64,21 @@ class AgentWorker:
         self.request_approval = request_approval
         self.manager_watcher = ManagerWatcherAgent(db=self.db, on_progress=self.on_progress)
         self.archivist = ArchivistAgent(db=self.db)
+        self._event_q: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+        self._drain_task: asyncio.Task | None = None
 
     async def run(self) -> None:
         """Main execution loop — fetch tasks, dispatch to agents, test."""
+        self._drain_task = asyncio.create_task(
+            self._drain_events(),
+            name=f"agent-events-{self.project_id}",
+        )
+        try:
+            await self._run_plan()
+        finally:
+            await self._stop_event_drain()
+
+    async def _run_plan(self) -> None:
         project = await store.get_project(self.db, self.project_id)
         if not project:
             logger.error("Project %s not found", self.project_id)
@@ -78,34 +95,42 @@ class AgentWorker:
         await self._notify("started", f"Coding started for {project['display_name']}")
 
         # Initialize memory for all agent roles used in this project.
+        # Roles are independent, so set them up concurrently.
         roles_needed = set(t.get("assigned_agent_role", DEFAULT_ROLE) for t in tasks)
-        for role in roles_needed:
+        default_config = AGENT_CONFIGS[DEFAULT_ROLE]
+        role_configs = {r: AGENT_CONFIGS.get(r, default_config) for r in roles_needed}
+
+        async def _init_role(role: str) -> None:
             agent_id = await self._get_or_create_agent(role)
             if self.memory_manager:
-                config = AGENT_CONFIGS.get(role, AGENT_CONFIGS[DEFAULT_ROLE])
                 await self.memory_manager.initialize_agent_memory(
-                    agent_id, role, project, config,
+                    agent_id, role, project, role_configs[role],
                 )
 
+        await asyncio.gather(*(_init_role(role) for role in roles_needed))
+
         try:
-            milestone_order, milestone_totals = self._build_milestone_index(tasks)
+            # Classify each task's milestone once up front.
+            task_milestones = [self._task_milestone(t) for t in tasks]
+            milestone_order, milestone_totals = self._build_milestone_index(task_milestones)
             milestone_done: dict[str, int] = {name: 0 for name in milestone_order}
             current_milestone: str | None = None
 
             total = len(tasks)
-            for i, task in enumerate(tasks):
-                if self.cancel_event.is_set():
-                    await self._notify("cancelled", "Project cancelled by user.")
-                    await store.update_project(self.db, self.project_id, status="cancelled")
+            for i, (task, milestone_name) in enumerate(zip(tasks, task_milestones)):
+                if await self._stop_if_cancelled():
                     return
 
-                # Wait if paused.
+                # Wait if paused; a cancel while paused ends the run at once.
                 if not self.pause_event.is_set():
                     await self._notify("paused", "Project paused. Send /resume_project to continue.")
-                    await self.pause_event.wait()
+                    # Persist it now rather than leaving it batched for the whole pause.
+                    await self._flush_events()
+                    await self._wait_for_resume_or_cancel()
+                    if await self._stop_if_cancelled():
+                        return
                     await self._notify("resumed", "Project resumed.")
 
-                milestone_name = self._task_milestone(task)
                 if milestone_name != current_milestone:
                     if current_milestone is not None:
                         await self._notify(
@@ -129,11 +154,20 @@ class AgentWorker:
                     )
 
                 role = task.get("assigned_agent_role", DEFAULT_ROLE)
-                await self._execute_task_with_agent(project, task, role, i + 1, total)
+                await self._execute_task_with_agent(
+                    project, task, role, i + 1, total, role_configs[role],
+                )
                 milestone_done[milestone_name] = milestone_done.get(milestone_name, 0) + 1
 
+            # Check for cancellation at every phase boundary so a cancelled
+            # run never starts the testing agent or the memory sync.
+            if await self._stop_if_cancelled():
+                return
+
             # Final testing phase using the testing agent.
             await self._final_testing(project)
+            if await self._stop_if_cancelled():
+                return
 
             if current_milestone is not None:
                 await self._notify(
@@ -147,39 +181,63 @@ class AgentWorker:
                     ),
                 )
 
-            # Sync memory to S3.
+            # Sync memory to S3.  Shielded so a cancellation arriving mid-sync
+            # cannot leave a partially written snapshot behind.
             if self.memory_manager:
-                await self.memory_manager.sync_to_s3(self.project_id)
+                await asyncio.shield(self.memory_manager.sync_to_s3(self.project_id))
 
             summary_artifact_id = await self.archivist.record_project_summary(project=project)
-            await store.update_project(self.db, self.project_id, status="completed")
             await self._notify(
                 "completed",
                 f"Project {project['display_name']} is complete!"
                 + (f"\nGitHub: {project.get('github_repo', '')}" if project.get("github_repo") else "")
                 + f"\nSummary artifact: {summary_artifact_id}",
             )
+            await self._flush_events()
+            await store.update_project(self.db, self.project_id, status="completed")
 
         except Exception as exc:
             logger.exception("AgentWorker error for project %s", self.project_id)
-            await store.update_project(self.db, self.project_id, status="failed")
             await self._notify("error", f"Project failed: {exc}")
+            await self._flush_events()
+            await store.update_project(self.db, self.project_id, status="failed")
+
+    async def _stop_if_cancelled(self) -> bool:
+        """Mark the project cancelled and return True if cancellation was requested."""
+        if not self.cancel_event.is_set():
+            return False
+        await self._notify("cancelled", "Project cancelled by user.")
+        await self._flush_events()
+        await store.update_project(self.db, self.project_id, status="cancelled")
+        return True
+
+    async def _wait_for_resume_or_cancel(self) -> None:
+        """Block until the run is resumed or cancelled, whichever comes first."""
+        waiters = {
+            asyncio.create_task(self.pause_event.wait()),
+            asyncio.create_task(self.cancel_event.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
 
     @staticmethod
     def _task_milestone(task: dict[str, Any]) -> str:
         name = (task.get("milestone") or "").strip()
         return name or "General"
 
+    @staticmethod
     def _build_milestone_index(
-        self,
-        tasks: list[dict[str, Any]],
-    ) -> tuple[list[str], dict[str, int]]:
-        order: list[str] = []
+        milestone_names: list[str],
+    ) -> tuple[dict[str, int], dict[str, int]]:
+        """Return ``(milestone -> 0-based position, milestone -> task count)``."""
+        order: dict[str, int] = {}
         totals: dict[str, int] = {}
-        for task in tasks:
-            name = self._task_milestone(task)
-            if name not in totals:
-                order.append(name)
+        for name in milestone_names:
+            if name not in order:
+                order[name] = len(order)
                 totals[name] = 0
             totals[name] += 1
         return order, totals
@@ -201,10 +259,10 @@ class AgentWorker:
     @staticmethod
     def _milestone_start_summary(
         milestone: str,
-        milestone_order: list[str],
+        milestone_order: dict[str, int],
         milestone_totals: dict[str, int],
     ) -> str:
-        idx = milestone_order.index(milestone) + 1 if milestone in milestone_order else 1
+        idx = milestone_order.get(milestone, 0) + 1
         total = len(milestone_order) if milestone_order else 1
         return (
             f"Starting milestone {idx}/{total}: {milestone} "
@@ -218,10 +276,12 @@ class AgentWorker:
         role: str,
         task_num: int,
         total_tasks: int,
+        config: dict | None = None,
     ) -> None:
         """Create a specialized agent and execute one task."""
         agent_id = await self._get_or_create_agent(role)
-        config = AGENT_CONFIGS.get(role, AGENT_CONFIGS[DEFAULT_ROLE])
+        if config is None:
+            config = AGENT_CONFIGS.get(role, AGENT_CONFIGS[DEFAULT_ROLE])
 
         await store.update_task(
             self.db, task["id"],
@@ -238,15 +298,10 @@ class AgentWorker:
             agent_id=agent_id,
             agent_role=role,
         )
-        heartbeat_stop = asyncio.Event()
-        heartbeat_task = asyncio.create_task(
-            self.manager_watcher.heartbeat_loop(
-                project_id=self.project_id,
-                run_id=run_id,
-                task_title=str(task.get("title", "")),
-                stop_event=heartbeat_stop,
-            ),
-            name=f"manager-heartbeat-{self.project_id}-{task['id']}",
+        self.manager_watcher.watch_run(
+            project_id=self.project_id,
+            run_id=run_id,
+            task_title=str(task.get("title", "")),
         )
 
         agent = SpecializedAgent(
@@ -312,11 +367,7 @@ class AgentWorker:
             )
             raise
         finally:
-            heartbeat_stop.set()
-            try:
-                await heartbeat_task
-            except Exception:
-                logger.debug("Heartbeat task closed with error", exc_info=True)
+            self.manager_watcher.unwatch_run(run_id=run_id)
 
     async def _final_testing(self, project: dict) -> None:
         """Run final validation using the testing agent."""
@@ -356,8 +407,70 @@ class AgentWorker:
         return agent_id
 
     async def _notify(self, event_type: str, summary: str) -> None:
-        await store.add_event(self.db, self.project_id, event_type, summary)
+        if self._drain_task is not None and not self._drain_task.done():
+            self._event_q.put_nowait((event_type, summary))
+        else:
+            await store.add_event(self.db, self.project_id, event_type, summary)
         try:
             await self.on_progress(self.project_id, event_type, summary)
         except Exception:
             logger.exception("Progress callback failed")
+
+    async def _drain_events(self) -> None:
+        """Persist queued progress events in batched transactions."""
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[str, str]] = []
+        stopping = False
+        while not stopping:
+            item = await self._event_q.get()
+            if item is None:
+                break
+            batch.append(item)
+            deadline = loop.time() + _EVENT_BATCH_WINDOW_SECONDS
+            while len(batch) < _EVENT_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._event_q.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await store.add_events(self.db, self.project_id, batch)
+            except Exception:
+                logger.exception("Failed to persist %d progress events", len(batch))
+            for _ in batch:
+                self._event_q.task_done()
+            batch = []
+
+    async def _flush_events(self) -> None:
+        """
+        Wait until every queued progress event has been written.
+
+        Called before status transitions so a reader never sees the new
+        status ahead of the event rows that explain it.
+        """
+        task = self._drain_task
+        if task is None or task.done():
+            return
+        joined = asyncio.create_task(self._event_q.join())
+        try:
+            # If the drainer dies mid-batch, join() would never return.
+            await asyncio.wait({joined, task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            joined.cancel()
+
+    async def _stop_event_drain(self) -> None:
+        """Flush pending events and stop the drain task."""
+        task, self._drain_task = self._drain_task, None
+        if task is None:
+            return
+        self._event_q.put_nowait(None)
+        try:
+            await task
+        except Exception:
+            logger.exception("Progress event drain failed")
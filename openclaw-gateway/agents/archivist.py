@@ -71,12 +71,11 @@ class ArchivistAgent:
             f"- Generated artifacts: {len(artifacts)}",
             "",
             "## Latest Tasks",
+            *(
+                f"- {task.get('title', 'Untitled')} ({task.get('status', 'unknown')})"
+                for task in tasks[-10:]
+            ),
         ]
-        for task in tasks[-10:]:
-            body.append(
-                f"- {task.get('title', 'Untitled')} "
-                f"({task.get('status', 'unknown')})"
-            )
         summary_md = "\n".join(body)
 
         artifact_id = await store.add_task_artifact(
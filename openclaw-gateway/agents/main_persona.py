@@ -21,6 +21,13 @@ class MainPersonaAgent:
         r"\bwrite tests?\b",
         r"\bcreate (?:an?|the)? ?(?:project|repo|service|pipeline)\b",
     )
+    # One alternation so each message is scanned once, not once per pattern.
+    _DELEGATE_RE = re.compile("|".join(DELEGATE_PATTERNS), re.IGNORECASE)
+    # Every pattern contains one of these literals, so a message without any
+    # of them cannot match and skips the regex entirely.
+    _DELEGATE_KEYWORDS = frozenset(
+        {"implement", "build", "deploy", "refactor", "integrat", "write test", "create"}
+    )
 
     def compose_system_prompt(self, base_prompt: str, *, profile_context: str = "") -> str:
         policy = (
@@ -33,13 +40,13 @@ class MainPersonaAgent:
         return f"{base_prompt}\n\n{policy}"
 
     def should_delegate(self, text: str) -> bool:
-        lowered = (text or "").strip().lower()
-        if len(lowered) >= 240:
+        stripped = (text or "").strip()
+        if len(stripped) >= 240:
             return True
-        for pattern in self.DELEGATE_PATTERNS:
-            if re.search(pattern, lowered):
-                return True
-        return False
+        lowered = stripped.lower()
+        if not any(keyword in lowered for keyword in self._DELEGATE_KEYWORDS):
+            return False
+        return self._DELEGATE_RE.search(stripped) is not None
 
     def compose_final_response(self, answer: str, *, task_report_summary: str = "") -> str:
         answer = (answer or "").strip()
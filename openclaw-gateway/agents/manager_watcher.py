@@ -7,8 +7,9 @@ Supervises long-running worker task execution and run records.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
-import time
+import weakref
 from typing import Any, Callable, Awaitable
 
 import aiosqlite
@@ -17,6 +18,108 @@ from db import store
 
 logger = logging.getLogger("skynet.agents.manager")
 
+HEARTBEAT_INTERVAL_SECONDS = 20.0
+# Cap on progress callbacks (Telegram sends) in flight per watcher.
+_PROGRESS_CONCURRENCY = 16
+
+
+NudgeCallback = Callable[[float], Awaitable[None]]
+
+
+class HeartbeatScheduler:
+    """
+    Drive heartbeats and stall nudges for every live run from one task.
+
+    Runs register while they execute.  A single task per connection wakes
+    once per interval, stamps all registered runs with one UPDATE, then pops
+    any nudge deadlines that have come due off a heap, so N concurrent runs
+    cost one timer, one task and one commit per tick instead of N of each.
+    The task exits when no runs remain.
+    """
+
+    def __init__(
+        self,
+        db: aiosqlite.Connection,
+        *,
+        interval_seconds: float = HEARTBEAT_INTERVAL_SECONDS,
+    ) -> None:
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self._run_ids: set[int] = set()
+        # (deadline, run_id, started, callback) ordered by loop-clock deadline.
+        self._nudges: list[tuple[float, int, float, NudgeCallback]] = []
+        self._task: asyncio.Task | None = None
+
+    def register(
+        self,
+        run_id: int,
+        *,
+        nudge_after_seconds: float | None = None,
+        on_nudge: NudgeCallback | None = None,
+    ) -> None:
+        run_id = int(run_id)
+        self._run_ids.add(run_id)
+        if on_nudge is not None and nudge_after_seconds is not None:
+            started = asyncio.get_running_loop().time()
+            heapq.heappush(
+                self._nudges,
+                (started + nudge_after_seconds, run_id, started, on_nudge),
+            )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._tick_loop(), name="manager-heartbeat-scheduler",
+            )
+
+    def unregister(self, run_id: int) -> None:
+        # Pending nudges for the run are dropped lazily when they come due.
+        self._run_ids.discard(int(run_id))
+
+    async def _tick_loop(self) -> None:
+        # Tick against absolute deadlines so slow flushes don't drift the
+        # schedule; ticks missed while a flush overran are skipped.
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self._run_ids:
+            next_tick += self.interval_seconds
+            now = loop.time()
+            if next_tick < now:
+                behind = now - next_tick
+                next_tick += (behind // self.interval_seconds + 1) * self.interval_seconds
+            await asyncio.sleep(next_tick - now)
+            if not self._run_ids:
+                break
+            try:
+                await store.heartbeat_agent_runs(self.db, tuple(self._run_ids))
+            except Exception:
+                logger.exception("Batched heartbeat flush failed")
+            # Nudges are one-shot; once the heap drains, ticks skip this.
+            if self._nudges:
+                await self._fire_due_nudges(loop.time())
+        self._nudges.clear()
+
+    async def _fire_due_nudges(self, now: float) -> None:
+        while self._nudges and self._nudges[0][0] <= now:
+            _, run_id, started, on_nudge = heapq.heappop(self._nudges)
+            if run_id not in self._run_ids:
+                continue
+            try:
+                await on_nudge(now - started)
+            except Exception:
+                logger.exception("Manager nudge failed (run_id=%s)", run_id)
+
+
+_SCHEDULERS: weakref.WeakKeyDictionary[aiosqlite.Connection, HeartbeatScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def heartbeat_scheduler(db: aiosqlite.Connection) -> HeartbeatScheduler:
+    """Return the process-wide scheduler for *db*, creating it on first use."""
+    scheduler = _SCHEDULERS.get(db)
+    if scheduler is None:
+        scheduler = _SCHEDULERS[db] = HeartbeatScheduler(db)
+    return scheduler
+
 
 class ManagerWatcherAgent:
     """Track agent runs, emit heartbeats, and apply nudge policies."""
@@ -29,6 +132,8 @@ class ManagerWatcherAgent:
     ) -> None:
         self.db = db
         self.on_progress = on_progress
+        self._progress_sem = asyncio.Semaphore(_PROGRESS_CONCURRENCY)
+        self._progress_tasks: set[asyncio.Task] = set()
 
     async def start_run(
         self,
@@ -39,61 +144,77 @@ class ManagerWatcherAgent:
         agent_id: str,
         agent_role: str,
     ) -> int:
-        run_id = await store.create_agent_run(
-            self.db,
-            project_id=project_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            agent_role=agent_role,
-            metadata={"task_title": task_title},
-        )
-        await store.add_event(
-            self.db,
-            project_id,
-            "agent_run_started",
-            f"{agent_role} started task: {task_title}",
-            detail=f"run_id={run_id}",
-        )
+        try:
+            run_id = await store.create_agent_run(
+                self.db,
+                project_id=project_id,
+                task_id=task_id,
+                agent_id=agent_id,
+                agent_role=agent_role,
+                metadata={"task_title": task_title},
+                commit=False,
+            )
+            await store.add_event(
+                self.db,
+                project_id,
+                "agent_run_started",
+                f"{agent_role} started task: {task_title}",
+                detail=f"run_id={run_id}",
+                commit=False,
+            )
+            # Run row and its event land in one transaction (one fsync).
+            await self.db.commit()
+        except BaseException:
+            # Don't leave half the sequence pending on the shared
+            # connection for another coroutine's commit to persist.
+            await self.db.rollback()
+            raise
         return run_id
 
     async def heartbeat(self, *, run_id: int) -> None:
         await store.heartbeat_agent_run(self.db, run_id=run_id)
 
-    async def heartbeat_loop(
+    def watch_run(
         self,
         *,
         project_id: str,
         run_id: int,
         task_title: str,
-        stop_event: asyncio.Event,
-        interval_seconds: float = 20.0,
         nudge_after_seconds: float = 120.0,
     ) -> None:
-        started = time.monotonic()
-        nudged = False
+        """Heartbeat *run_id* and nudge once if it is still running later."""
 
-        while not stop_event.is_set():
+        async def _nudge(elapsed: float) -> None:
+            summary = (
+                f"Manager watcher nudge: task '{task_title}' is still running "
+                f"after {int(elapsed)}s."
+            )
+            await store.add_event(self.db, project_id, "manager_nudge", summary)
+            self._dispatch_progress(project_id, "manager_nudge", summary)
+
+        heartbeat_scheduler(self.db).register(
+            run_id,
+            nudge_after_seconds=nudge_after_seconds,
+            on_nudge=_nudge,
+        )
+
+    def unwatch_run(self, *, run_id: int) -> None:
+        heartbeat_scheduler(self.db).unregister(run_id)
+
+    def _dispatch_progress(self, project_id: str, event_type: str, summary: str) -> None:
+        """Fire ``on_progress`` in the background so slow sends never stall a tick."""
+        if self.on_progress is None:
+            return
+        task = asyncio.create_task(self._safe_on_progress(project_id, event_type, summary))
+        self._progress_tasks.add(task)
+        task.add_done_callback(self._progress_tasks.discard)
+
+    async def _safe_on_progress(self, project_id: str, event_type: str, summary: str) -> None:
+        async with self._progress_sem:
             try:
-                await self.heartbeat(run_id=run_id)
-                elapsed = time.monotonic() - started
-                if not nudged and elapsed >= nudge_after_seconds:
-                    nudged = True
-                    summary = (
-                        f"Manager watcher nudge: task '{task_title}' is still running "
-                        f"after {int(elapsed)}s."
-                    )
-                    await store.add_event(self.db, project_id, "manager_nudge", summary)
-                    if self.on_progress is not None:
-                        try:
-                            await self.on_progress(project_id, "manager_nudge", summary)
-                        except Exception:
-                            logger.exception("Manager nudge callback failed")
-                await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
-            except asyncio.TimeoutError:
-                continue
+                await self.on_progress(project_id, event_type, summary)
             except Exception:
-                logger.exception("Manager heartbeat loop failure (run_id=%s)", run_id)
-                await asyncio.sleep(max(interval_seconds, 2.0))
+                logger.exception("Manager nudge callback failed")
 
     async def finish_run_success(
         self,
@@ -102,19 +223,26 @@ class ManagerWatcherAgent:
         run_id: int,
         summary: str,
     ) -> None:
-        await store.finish_agent_run(
-            self.db,
-            run_id=run_id,
-            status="succeeded",
-            metadata_patch={"summary": summary[:500]},
-        )
-        await store.add_event(
-            self.db,
-            project_id,
-            "agent_run_succeeded",
-            "Manager watcher marked run succeeded.",
-            detail=f"run_id={run_id}",
-        )
+        try:
+            await store.finish_agent_run(
+                self.db,
+                run_id=run_id,
+                status="succeeded",
+                metadata_patch={"summary": summary[:500]},
+                commit=False,
+            )
+            await store.add_event(
+                self.db,
+                project_id,
+                "agent_run_succeeded",
+                "Manager watcher marked run succeeded.",
+                detail=f"run_id={run_id}",
+                commit=False,
+            )
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
 
     async def finish_run_failed(
         self,
@@ -123,16 +251,25 @@ class ManagerWatcherAgent:
         run_id: int,
         error_message: str,
     ) -> None:
-        await store.finish_agent_run(
-            self.db,
-            run_id=run_id,
-            status="failed",
-            error_message=error_message,
-        )
-        await store.add_event(
-            self.db,
-            project_id,
-            "agent_run_failed",
-            "Manager watcher marked run failed.",
-            detail=f"run_id={run_id}; error={error_message[:500]}",
-        )
+        # Tracebacks can be huge; clip once to the stored limit up front.
+        error_message = (error_message or "")[:2000]
+        try:
+            await store.finish_agent_run(
+                self.db,
+                run_id=run_id,
+                status="failed",
+                error_message=error_message,
+                commit=False,
+            )
+            await store.add_event(
+                self.db,
+                project_id,
+                "agent_run_failed",
+                "Manager watcher marked run failed.",
+                detail=f"run_id={run_id}; error={error_message[:500]}",
+                commit=False,
+            )
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
@@ -6,13 +6,38 @@ Dedicated planner role for decomposing idea context into executable plans.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from typing import Any, Callable, Awaitable
 
 from ai.provider_router import ProviderRouter
+from ai.providers.base import ToolCall
 from ai.tool_defs import PLANNING_TOOLS
 
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_balanced_json(text: str) -> dict[str, Any] | None:
+    """
+    Decode the JSON object that starts at the first ``{`` in *text*.
+
+    ``raw_decode`` walks one object left to right (strings and escapes
+    included) and stops at its closing brace, so trailing prose is ignored
+    and nothing backtracks. Later braces are not tried: in a reply cut off
+    mid-plan they belong to nested milestones/tasks, and accepting one would
+    pass a fragment off as the whole plan.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        obj, _end = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return obj
+
 
 class PlannerAgent:
     """Planner/decomposer wrapper around planning conversation flow."""
@@ -61,49 +86,55 @@ class PlannerAgent:
             if not response.tool_calls:
                 return last_response_text, current
 
-            tool_results = []
-            for tc in response.tool_calls:
-                if tc.name == "web_search":
-                    ok, output = await self._run_agent_action(
-                        "web_search",
-                        {
-                            "query": tc.input.get("query", ""),
-                            "num_results": tc.input.get("num_results", 5),
-                        },
-                        True,
-                    )
-                    result = output if ok else f"Web search unavailable: {output}"
-                else:
-                    result = f"Tool '{tc.name}' not available during planning."
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": tc.id,
-                    "name": tc.name,
-                    "content": result,
-                })
-            current.append({"role": "user", "content": tool_results})
+            # Tool calls are independent (mostly network-bound searches),
+            # so run them concurrently; gather preserves their order.
+            tool_results = await asyncio.gather(
+                *(self._dispatch_tool(tc) for tc in response.tool_calls)
+            )
+            current.append({"role": "user", "content": list(tool_results)})
 
         return last_response_text, current
 
+    async def _dispatch_tool(self, tc: ToolCall) -> dict[str, Any]:
+        """Run one planning tool call and build its ``tool_result`` block."""
+        if tc.name == "web_search":
+            try:
+                ok, output = await self._run_agent_action(
+                    "web_search",
+                    {
+                        "query": tc.input.get("query", ""),
+                        "num_results": tc.input.get("num_results", 5),
+                    },
+                    True,
+                )
+            except Exception as exc:
+                ok, output = False, str(exc)
+            result = output if ok else f"Web search unavailable: {output}"
+        else:
+            result = f"Tool '{tc.name}' not available during planning."
+        return {
+            "type": "tool_result",
+            "tool_use_id": tc.id,
+            "name": tc.name,
+            "content": result,
+        }
+
     @staticmethod
     def parse_plan_json(text: str) -> dict[str, Any] | None:
         """Extract plan JSON from model output."""
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-
-        match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-        if match:
+        # Only a reply that opens with "{" can be bare JSON; prose-first
+        # replies go straight to the fenced/embedded extractors.
+        if text.lstrip().startswith("{"):
             try:
-                return json.loads(match.group(1))
+                return json.loads(text)
             except json.JSONDecodeError:
                 pass
 
-        match = re.search(r"\{.*\}", text, re.DOTALL)
+        match = _FENCED_JSON_RE.search(text)
         if match:
             try:
-                return json.loads(match.group())
+                return json.loads(match.group(1))
             except json.JSONDecodeError:
                 pass
-        return None
+
+        return _find_balanced_json(text)
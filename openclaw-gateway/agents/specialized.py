@@ -20,7 +20,7 @@ from ai import context as ctx
 from ai.prompts import get_agent_prompt
 from db import store
 from search.web_search import WebSearcher
-from skills.base import SkillContext
+from skills.base import SkillContext, run_skill_tool
 from skills.registry import SkillRegistry
 from .roles import AGENT_CONFIGS, DEFAULT_ROLE
 
@@ -257,7 +257,7 @@ class SpecializedAgent:
             searcher=self.searcher,
             request_approval=self.request_approval,
         )
-        return await skill.execute(tool_name, tool_input, context)
+        return await run_skill_tool(skill, tool_name, tool_input, context)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -149,11 +149,12 @@ class ProviderRouter:
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
         require_tools: bool = False,
         task_type: str = "general",
         preferred_provider: str | None = None,
         preferred_provider_only: bool = False,
-        allowed_providers: list[str] | None = None,
+        allowed_providers: list[str] | tuple[str, ...] | None = None,
     ) -> ProviderResponse:
         """
         Send a chat request to the best available provider.
@@ -183,6 +184,7 @@ class ProviderRouter:
                 )
                 response = await provider.chat(
                     messages, tools=tools, system=system, max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
                 )
                 # Success — record usage and clear errors.
                 provider.record_usage(response.input_tokens + response.output_tokens)
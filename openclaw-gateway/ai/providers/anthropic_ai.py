@@ -16,9 +16,40 @@ from .base import BaseProvider, ProviderResponse, ToolCall
 logger = logging.getLogger("skynet.ai.anthropic")
 
 
-def _convert_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Anthropic uses the same tool format natively."""
-    return tools
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _convert_tools(
+    tools: list[dict[str, Any]], *, cache: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Anthropic uses the same tool format natively.
+
+    With *cache*, the last tool carries a cache breakpoint so the (large,
+    static) tool list is served from the prompt cache even when the system
+    prompt changes between turns.
+    """
+    if not tools or not cache:
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL_CACHE}]
+
+
+def _convert_system(system: str, cache_prefix: str = "") -> str | list[dict[str, Any]]:
+    """
+    Split *system* into a cached stable block and an uncached per-turn tail.
+
+    Without a matching *cache_prefix* the prompt is sent as plain text, so
+    one-shot calls never pay the cache-write premium.
+    """
+    if not cache_prefix or not system.startswith(cache_prefix):
+        return system
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": cache_prefix, "cache_control": _EPHEMERAL_CACHE},
+    ]
+    tail = system[len(cache_prefix):]
+    if tail.strip():
+        blocks.append({"type": "text", "text": tail})
+    return blocks
 
 
 def _convert_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -51,6 +82,7 @@ class AnthropicProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
         kwargs: dict[str, Any] = {
             "model": self.model_name,
@@ -58,9 +90,9 @@ class AnthropicProvider(BaseProvider):
             "messages": _convert_messages(messages),
         }
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = _convert_system(system, cache_prefix)
         if tools:
-            kwargs["tools"] = _convert_tools(tools)
+            kwargs["tools"] = _convert_tools(tools, cache=bool(cache_prefix))
 
         response = await self._client.messages.create(**kwargs)
 
@@ -87,8 +87,15 @@ class BaseProvider(ABC):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
-        """Send a chat completion request and return a normalised response."""
+        """
+        Send a chat completion request and return a normalised response.
+
+        *cache_prefix* is the stable leading part of *system*.  Adapters with
+        explicit prompt caching mark it (and the tool list) as a cache
+        breakpoint; it is empty for one-shot calls, which skip caching.
+        """
         ...
 
     # ------------------------------------------------------------------
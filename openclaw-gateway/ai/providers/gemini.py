@@ -96,6 +96,7 @@ class GeminiProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
         config = types.GenerateContentConfig(
             max_output_tokens=max_tokens,
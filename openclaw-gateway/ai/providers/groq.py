@@ -97,6 +97,7 @@ class GroqProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
         oai_messages = _convert_messages_to_openai(messages, system)
         kwargs: dict[str, Any] = {
@@ -46,6 +46,7 @@ class OllamaProxyProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
         """Route a chat request through the agent to local Ollama."""
         from gateway import send_action, is_agent_connected
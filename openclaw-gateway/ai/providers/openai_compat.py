@@ -118,6 +118,7 @@ class OpenAICompatProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_prefix: str = "",
     ) -> ProviderResponse:
         oai_messages = _convert_messages(messages, system)
         models_to_try = self._ordered_models_to_try()
@@ -27,6 +27,11 @@ from typing import Any
 import aiosqlite
 from aiohttp import web
 
+try:  # Optional: orjson is several times faster for action payloads.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 import bot_config
 import gateway_config as cfg
 from gateway import (
@@ -35,7 +40,7 @@ from gateway import (
     send_emergency_stop,
     send_resume,
 )
-from ssh_tunnel_executor import get_ssh_executor
+from ssh_tunnel_executor import SSHTunnelExecutor, get_ssh_executor
 
 logger = logging.getLogger("skynet.api")
 
@@ -58,10 +63,42 @@ def _action_key(task_id: str | None, idempotency_key: str | None) -> str | None:
     return f"{tid}:{key}"
 
 
+async def _json_request(request: web.Request) -> Any:
+    """Decode the request body; raises ``json.JSONDecodeError`` when invalid."""
+    raw = await request.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_response(data: Any, *, status: int = 200) -> web.Response:
+    """JSON response; *data* may be a pre-encoded ``bytes`` body."""
+    body = data if isinstance(data, bytes) else _dump_json(data)
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+# Fixed error bodies, encoded once instead of per request.
+_ERR_INVALID_JSON = _dump_json({"error": "Invalid JSON body."})
+_ERR_AGENT_TIMEOUT = _dump_json({"error": "Agent did not respond in time."})
+_ERR_DB_NOT_READY = _dump_json({"error": "Database not initialized."})
+_ERR_BAD_TELEGRAM_ID = _dump_json({"error": "telegram_user_id must be numeric."})
+_ERR_USER_NOT_FOUND = _dump_json({"error": "User not found."})
+
+
 def _idempotency_db(request: web.Request) -> aiosqlite.Connection | None:
     return request.app.get("idempotency_db")
 
 
+def _ssh_executor(request: web.Request) -> SSHTunnelExecutor:
+    return request.app["ssh_exec"]
+
+
 async def _load_cached_result(
     db: aiosqlite.Connection,
     *,
@@ -109,11 +146,11 @@ async def _store_cached_result(
 # ---------------------------------------------------------------------------
 
 async def handle_status(request: web.Request) -> web.Response:
-    ssh_exec = get_ssh_executor()
+    ssh_exec = _ssh_executor(request)
     ssh_ok, ssh_detail = await ssh_exec.health_check()
     ssh_configured = ssh_exec.is_configured()
     force_ssh = _force_ssh_mode(ssh_configured)
-    return web.json_response({
+    return _json_response({
         "agent_connected": is_agent_connected(),
         "ssh_fallback_enabled": ssh_configured,
         "ssh_fallback_healthy": ssh_ok,
@@ -133,15 +170,13 @@ async def handle_action(request: web.Request) -> web.Response:
     }
     """
     try:
-        body = await request.json()
+        body = await _json_request(request)
     except json.JSONDecodeError:
-        return web.json_response(
-            {"error": "Invalid JSON body."}, status=400,
-        )
+        return _json_response(_ERR_INVALID_JSON, status=400)
 
     action = body.get("action")
     if not action or not isinstance(action, str):
-        return web.json_response(
+        return _json_response(
             {"error": "Missing 'action' field."}, status=400,
         )
 
@@ -153,7 +188,7 @@ async def handle_action(request: web.Request) -> web.Response:
     db = _idempotency_db(request)
 
     if idempotency_key and not task_id:
-        return web.json_response(
+        return _json_response(
             {"error": "idempotency_key requires task_id."}, status=400,
         )
 
@@ -166,7 +201,7 @@ async def handle_action(request: web.Request) -> web.Response:
         if cached is not None:
             replay = dict(cached)
             replay["idempotent_replay"] = True
-            return web.json_response(replay)
+            return _json_response(replay)
 
     is_owner = False
     inflight_future: asyncio.Future[dict[str, Any]] | None = None
@@ -185,15 +220,15 @@ async def handle_action(request: web.Request) -> web.Response:
             try:
                 result = await inflight_future
             except asyncio.TimeoutError:
-                return web.json_response({"error": "Agent did not respond in time."}, status=504)
+                return _json_response(_ERR_AGENT_TIMEOUT, status=504)
             except Exception as exc:  # pragma: no cover - defensive fallback
-                return web.json_response({"error": str(exc)}, status=503)
+                return _json_response({"error": str(exc)}, status=503)
             replay = dict(result)
             replay["idempotent_replay"] = True
-            return web.json_response(replay)
+            return _json_response(replay)
 
     try:
-        ssh_exec = get_ssh_executor()
+        ssh_exec = _ssh_executor(request)
         ssh_configured = ssh_exec.is_configured()
         force_ssh = _force_ssh_mode(ssh_configured)
         if force_ssh or not is_agent_connected():
@@ -209,20 +244,20 @@ async def handle_action(request: web.Request) -> web.Response:
                 if is_owner and inflight_future is not None and not inflight_future.done():
                     inflight_future.set_result(result)
                 if result.get("status") == "error":
-                    return web.json_response(result, status=503)
-                return web.json_response(result)
+                    return _json_response(result, status=503)
+                return _json_response(result)
             if force_ssh:
                 if is_owner and inflight_future is not None and not inflight_future.done():
                     inflight_future.set_exception(
                         RuntimeError("SSH mode enabled without configured executor")
                     )
-                return web.json_response(
+                return _json_response(
                     {"error": "SSH tunnel mode is enabled but SSH executor is not configured."},
                     status=503,
                 )
             if is_owner and inflight_future is not None and not inflight_future.done():
                 inflight_future.set_exception(RuntimeError("No connected agent and no SSH fallback"))
-            return web.json_response(
+            return _json_response(
                 {"error": "No agent connected and SSH fallback is not configured."}, status=503,
             )
 
@@ -242,17 +277,15 @@ async def handle_action(request: web.Request) -> web.Response:
             )
         if is_owner and inflight_future is not None and not inflight_future.done():
             inflight_future.set_result(result)
-        return web.json_response(result)
+        return _json_response(result)
     except asyncio.TimeoutError:
         if is_owner and inflight_future is not None and not inflight_future.done():
             inflight_future.set_exception(asyncio.TimeoutError())
-        return web.json_response(
-            {"error": "Agent did not respond in time."}, status=504,
-        )
+        return _json_response(_ERR_AGENT_TIMEOUT, status=504)
     except RuntimeError as exc:
         if is_owner and inflight_future is not None and not inflight_future.done():
             inflight_future.set_exception(exc)
-        return web.json_response(
+        return _json_response(
             {"error": str(exc)}, status=503,
         )
     finally:
@@ -262,75 +295,75 @@ async def handle_action(request: web.Request) -> web.Response:
 
 
 async def handle_emergency_stop(request: web.Request) -> web.Response:
-    if not is_agent_connected() and get_ssh_executor().is_configured():
-        return web.json_response({"status": "not_applicable_in_ssh_mode"})
+    if not is_agent_connected() and _ssh_executor(request).is_configured():
+        return _json_response({"status": "not_applicable_in_ssh_mode"})
     try:
         await send_emergency_stop()
-        return web.json_response({"status": "emergency_stop_sent"})
+        return _json_response({"status": "emergency_stop_sent"})
     except RuntimeError as exc:
-        return web.json_response({"error": str(exc)}, status=503)
+        return _json_response({"error": str(exc)}, status=503)
 
 
 async def handle_resume(request: web.Request) -> web.Response:
-    if not is_agent_connected() and get_ssh_executor().is_configured():
-        return web.json_response({"status": "not_applicable_in_ssh_mode"})
+    if not is_agent_connected() and _ssh_executor(request).is_configured():
+        return _json_response({"status": "not_applicable_in_ssh_mode"})
     try:
         await send_resume()
-        return web.json_response({"status": "resume_sent"})
+        return _json_response({"status": "resume_sent"})
     except RuntimeError as exc:
-        return web.json_response({"error": str(exc)}, status=503)
+        return _json_response({"error": str(exc)}, status=503)
 
 
 async def handle_get_profile(request: web.Request) -> web.Response:
     telegram_user_id = request.match_info.get("telegram_user_id", "").strip()
     if not telegram_user_id.isdigit():
-        return web.json_response({"error": "telegram_user_id must be numeric."}, status=400)
+        return _json_response(_ERR_BAD_TELEGRAM_ID, status=400)
 
     db = request.app.get("idempotency_db")
     if db is None:
-        return web.json_response({"error": "Database not initialized."}, status=503)
+        return _json_response(_ERR_DB_NOT_READY, status=503)
 
     try:
         from db import store
 
         user = await store.get_user_by_telegram_id(db, int(telegram_user_id))
         if not user:
-            return web.json_response({"error": "User not found."}, status=404)
+            return _json_response(_ERR_USER_NOT_FOUND, status=404)
         user_id = int(user["id"])
         facts = await store.list_profile_facts(db, user_id=user_id, active_only=True)
         prefs = await store.get_user_preferences(db, user_id=user_id)
-        return web.json_response({
+        return _json_response({
             "user": user,
             "facts": facts,
             "preferences": prefs,
         })
     except Exception as exc:
-        return web.json_response({"error": str(exc)}, status=500)
+        return _json_response({"error": str(exc)}, status=500)
 
 
 async def handle_forget_profile(request: web.Request) -> web.Response:
     telegram_user_id = request.match_info.get("telegram_user_id", "").strip()
     if not telegram_user_id.isdigit():
-        return web.json_response({"error": "telegram_user_id must be numeric."}, status=400)
+        return _json_response(_ERR_BAD_TELEGRAM_ID, status=400)
     try:
-        payload = await request.json()
+        payload = await _json_request(request)
     except json.JSONDecodeError:
-        return web.json_response({"error": "Invalid JSON body."}, status=400)
+        return _json_response(_ERR_INVALID_JSON, status=400)
 
     key = str(payload.get("key_or_text", "")).strip()
     if not key:
-        return web.json_response({"error": "Missing key_or_text."}, status=400)
+        return _json_response({"error": "Missing key_or_text."}, status=400)
 
     db = request.app.get("idempotency_db")
     if db is None:
-        return web.json_response({"error": "Database not initialized."}, status=503)
+        return _json_response(_ERR_DB_NOT_READY, status=503)
 
     try:
         from db import store
 
         user = await store.get_user_by_telegram_id(db, int(telegram_user_id))
         if not user:
-            return web.json_response({"error": "User not found."}, status=404)
+            return _json_response(_ERR_USER_NOT_FOUND, status=404)
         removed = await store.forget_profile_facts(
             db,
             user_id=int(user["id"]),
@@ -344,34 +377,34 @@ async def handle_forget_profile(request: web.Request) -> web.Response:
             target_key=key,
             detail=f"Removed facts: {removed}",
         )
-        return web.json_response({"ok": True, "removed": removed})
+        return _json_response({"ok": True, "removed": removed})
     except Exception as exc:
-        return web.json_response({"error": str(exc)}, status=500)
+        return _json_response({"error": str(exc)}, status=500)
 
 
 async def handle_set_memory_policy(request: web.Request) -> web.Response:
     telegram_user_id = request.match_info.get("telegram_user_id", "").strip()
     if not telegram_user_id.isdigit():
-        return web.json_response({"error": "telegram_user_id must be numeric."}, status=400)
+        return _json_response(_ERR_BAD_TELEGRAM_ID, status=400)
     try:
-        payload = await request.json()
+        payload = await _json_request(request)
     except json.JSONDecodeError:
-        return web.json_response({"error": "Invalid JSON body."}, status=400)
+        return _json_response(_ERR_INVALID_JSON, status=400)
 
     enabled = payload.get("enabled")
     if not isinstance(enabled, bool):
-        return web.json_response({"error": "enabled must be boolean."}, status=400)
+        return _json_response({"error": "enabled must be boolean."}, status=400)
 
     db = request.app.get("idempotency_db")
     if db is None:
-        return web.json_response({"error": "Database not initialized."}, status=503)
+        return _json_response(_ERR_DB_NOT_READY, status=503)
 
     try:
         from db import store
 
         user = await store.get_user_by_telegram_id(db, int(telegram_user_id))
         if not user:
-            return web.json_response({"error": "User not found."}, status=404)
+            return _json_response(_ERR_USER_NOT_FOUND, status=404)
         user_id = int(user["id"])
         await store.set_user_memory_enabled(db, user_id=user_id, enabled=enabled)
         await store.add_memory_audit_log(
@@ -382,9 +415,9 @@ async def handle_set_memory_policy(request: web.Request) -> web.Response:
             target_key="memory_enabled",
             detail=f"enabled={enabled}",
         )
-        return web.json_response({"ok": True, "enabled": enabled})
+        return _json_response({"ok": True, "enabled": enabled})
     except Exception as exc:
-        return web.json_response({"error": str(exc)}, status=500)
+        return _json_response({"error": str(exc)}, status=500)
 
 
 # ---------------------------------------------------------------------------
@@ -418,6 +451,8 @@ async def _cleanup_app(app: web.Application) -> None:
 def create_app(*, idempotency_db: aiosqlite.Connection | None = None) -> web.Application:
     app = web.Application()
     app["idempotency_db"] = idempotency_db
+    # Resolved once so handlers skip the accessor on every request.
+    app["ssh_exec"] = get_ssh_executor()
     app.on_cleanup.append(_cleanup_app)
     app.router.add_get("/status", handle_status)
     app.router.add_post("/action", handle_action)
@@ -431,8 +466,11 @@ def create_app(*, idempotency_db: aiosqlite.Connection | None = None) -> web.App
 
 async def start_http_api() -> web.AppRunner:
     """Start the HTTP API server and return the runner."""
+    from db.schema import configure_connection
+
     idempotency_db = await aiosqlite.connect(bot_config.DB_PATH)
     idempotency_db.row_factory = aiosqlite.Row
+    await configure_connection(idempotency_db)
     await _ensure_idempotency_schema(idempotency_db)
 
     app = create_app(idempotency_db=idempotency_db)
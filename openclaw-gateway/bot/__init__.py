@@ -6,10 +6,15 @@ from .commands import (
     handle_callback,
     handle_text,
 )
+from .helpers import close_http_session, invalidate_project
+from .memory import flush_user_conversations
 from .state import set_dependencies
 
 __all__ = [
     "build_app",
+    "close_http_session",
+    "flush_user_conversations",
+    "invalidate_project",
     "set_dependencies",
     "on_project_progress",
     "request_worker_approval",
@@ -9,6 +9,7 @@ import html
 import json
 import logging
 import uuid
+from typing import Any
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
@@ -21,35 +22,46 @@ from telegram.ext import (
 )
 
 import bot_config as cfg
+from agents.roles import AGENT_CONFIGS
+from ai.providers.base import ToolCall
+from db import store
+from skills.base import SkillContext, run_skill_tool
 from . import state
 from .helpers import (
+    _HTML,
     _action_result_ok,
     _ask_confirm,
     _ask_remove_project_confirmation,
-    _authorised,
     _build_assistant_content,
     _build_project_context_block,
+    _escape_name,
     _extract_json_object,
     _extract_textual_tool_call,
     _format_result,
     _friendly_ai_error,
-    _gateway_get,
+    _gateway_get_cached,
     _gateway_post,
     _is_smalltalk_or_ack,
     _join_project_path,
     _maybe_notify_model_switch,
     _notify_styled,
     _parse_path,
+    _project_by_name,
     _project_display,
+    _queue_notice,
+    _require_auth,
+    _router_chat,
     _send_action,
     _send_to_user,
+    _settle_ack,
     _spawn_background_task,
-    _trim_chat_history,
     _truncate_for_notice,
+    _typing_indicator,
 )
 from .memory import (
     _append_user_conversation,
     _capture_profile_memory,
+    _chat_history_for,
     _ensure_memory_user,
     _forget_profile_target,
     _format_profile_summary,
@@ -69,6 +81,133 @@ from .nl_intent import (
 logger = logging.getLogger("skynet.telegram")
 
 
+async def _resolve_chat_project() -> tuple[str, str]:
+    """Return ``(project_id, project_path)`` for tool calls made from chat."""
+    project_id = "telegram_chat"
+    project_path = cfg.PROJECT_BASE_DIR or cfg.DEFAULT_WORKING_DIR
+    if state._project_manager and state._last_project_id:
+        try:
+            project = await store.get_project(state._project_manager.db, state._last_project_id)
+            if project:
+                project_id = project["id"]
+                project_path = project.get("local_path") or project_path
+        except Exception:
+            logger.exception("Failed to resolve project context for chat")
+    return project_id, project_path
+
+
+async def _run_chat_tool(tc: ToolCall, context: SkillContext) -> dict[str, Any]:
+    """Execute one chat tool call and build its ``tool_result`` block."""
+    skill = state._skill_registry.get_skill_for_tool(tc.name)
+    if skill is None:
+        result = f"Unknown tool: {tc.name}"
+    else:
+        result = await run_skill_tool(skill, tc.name, tc.input, context)
+    return {
+        "type": "tool_result",
+        "tool_use_id": tc.id,
+        "name": tc.name,
+        "content": result,
+    }
+
+
+async def _run_chat_tools(tool_calls: list[ToolCall], context: SkillContext) -> list[dict[str, Any]]:
+    """
+    Execute one round of tool calls, keeping results in call order.
+
+    Consecutive read-only calls (``parallel_safe``) run concurrently; any
+    other call runs alone, after everything before it has finished.
+    """
+    results: list[dict[str, Any]] = []
+    batch: list[ToolCall] = []
+
+    async def _flush() -> None:
+        if batch:
+            results.extend(await asyncio.gather(*(_run_chat_tool(b, context) for b in batch)))
+            batch.clear()
+
+    for tc in tool_calls:
+        if state._skill_registry.is_parallel_safe(tc.name):
+            batch.append(tc)
+            continue
+        await _flush()
+        results.append(await _run_chat_tool(tc, context))
+    await _flush()
+    return results
+
+
+_SUMMARY_WINDOW_MESSAGES = 8
+_TOOL_ROUNDS_KEPT_VERBATIM = 3
+
+
+def _digest_tool_round(assistant: dict[str, Any], results: dict[str, Any]) -> list[str]:
+    """One line per tool call: ``name(args) -> first line of result``."""
+    inputs: dict[str, Any] = {}
+    if isinstance(assistant.get("content"), list):
+        for block in assistant["content"]:
+            if block.get("type") == "tool_use":
+                inputs[block.get("id")] = block.get("input")
+    lines: list[str] = []
+    for block in results.get("content") or []:
+        args = json.dumps(inputs.get(block.get("tool_use_id")) or {}, sort_keys=True, default=str)
+        result = str(block.get("content") or "").strip().splitlines()
+        lines.append(
+            f"- {block.get('name', 'tool')}({_truncate_for_notice(args, max_chars=120)})"
+            f" -> {_truncate_for_notice(result[0] if result else '(empty)', max_chars=120)}"
+        )
+    return lines
+
+
+def _compact_tool_messages(
+    messages: list[dict[str, Any]],
+    request_index: int,
+    request_text: str,
+    digest: list[str],
+    *,
+    keep_last: int = _TOOL_ROUNDS_KEPT_VERBATIM,
+) -> None:
+    """
+    Fold tool rounds older than *keep_last* into the user's request message.
+
+    Each round is an assistant ``tool_use`` message plus the user message
+    carrying its results; older rounds are replaced by one-line digests
+    (accumulated in *digest*) so later rounds stop re-sending them.
+    """
+    loop_start = request_index + 1
+    excess = len(messages) - loop_start - 2 * keep_last
+    if excess <= 0:
+        return
+    excess -= excess % 2
+    for i in range(loop_start, loop_start + excess, 2):
+        digest.extend(_digest_tool_round(messages[i], messages[i + 1]))
+    del messages[loop_start:loop_start + excess]
+    messages[request_index] = {
+        "role": "user",
+        "content": f"{request_text}\n\n[Earlier tool calls this turn]\n" + "\n".join(digest),
+    }
+
+
+def _tool_round_signature(tool_calls: list[ToolCall]) -> tuple[tuple[str, str], ...]:
+    """Identify a round of tool calls by name and canonical input."""
+    return tuple(
+        (tc.name, json.dumps(tc.input, sort_keys=True, default=str))
+        for tc in tool_calls
+    )
+
+
+def _summary_window(messages: list[dict[str, Any]], request_index: int) -> list[dict[str, Any]]:
+    """
+    Return the user's request plus the tail of the tool loop.
+
+    The tail always starts on an assistant message so a ``tool_result``
+    block is never separated from the ``tool_use`` that produced it.
+    """
+    start = max(request_index + 1, len(messages) - _SUMMARY_WINDOW_MESSAGES)
+    while start < len(messages) and messages[start].get("role") != "assistant":
+        start += 1
+    return [messages[request_index], *messages[start:]]
+
+
 async def _reply_with_openclaw_capabilities(update: Update, text: str) -> None:
     """Route natural conversation through OpenClaw tools + skills."""
     if not state._provider_router:
@@ -78,66 +217,77 @@ async def _reply_with_openclaw_capabilities(update: Update, text: str) -> None:
         await _reply_naturally_fallback(update, text)
         return
 
-    history = await _load_recent_conversation_messages(update)
+    # Independent lookups; each helper handles its own errors.
+    history, (project_id, project_path), project_context, profile_context = (
+        await asyncio.gather(
+            _load_recent_conversation_messages(update),
+            _resolve_chat_project(),
+            _build_project_context_block(),
+            _profile_prompt_context(update),
+        )
+    )
     messages = [*history, {"role": "user", "content": text}]
+    request_index = len(history)
     tools = state._skill_registry.get_all_tools()
 
-    project_id = "telegram_chat"
-    project_path = cfg.PROJECT_BASE_DIR or cfg.DEFAULT_WORKING_DIR
-    if state._project_manager and state._last_project_id:
-        try:
-            from db import store
-            project = await store.get_project(state._project_manager.db, state._last_project_id)
-            if project:
-                project_id = project["id"]
-                project_path = project.get("local_path") or project_path
-        except Exception:
-            logger.exception("Failed to resolve project context for chat")
-
-    project_context = await _build_project_context_block()
+    # Stable text first, per-turn text last: provider prompt caches match
+    # on exact prefixes, so only ``stable_prompt`` is marked cacheable and
+    # anything that changes between turns goes below it.
     base_system_prompt = (
         f"{state._CHAT_SYSTEM_PROMPT}\n\n"
         f"Working directory: {project_path}\n"
         "If you perform filesystem/git/build actions, prefer this context unless the user specifies another path."
-        f"{project_context}"
     )
+    stable_prompt = state._main_persona_agent.compose_system_prompt(
+        base_system_prompt,
+        profile_context=profile_context,
+    )
+    prompt_parts = [stable_prompt, project_context]
     if state._main_persona_agent.should_delegate(text):
-        base_system_prompt += (
+        prompt_parts.append(
             "\n\nThis looks like long-running work. "
             "Prefer delegated execution through tools and avoid claiming completion "
             "until tool results confirm it."
         )
-
-    profile_context = await _profile_prompt_context(update)
-    system_prompt = state._main_persona_agent.compose_system_prompt(
-        base_system_prompt,
-        profile_context=profile_context,
-    )
     try:
         prompt_context = state._skill_registry.get_prompt_skill_context(text, role="chat")
         if prompt_context:
-            system_prompt += (
+            prompt_parts.append(
                 "\n\n[External Skill Guidance]\n"
                 "Use the following skill guidance if it helps solve the request:\n\n"
                 f"{prompt_context}"
             )
     except Exception:
         logger.exception("Failed to inject external skill guidance into Telegram chat")
-
+    system_prompt = "".join(prompt_parts)
+
+    skill_context = SkillContext(
+        project_id=project_id,
+        project_path=project_path,
+        gateway_api_url=cfg.GATEWAY_API_URL,
+        searcher=state._searcher,
+        request_approval=request_worker_approval,
+    )
     rounds = 0
+    input_tokens = 0
+    output_tokens = 0
+    last_signature: tuple[tuple[str, str], ...] = ()
+    tool_digest: list[str] = []
     final_text = ""
     try:
-        while rounds < 12:
-            response = await state._provider_router.chat(
+        while rounds < cfg.CHAT_MAX_TOOL_ROUNDS:
+            response = await _router_chat(
                 messages,
                 tools=tools,
                 system=system_prompt,
                 max_tokens=1500,
+                cache_prefix=stable_prompt,
                 task_type="general",
                 allowed_providers=state._CHAT_PROVIDER_ALLOWLIST,
             )
             await _maybe_notify_model_switch(update, response)
-            messages.append({"role": "assistant", "content": _build_assistant_content(response)})
+            input_tokens += getattr(response, "input_tokens", 0) or 0
+            output_tokens += getattr(response, "output_tokens", 0) or 0
 
             tool_calls = list(response.tool_calls or [])
             if not tool_calls:
@@ -146,41 +296,35 @@ async def _reply_with_openclaw_capabilities(update: Update, text: str) -> None:
                     tool_calls = [recovered]
 
             if not tool_calls:
+                messages.append({"role": "assistant", "content": _build_assistant_content(response)})
                 final_text = (response.text or "").strip()
                 break
 
-            from skills.base import SkillContext
+            signature = _tool_round_signature(tool_calls)
+            if signature == last_signature:
+                logger.warning("Chat tool loop repeated %s; stopping early", [tc.name for tc in tool_calls])
+                break
+            last_signature = signature
+            messages.append({"role": "assistant", "content": _build_assistant_content(response)})
 
-            context = SkillContext(
-                project_id=project_id,
-                project_path=project_path,
-                gateway_api_url=cfg.GATEWAY_API_URL,
-                searcher=state._searcher,
-                request_approval=request_worker_approval,
-            )
-            tool_results = []
-            for tc in tool_calls:
-                skill = state._skill_registry.get_skill_for_tool(tc.name)
-                if skill is None:
-                    result = f"Unknown tool: {tc.name}"
-                else:
-                    result = await skill.execute(tc.name, tc.input, context)
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": tc.id,
-                    "name": tc.name,
-                    "content": result,
-                })
+            tool_results = await _run_chat_tools(tool_calls, skill_context)
             messages.append({"role": "user", "content": tool_results})
             rounds += 1
+            _compact_tool_messages(messages, request_index, text, tool_digest)
+            if input_tokens >= cfg.CHAT_MAX_INPUT_TOKENS or output_tokens >= cfg.CHAT_MAX_OUTPUT_TOKENS:
+                logger.info(
+                    "Chat tool loop hit token budget after %d rounds (in=%d out=%d)",
+                    rounds, input_tokens, output_tokens,
+                )
+                break
     except Exception as exc:
         await update.message.reply_text(_friendly_ai_error(exc))
         return
 
     if not final_text:
         try:
-            summary = await state._provider_router.chat(
-                messages + [{
+            summary = await _router_chat(
+                _summary_window(messages, request_index) + [{
                     "role": "user",
                     "content": "Summarize the result and next step in plain language.",
                 }],
@@ -202,9 +346,9 @@ async def _reply_with_openclaw_capabilities(update: Update, text: str) -> None:
         reply = reply[:3800] + "\n\n... (truncated)"
 
     # Keep chat history in a compact text form.
-    state._chat_history.append({"role": "user", "content": text})
-    state._chat_history.append({"role": "assistant", "content": reply})
-    _trim_chat_history()
+    history = _chat_history_for(update)
+    history.append({"role": "user", "content": text})
+    history.append({"role": "assistant", "content": reply})
 
     await update.message.reply_text(reply)
     await _append_user_conversation(
@@ -221,10 +365,19 @@ async def _reply_naturally_fallback(update: Update, text: str) -> None:
         await update.message.reply_text("AI providers are not configured.")
         return
 
-    history = await _load_recent_conversation_messages(update)
-    base_system_prompt = state._CHAT_SYSTEM_PROMPT
+    history, profile_context = await asyncio.gather(
+        _load_recent_conversation_messages(update),
+        _profile_prompt_context(update),
+    )
+    # Same ordering as the tool path: stable prompt first, per-turn text last.
+    prompt_parts = [
+        state._main_persona_agent.compose_system_prompt(
+            state._CHAT_SYSTEM_PROMPT,
+            profile_context=profile_context,
+        ),
+    ]
     if state._main_persona_agent.should_delegate(text):
-        base_system_prompt += (
+        prompt_parts.append(
             "\n\nThis looks like long-running work. "
             "Do not pretend it is completed in chat; provide a concise delegated plan."
         )
@@ -232,22 +385,18 @@ async def _reply_naturally_fallback(update: Update, text: str) -> None:
         try:
             prompt_context = state._skill_registry.get_prompt_skill_context(text, role="chat")
             if prompt_context:
-                base_system_prompt += (
+                prompt_parts.append(
                     "\n\n[External Skill Guidance]\n"
                     "Use the following skill guidance if relevant:\n\n"
                     f"{prompt_context}"
                 )
         except Exception:
             logger.exception("Failed to inject external skill guidance into fallback chat")
-    profile_context = await _profile_prompt_context(update)
-    system_prompt = state._main_persona_agent.compose_system_prompt(
-        base_system_prompt,
-        profile_context=profile_context,
-    )
+    system_prompt = "".join(prompt_parts)
 
     messages = [*history, {"role": "user", "content": text}]
     try:
-        response = await state._provider_router.chat(
+        response = await _router_chat(
             messages,
             system=system_prompt,
             max_tokens=700,
@@ -261,9 +410,9 @@ async def _reply_naturally_fallback(update: Update, text: str) -> None:
 
     reply = (response.text or "").strip() or "I could not generate a reply right now."
     reply = state._main_persona_agent.compose_final_response(reply)
-    state._chat_history.append({"role": "user", "content": text})
-    state._chat_history.append({"role": "assistant", "content": reply})
-    _trim_chat_history()
+    history = _chat_history_for(update)
+    history.append({"role": "user", "content": text})
+    history.append({"role": "assistant", "content": reply})
     await update.message.reply_text(reply)
     await _append_user_conversation(
         update,
@@ -274,29 +423,35 @@ async def _reply_naturally_fallback(update: Update, text: str) -> None:
 
 
 
+# Notification level for each orchestrator progress event type.
+_PROGRESS_LEVELS = {
+    "started": "progress",
+    "task_started": "progress",
+    "task_completed": "success",
+    "milestone_started": "progress",
+    "milestone_review": "info",
+    "testing": "info",
+    "completed": "success",
+    "error": "error",
+    "paused": "warning",
+    "resumed": "progress",
+    "cancelled": "warning",
+}
+
+
 async def on_project_progress(project_id: str, event_type: str, summary: str) -> None:
     """Called by the orchestrator to send progress updates to Telegram."""
-    level_map = {
-        "started": "progress",
-        "task_started": "progress",
-        "task_completed": "success",
-        "milestone_started": "progress",
-        "milestone_review": "info",
-        "testing": "info",
-        "completed": "success",
-        "error": "error",
-        "paused": "warning",
-        "resumed": "progress",
-        "cancelled": "warning",
-    }
     title = f"Project Event: {event_type}"
-    await _notify_styled(level_map.get(event_type, "info"), title, summary, project=project_id)
+    _queue_notice(_PROGRESS_LEVELS.get(event_type, "info"), title, summary, project=project_id)
 
 
 # ------------------------------------------------------------------
 # Approval request (called by the orchestrator worker for git_push etc.)
 # ------------------------------------------------------------------
 
+_AUTO_APPROVABLE_GIT_ACTIONS = frozenset({"git_push", "gh_create_repo"})
+
+
 async def request_worker_approval(
     project_id: str, action: str, params: dict,
 ) -> bool:
@@ -307,14 +462,13 @@ async def request_worker_approval(
     Sends an Approve/Deny message to Telegram and blocks until the
     user responds.
     """
-    if cfg.AUTO_APPROVE_GIT_ACTIONS and action in {"git_push", "gh_create_repo"}:
+    if cfg.AUTO_APPROVE_GIT_ACTIONS and action in _AUTO_APPROVABLE_GIT_ACTIONS:
         await _send_to_user(
             f"[AUTO-APPROVED] {html.escape(action)} for project {html.escape(project_id)}",
         )
         return True
 
-    state._approval_counter += 1
-    key = f"wa{state._approval_counter}"
+    key = f"wa{next(state._approval_ids):x}"
 
     future: asyncio.Future = asyncio.get_event_loop().create_future()
     state._pending_approvals[key] = future
@@ -331,7 +485,7 @@ async def request_worker_approval(
             f"{param_summary}\n\n"
             f"Approve this action?"
         ),
-        parse_mode="HTML",
+        parse_mode=_HTML,
         reply_markup=keyboard,
     )
 
@@ -348,109 +502,130 @@ async def request_worker_approval(
 # ------------------------------------------------------------------
 
 
-async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    query = update.callback_query
-    user = update.effective_user
-    if not user or user.id != cfg.ALLOWED_USER_ID:
-        await query.answer("Unauthorized.")
+# --- v1 CONFIRM action approval ---
+
+async def _cb_approve(query, key: str) -> None:
+    pending = state._pending_confirms.pop(key, None)
+    if not pending:
+        await query.edit_message_text("Action expired or already handled.")
         return
-    await query.answer()
-    data = query.data or ""
-
-    # --- v1 CONFIRM action approval ---
-    if data.startswith("approve:"):
-        key = data[8:]
-        pending = state._pending_confirms.pop(key, None)
-        if not pending:
-            await query.edit_message_text("Action expired or already handled.")
-            return
-        await query.edit_message_text(
-            f"<b>APPROVED</b> -- executing {html.escape(pending['action'])} ...",
-            parse_mode="HTML",
-        )
-        try:
-            result = await _send_action(pending["action"], pending["params"], confirmed=True)
-            await query.message.reply_text(_format_result(result), parse_mode="HTML")
-        except Exception as exc:
-            await query.message.reply_text(f"Error: {exc}")
+    await query.edit_message_text(
+        f"<b>APPROVED</b> -- executing {html.escape(pending['action'])} ...",
+        parse_mode=_HTML,
+    )
+    try:
+        result = await _send_action(pending["action"], pending["params"], confirmed=True)
+        await query.message.reply_text(_format_result(result), parse_mode=_HTML)
+    except Exception as exc:
+        await query.message.reply_text(f"Error: {exc}")
+
+
+async def _cb_deny(query, key: str) -> None:
+    pending = state._pending_confirms.pop(key, None)
+    action_name = pending["action"] if pending else "unknown"
+    await query.edit_message_text(
+        f"<b>DENIED</b> -- {html.escape(action_name)} was not executed.",
+        parse_mode=_HTML,
+    )
+
+
+# --- Worker approval (git_push, gh_create_repo) ---
+
+async def _cb_worker_approve(query, key: str) -> None:
+    future = state._pending_approvals.pop(key, None)
+    if future and not future.done():
+        future.set_result(True)
+    await query.edit_message_text("<b>APPROVED</b>", parse_mode=_HTML)
+
+
+async def _cb_worker_deny(query, key: str) -> None:
+    future = state._pending_approvals.pop(key, None)
+    if future and not future.done():
+        future.set_result(False)
+    await query.edit_message_text("<b>DENIED</b>", parse_mode=_HTML)
+
 
-    elif data.startswith("deny:"):
-        key = data[5:]
-        pending = state._pending_confirms.pop(key, None)
-        action_name = pending["action"] if pending else "unknown"
+# --- Plan approval ---
+
+async def _cb_approve_plan(query, project_id: str) -> None:
+    try:
+        await state._project_manager.approve_plan(project_id)
+        await state._project_manager.start_execution(project_id)
         await query.edit_message_text(
-            f"<b>DENIED</b> -- {html.escape(action_name)} was not executed.",
-            parse_mode="HTML",
+            "<b>Plan APPROVED</b> -- coding started!", parse_mode=_HTML,
         )
+    except Exception as exc:
+        await query.edit_message_text(f"Error: {exc}")
 
-    # --- Worker approval (git_push, gh_create_repo) ---
-    elif data.startswith("wapprove:"):
-        key = data[9:]
-        future = state._pending_approvals.pop(key, None)
-        if future and not future.done():
-            future.set_result(True)
-        await query.edit_message_text("<b>APPROVED</b>", parse_mode="HTML")
-
-    elif data.startswith("wdeny:"):
-        key = data[6:]
-        future = state._pending_approvals.pop(key, None)
-        if future and not future.done():
-            future.set_result(False)
-        await query.edit_message_text("<b>DENIED</b>", parse_mode="HTML")
-
-    # --- Plan approval ---
-    elif data.startswith("approve_plan:"):
-        project_id = data[13:]
-        try:
-            await state._project_manager.approve_plan(project_id)
-            await state._project_manager.start_execution(project_id)
-            await query.edit_message_text(
-                "<b>Plan APPROVED</b> -- coding started!", parse_mode="HTML",
-            )
-        except Exception as exc:
-            await query.edit_message_text(f"Error: {exc}")
 
-    elif data.startswith("cancel_plan:"):
-        project_id = data[12:]
-        try:
-            await state._project_manager.cancel_project(project_id)
-            await query.edit_message_text("<b>Plan CANCELLED</b>", parse_mode="HTML")
-        except Exception as exc:
-            await query.edit_message_text(f"Error: {exc}")
+async def _cb_cancel_plan(query, project_id: str) -> None:
+    try:
+        await state._project_manager.cancel_project(project_id)
+        await query.edit_message_text("<b>Plan CANCELLED</b>", parse_mode=_HTML)
+    except Exception as exc:
+        await query.edit_message_text(f"Error: {exc}")
 
-    elif data.startswith("confirm_remove_project:"):
-        key = data[len("confirm_remove_project:"):]
-        pending = state._pending_project_removals.pop(key, None)
-        if not pending:
-            await query.edit_message_text("Removal request expired or already handled.")
-            return
 
-        project_id = pending.get("project_id", "")
-        display_name = pending.get("display_name", "project")
-        try:
-            removed = await state._project_manager.remove_project(project_id)
-            if state._last_project_id == project_id:
-                state._last_project_id = None
-            local_path = str(removed.get("local_path") or pending.get("local_path") or "").strip()
-            note = (
-                f"\nWorkspace files kept at: <code>{html.escape(local_path)}</code>"
-                if local_path else ""
-            )
-            await query.edit_message_text(
-                f"<b>Removed</b> project <b>{html.escape(display_name)}</b>.{note}",
-                parse_mode="HTML",
-            )
-        except Exception as exc:
-            await query.edit_message_text(f"Error removing project: {exc}")
+# --- Project removal ---
+
+async def _cb_confirm_remove_project(query, key: str) -> None:
+    pending = state._pending_project_removals.pop(key, None)
+    if not pending:
+        await query.edit_message_text("Removal request expired or already handled.")
+        return
 
-    elif data.startswith("cancel_remove_project:"):
-        key = data[len("cancel_remove_project:"):]
-        pending = state._pending_project_removals.pop(key, None)
-        display_name = html.escape(pending.get("display_name", "project")) if pending else "project"
+    project_id = pending.get("project_id", "")
+    display_name = pending.get("display_name", "project")
+    try:
+        removed = await state._project_manager.remove_project(project_id)
+        if state._last_project_id == project_id:
+            state._last_project_id = None
+        local_path = str(removed.get("local_path") or pending.get("local_path") or "").strip()
+        note = (
+            f"\nWorkspace files kept at: <code>{html.escape(local_path)}</code>"
+            if local_path else ""
+        )
         await query.edit_message_text(
-            f"Deletion cancelled for <b>{display_name}</b>.",
-            parse_mode="HTML",
+            f"<b>Removed</b> project <b>{_escape_name(display_name)}</b>.{note}",
+            parse_mode=_HTML,
         )
+    except Exception as exc:
+        await query.edit_message_text(f"Error removing project: {exc}")
+
+
+async def _cb_cancel_remove_project(query, key: str) -> None:
+    pending = state._pending_project_removals.pop(key, None)
+    display_name = html.escape(pending.get("display_name", "project")) if pending else "project"
+    await query.edit_message_text(
+        f"Deletion cancelled for <b>{display_name}</b>.",
+        parse_mode=_HTML,
+    )
+
+
+# callback_data is "<action>:<argument>"; none of the actions contain ":".
+_CALLBACK_HANDLERS = {
+    "approve": _cb_approve,
+    "deny": _cb_deny,
+    "wapprove": _cb_worker_approve,
+    "wdeny": _cb_worker_deny,
+    "approve_plan": _cb_approve_plan,
+    "cancel_plan": _cb_cancel_plan,
+    "confirm_remove_project": _cb_confirm_remove_project,
+    "cancel_remove_project": _cb_cancel_remove_project,
+}
+
+
+async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    query = update.callback_query
+    user = update.effective_user
+    if not user or user.id != cfg.ALLOWED_USER_ID:
+        await query.answer("Unauthorized.")
+        return
+    await query.answer()
+    action, sep, argument = (query.data or "").partition(":")
+    handler = _CALLBACK_HANDLERS.get(action) if sep else None
+    if handler is not None:
+        await handler(query, argument)
 
 
 # ------------------------------------------------------------------
@@ -458,9 +633,8 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 # ------------------------------------------------------------------
 
 
+@_require_auth
 async def cmd_newproject(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /newproject <name>\nExample: /newproject habit-tracker")
         return
@@ -468,23 +642,20 @@ async def cmd_newproject(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     await _create_project_from_name(update, name)
 
 
+@_require_auth
 async def cmd_idea(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /idea <text>")
         return
     await _capture_idea(update, " ".join(context.args).strip())
 
 
+@_require_auth
 async def cmd_plan(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
 
     # Find the project to plan.
     if context.args:
-        from db import store
-        project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+        project = await _project_by_name(context.args[0])
     else:
         project = await state._project_manager.get_ideation_project()
 
@@ -495,10 +666,10 @@ async def cmd_plan(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     project_name = _project_display(project)
     await update.message.reply_text(
         (
-            f"Plan generation queued for <b>{html.escape(project_name)}</b>.\n"
+            f"Plan generation queued for <b>{_escape_name(project_name)}</b>.\n"
             "I will post styled progress updates in chat."
         ),
-        parse_mode="HTML",
+        parse_mode=_HTML,
     )
 
     async def _bg_cmd_plan() -> None:
@@ -546,8 +717,8 @@ async def cmd_plan(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             if state._bot_app and state._bot_app.bot:
                 await state._bot_app.bot.send_message(
                     chat_id=cfg.ALLOWED_USER_ID,
-                    text=f"<b>Plan approval needed</b> for <b>{html.escape(project_name)}</b>.",
-                    parse_mode="HTML",
+                    text=f"<b>Plan approval needed</b> for <b>{_escape_name(project_name)}</b>.",
+                    parse_mode=_HTML,
                     reply_markup=keyboard,
                 )
         except Exception as exc:
@@ -559,47 +730,47 @@ async def cmd_plan(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     )
 
 
+# Telegram icons for project status in /projects.
+_PROJECT_STATUS_ICONS = {
+    "ideation": "ðŸ’¡", "planning": "ðŸ“", "approved": "âœ…",
+    "coding": "âš™ï¸", "testing": "ðŸ§ª", "completed": "ðŸŽ‰",
+    "paused": "â¸ï¸", "failed": "âŒ", "cancelled": "ðŸ›‘",
+}
+_DEFAULT_PROJECT_ICON = "ðŸ“‹"
+
+
+@_require_auth
 async def cmd_projects(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         projects = await state._project_manager.list_projects()
         if not projects:
             await update.message.reply_text("No projects yet. Use /newproject to start one.")
             return
 
-        status_icons = {
-            "ideation": "ðŸ’¡", "planning": "ðŸ“", "approved": "âœ…",
-            "coding": "âš™ï¸", "testing": "ðŸ§ª", "completed": "ðŸŽ‰",
-            "paused": "â¸ï¸", "failed": "âŒ", "cancelled": "ðŸ›‘",
-        }
-        lines = ["<b>Projects:</b>\n"]
-        for p in projects:
-            icon = status_icons.get(p["status"], "ðŸ“‹")
-            lines.append(
-                f"{icon} <b>{html.escape(p['display_name'])}</b> â€” {p['status']}"
-            )
-        await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+        lines = ["<b>Projects:</b>\n"] + [
+            f"{_PROJECT_STATUS_ICONS.get(p['status'], _DEFAULT_PROJECT_ICON)} "
+            f"<b>{_escape_name(p['display_name'])}</b> â€” {p['status']}"
+            for p in projects
+        ]
+        await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_project_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /status <project-name>")
         return
 
-    from db import store
-    project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+    project = await _project_by_name(context.args[0])
     if not project:
         # Fall back to agent status if not a project name.
         try:
-            result = await _gateway_get("/status")
+            result = await _gateway_get_cached("/status")
             connected = result.get("agent_connected", False)
             icon = "CONNECTED" if connected else "NOT CONNECTED"
-            await update.message.reply_text(f"Agent: <b>{icon}</b>", parse_mode="HTML")
+            await update.message.reply_text(f"Agent: <b>{icon}</b>", parse_mode=_HTML)
         except Exception as exc:
             await update.message.reply_text(f"Gateway unreachable: {exc}")
         return
@@ -608,7 +779,7 @@ async def cmd_project_status(update: Update, context: ContextTypes.DEFAULT_TYPE)
         status = await state._project_manager.get_status(project["id"])
         p = status["project"]
         lines = [
-            f"<b>{html.escape(p['display_name'])}</b>",
+            f"<b>{_escape_name(p['display_name'])}</b>",
             f"Status: {p['status']}",
             f"Progress: {status['progress']} ({status['percent']}%)",
         ]
@@ -618,70 +789,62 @@ async def cmd_project_status(update: Update, context: ContextTypes.DEFAULT_TYPE)
             lines.append(f"GitHub: {html.escape(p['github_repo'])}")
         if status["recent_events"]:
             lines.append("\n<b>Recent:</b>")
-            for e in status["recent_events"][:5]:
-                lines.append(f"  {html.escape(e['summary'])}")
-        await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+            lines.extend(f"  {html.escape(e['summary'])}" for e in status["recent_events"][:5])
+        await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_pause(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /pause <project-name>")
         return
-    from db import store
-    project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+    project = await _project_by_name(context.args[0])
     if not project:
         await update.message.reply_text("Project not found.")
         return
     try:
         await state._project_manager.pause_project(project["id"])
-        await update.message.reply_text(f"Paused: <b>{html.escape(project['display_name'])}</b>", parse_mode="HTML")
+        await update.message.reply_text(f"Paused: <b>{_escape_name(project['display_name'])}</b>", parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_resume_project(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /resume_project <project-name>")
         return
-    from db import store
-    project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+    project = await _project_by_name(context.args[0])
     if not project:
         await update.message.reply_text("Project not found.")
         return
     try:
         await state._project_manager.resume_project(project["id"])
-        await update.message.reply_text(f"Resumed: <b>{html.escape(project['display_name'])}</b>", parse_mode="HTML")
+        await update.message.reply_text(f"Resumed: <b>{_escape_name(project['display_name'])}</b>", parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /cancel <project-name>")
         return
-    from db import store
-    project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+    project = await _project_by_name(context.args[0])
     if not project:
         await update.message.reply_text("Project not found.")
         return
     try:
         await state._project_manager.cancel_project(project["id"])
-        await update.message.reply_text(f"Cancelled: <b>{html.escape(project['display_name'])}</b>", parse_mode="HTML")
+        await update.message.reply_text(f"Cancelled: <b>{_escape_name(project['display_name'])}</b>", parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_remove_project(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     project_ref = " ".join(context.args).strip() if context.args else ""
     project, error = await _resolve_project(project_ref or None)
     if error:
@@ -695,23 +858,20 @@ async def cmd_remove_project(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 
 
+@_require_auth
 async def cmd_quota(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not state._provider_router:
         await update.message.reply_text("AI providers not configured.")
         return
     try:
         summary = await state._provider_router.get_quota_summary()
-        lines = ["<b>AI Provider Quota:</b>\n"]
-        for p in summary:
-            status = "âœ…" if p["available"] else "âŒ"
-            limit = p["daily_limit"] or "âˆž"
-            lines.append(
-                f"{status} <b>{html.escape(p['provider'])}</b> ({p['model']})\n"
-                f"    {p['daily_used']}/{limit} requests today"
-            )
-        await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+        escape = html.escape
+        lines = ["<b>AI Provider Quota:</b>\n"] + [
+            f"{'âœ…' if p['available'] else 'âŒ'} <b>{escape(p['provider'])}</b> ({p['model']})\n"
+            f"    {p['daily_used']}/{p['daily_limit'] or 'âˆž'} requests today"
+            for p in summary
+        ]
+        await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
@@ -721,19 +881,17 @@ async def cmd_quota(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 # ------------------------------------------------------------------
 
 
+@_require_auth
 async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         summary = await _format_profile_summary(update)
-        await update.message.reply_text(summary, parse_mode="HTML")
+        await update.message.reply_text(summary, parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_forget(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /forget <fact key or text>")
         return
@@ -744,9 +902,8 @@ async def cmd_forget(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_no_store(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         await update.message.reply_text(
             await _set_memory_enabled_for_user(
@@ -759,9 +916,8 @@ async def cmd_no_store(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_store_on(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         await update.message.reply_text(
             await _set_memory_enabled_for_user(
@@ -774,56 +930,56 @@ async def cmd_store_on(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await update.message.reply_text(f"Error: {exc}")
 
 
+_HELP_HTML = (
+    "<b>SKYNET // CHATHAN - AI Project Factory</b>\n\n"
+    "<b>Project Management:</b>\n"
+    "  /newproject &lt;name&gt; - start a new project\n"
+    "  (send text) - natural chat with SKYNET\n"
+    "  /idea &lt;text&gt; - add idea to current project\n"
+    "  /plan [name] - generate project plan\n"
+    "  /projects - list all projects\n"
+    "  /status &lt;name&gt; - project status\n"
+    "  /pause &lt;name&gt; - pause project\n"
+    "  /resume_project &lt;name&gt; - resume project\n"
+    "  /cancel &lt;name&gt; - cancel project\n"
+    "  /removeproject &lt;name&gt; - permanently remove project record (with Yes/No confirmation)\n"
+    "  /quota - AI provider status\n\n"
+    "<b>Persona Memory:</b>\n"
+    "  /profile - show stored profile and preferences\n"
+    "  /forget &lt;fact-or-text&gt; - forget matching stored facts\n"
+    "  /no_store - stop storing new memory\n"
+    "  /store_on - re-enable memory storage\n\n"
+    "<b>SKYNET System:</b>\n"
+    "  /agents [project] - list agents\n"
+    "  /heartbeat - heartbeat task status\n"
+    "  /sentinel - run health checks\n"
+    "  /skills - list available skills\n\n"
+    "<b>Agent Commands:</b>\n"
+    "  /agent_status - agent connection check\n"
+    "  /git_status [path]\n"
+    "  /run_tests [path]\n"
+    "  /lint [path]\n"
+    "  /build [path]\n"
+    "  /vscode &lt;path&gt; - open folder/file in VS Code on laptop\n"
+    "  /check_agents - check codex/claude/cline CLI availability\n"
+    "  /run_agent &lt;agent&gt; [path=&lt;dir&gt;] &lt;prompt&gt; - run coding agent\n"
+    "  /cline_provider &lt;provider&gt; [model] - switch Cline provider/model\n"
+    "  /close_app [name]\n\n"
+    "<b>Controls:</b>\n"
+    "  /emergency_stop - kill everything\n"
+    "  /resume - resume agent\n"
+)
+
+
+@_require_auth
 async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
-    await update.message.reply_text(
-        "<b>SKYNET // CHATHAN - AI Project Factory</b>\n\n"
-        "<b>Project Management:</b>\n"
-        "  /newproject &lt;name&gt; - start a new project\n"
-        "  (send text) - natural chat with SKYNET\n"
-        "  /idea &lt;text&gt; - add idea to current project\n"
-        "  /plan [name] - generate project plan\n"
-        "  /projects - list all projects\n"
-        "  /status &lt;name&gt; - project status\n"
-        "  /pause &lt;name&gt; - pause project\n"
-        "  /resume_project &lt;name&gt; - resume project\n"
-        "  /cancel &lt;name&gt; - cancel project\n"
-        "  /removeproject &lt;name&gt; - permanently remove project record (with Yes/No confirmation)\n"
-        "  /quota - AI provider status\n\n"
-        "<b>Persona Memory:</b>\n"
-        "  /profile - show stored profile and preferences\n"
-        "  /forget &lt;fact-or-text&gt; - forget matching stored facts\n"
-        "  /no_store - stop storing new memory\n"
-        "  /store_on - re-enable memory storage\n\n"
-        "<b>SKYNET System:</b>\n"
-        "  /agents [project] - list agents\n"
-        "  /heartbeat - heartbeat task status\n"
-        "  /sentinel - run health checks\n"
-        "  /skills - list available skills\n\n"
-        "<b>Agent Commands:</b>\n"
-        "  /agent_status - agent connection check\n"
-        "  /git_status [path]\n"
-        "  /run_tests [path]\n"
-        "  /lint [path]\n"
-        "  /build [path]\n"
-        "  /vscode <path> - open folder/file in VS Code on laptop\n"
-        "  /check_agents - check codex/claude/cline CLI availability\n"
-        "  /run_agent <agent> [path=<dir>] <prompt> - run coding agent\n"
-        "  /cline_provider <provider> [model] - switch Cline provider/model\n"
-        "  /close_app [name]\n\n"
-        "<b>Controls:</b>\n"
-        "  /emergency_stop - kill everything\n"
-        "  /resume - resume agent\n",
-        parse_mode="HTML",
-    )
+    await update.message.reply_text(_HELP_HTML, parse_mode=_HTML)
 
 
+@_require_auth
 async def cmd_agent_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
-        result = await _gateway_get("/status")
+        result = await _gateway_get_cached("/status")
         execution_mode = str(result.get("execution_mode", "")).strip().lower()
         if execution_mode == "ssh_tunnel":
             ssh_enabled = result.get("ssh_fallback_enabled", False)
@@ -834,12 +990,12 @@ async def cmd_agent_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 msg = f"Execution: <b>{status}</b>\nMode: <code>ssh_tunnel (forced)</code>"
                 if ssh_target:
                     msg += f"\nTarget: <code>{html.escape(str(ssh_target))}</code>"
-                await update.message.reply_text(msg, parse_mode="HTML")
+                await update.message.reply_text(msg, parse_mode=_HTML)
                 return
 
         connected = result.get("agent_connected", False)
         if connected:
-            await update.message.reply_text("Execution: <b>Worker Connected</b>", parse_mode="HTML")
+            await update.message.reply_text("Execution: <b>Worker Connected</b>", parse_mode=_HTML)
             return
 
         ssh_enabled = result.get("ssh_fallback_enabled", False)
@@ -850,67 +1006,74 @@ async def cmd_agent_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             msg = f"Execution: <b>{status}</b>"
             if ssh_target:
                 msg += f"\nTarget: <code>{html.escape(str(ssh_target))}</code>"
-            await update.message.reply_text(msg, parse_mode="HTML")
+            await update.message.reply_text(msg, parse_mode=_HTML)
             return
 
-        await update.message.reply_text("Execution: <b>No worker and no SSH fallback</b>", parse_mode="HTML")
+        await update.message.reply_text("Execution: <b>No worker and no SSH fallback</b>", parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Gateway unreachable: {exc}")
 
 
 
+@_require_auth
 async def cmd_git_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     path = _parse_path(context.args)
-    await update.message.reply_text(f"Running git_status on <code>{html.escape(path)}</code> ...", parse_mode="HTML")
+    # The ack and the gateway call are independent; overlap the two round-trips.
+    # A failed ack must not cost the user the action's result.
+    ack = asyncio.create_task(
+        update.message.reply_text(f"Running git_status on <code>{html.escape(path)}</code> ...", parse_mode=_HTML)
+    )
     try:
-        result = await _send_action("git_status", {"working_dir": path}, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        async with _typing_indicator(update):
+            result = await _send_action("git_status", {"working_dir": path}, confirmed=True)
+        await _settle_ack(ack)
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
+        await _settle_ack(ack)
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_run_tests(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     path = _parse_path(context.args)
     runner = context.args[1] if context.args and len(context.args) > 1 else "pytest"
-    await update.message.reply_text(f"Running tests ({runner}) ...", parse_mode="HTML")
+    ack = asyncio.create_task(update.message.reply_text(f"Running tests ({runner}) ...", parse_mode=_HTML))
     try:
-        result = await _send_action("run_tests", {"working_dir": path, "runner": runner}, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        async with _typing_indicator(update):
+            result = await _send_action("run_tests", {"working_dir": path, "runner": runner}, confirmed=True)
+        await _settle_ack(ack)
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
+        await _settle_ack(ack)
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_lint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     path = _parse_path(context.args)
     linter = context.args[1] if context.args and len(context.args) > 1 else "ruff"
     try:
-        result = await _send_action("lint_project", {"working_dir": path, "linter": linter}, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        async with _typing_indicator(update):
+            result = await _send_action("lint_project", {"working_dir": path, "linter": linter}, confirmed=True)
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_build(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     path = _parse_path(context.args)
     tool = context.args[1] if context.args and len(context.args) > 1 else "npm"
     try:
-        result = await _send_action("build_project", {"working_dir": path, "build_tool": tool}, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        async with _typing_indicator(update):
+            result = await _send_action("build_project", {"working_dir": path, "build_tool": tool}, confirmed=True)
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_vscode(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /vscode <path>")
         return
@@ -923,28 +1086,32 @@ async def cmd_vscode(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     )
 
 
+@_require_auth
 async def cmd_check_agents(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         result = await _send_action("check_coding_agents", {}, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+_CODING_AGENTS = ("codex", "claude", "cline")
+_CLINE_PROVIDERS = ("gemini", "deepseek", "groq", "openrouter", "openai", "anthropic")
+_VALID_CODING_AGENTS = frozenset(_CODING_AGENTS)
+_VALID_CLINE_PROVIDERS = frozenset(_CLINE_PROVIDERS)
+_RUN_AGENT_USAGE = f"Usage: /run_agent <{'|'.join(_CODING_AGENTS)}> [path=<dir>] <prompt>"
+_CLINE_PROVIDER_USAGE = f"Usage: /cline_provider <{'|'.join(_CLINE_PROVIDERS)}> [model]"
+
+
+@_require_auth
 async def cmd_run_agent(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if len(context.args) < 2:
-        await update.message.reply_text(
-            "Usage: /run_agent <codex|claude|cline> [path=<dir>] <prompt>",
-        )
+        await update.message.reply_text(_RUN_AGENT_USAGE)
         return
 
     agent = context.args[0].strip().lower()
-    if agent not in {"codex", "claude", "cline"}:
-        await update.message.reply_text("Agent must be one of: codex, claude, cline")
+    if agent not in _VALID_CODING_AGENTS:
+        await update.message.reply_text(f"Agent must be one of: {', '.join(_CODING_AGENTS)}")
         return
 
     working_dir = cfg.PROJECT_BASE_DIR or cfg.DEFAULT_WORKING_DIR
@@ -955,9 +1122,7 @@ async def cmd_run_agent(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
     prompt = " ".join(context.args[prompt_start_index:]).strip()
     if not prompt:
-        await update.message.reply_text(
-            "Usage: /run_agent <codex|claude|cline> [path=<dir>] <prompt>",
-        )
+        await update.message.reply_text(_RUN_AGENT_USAGE)
         return
 
     await _ask_confirm(
@@ -972,19 +1137,14 @@ async def cmd_run_agent(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     )
 
 
+@_require_auth
 async def cmd_cline_provider(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
-        await update.message.reply_text(
-            "Usage: /cline_provider <gemini|deepseek|groq|openrouter|openai|anthropic> [model]",
-        )
+        await update.message.reply_text(_CLINE_PROVIDER_USAGE)
         return
     provider = context.args[0].strip().lower()
-    if provider not in {"gemini", "deepseek", "groq", "openrouter", "openai", "anthropic"}:
-        await update.message.reply_text(
-            "Provider must be one of: gemini, deepseek, groq, openrouter, openai, anthropic.",
-        )
+    if provider not in _VALID_CLINE_PROVIDERS:
+        await update.message.reply_text(f"Provider must be one of: {', '.join(_CLINE_PROVIDERS)}.")
         return
     model = " ".join(context.args[1:]).strip()
     params = {"agent": "cline", "provider": provider}
@@ -992,14 +1152,13 @@ async def cmd_cline_provider(update: Update, context: ContextTypes.DEFAULT_TYPE)
         params["model"] = model
     try:
         result = await _send_action("configure_coding_agent", params, confirmed=True)
-        await update.message.reply_text(_format_result(result), parse_mode="HTML")
+        await update.message.reply_text(_format_result(result), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_git_commit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args or len(context.args) < 2:
         await update.message.reply_text(f"Usage: /git_commit [path] [message]")
         return
@@ -1009,18 +1168,16 @@ async def cmd_git_commit(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                        f"Path: <code>{html.escape(path)}</code>\nMessage: <i>{html.escape(message)}</i>")
 
 
+@_require_auth
 async def cmd_install_deps(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     path = _parse_path(context.args)
     manager = context.args[1] if context.args and len(context.args) > 1 else "pip"
     await _ask_confirm(update, "install_dependencies", {"working_dir": path, "manager": manager},
                        f"Path: <code>{html.escape(path)}</code>\nManager: {html.escape(manager)}")
 
 
+@_require_auth
 async def cmd_close_app(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not context.args:
         await update.message.reply_text("Usage: /close_app [name]")
         return
@@ -1029,9 +1186,8 @@ async def cmd_close_app(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                        f"Application: <code>{html.escape(app_name)}</code>")
 
 
+@_require_auth
 async def cmd_emergency_stop(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     # Cancel all running projects.
     if state._project_manager and state._project_manager.scheduler:
         count = state._project_manager.scheduler.cancel_all()
@@ -1041,20 +1197,19 @@ async def cmd_emergency_stop(update: Update, context: ContextTypes.DEFAULT_TYPE)
         result = await _gateway_post("/emergency-stop")
         await update.message.reply_text(
             f"EMERGENCY STOP sent.\nResponse: <code>{html.escape(json.dumps(result))}</code>",
-            parse_mode="HTML",
+            parse_mode=_HTML,
         )
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_resume(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         result = await _gateway_post("/resume")
         await update.message.reply_text(
             f"Resume sent.\nResponse: <code>{html.escape(json.dumps(result))}</code>",
-            parse_mode="HTML",
+            parse_mode=_HTML,
         )
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
@@ -1065,14 +1220,11 @@ async def cmd_resume(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 # ------------------------------------------------------------------
 
 
+@_require_auth
 async def cmd_agents(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
-        from db import store
-        from agents.roles import AGENT_CONFIGS
         if context.args:
-            project = await store.get_project_by_name(state._project_manager.db, context.args[0])
+            project = await _project_by_name(context.args[0])
             if not project:
                 await update.message.reply_text("Project not found.")
                 return
@@ -1080,25 +1232,25 @@ async def cmd_agents(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
             if not agents:
                 await update.message.reply_text("No agents spawned for this project yet.")
                 return
-            lines = [f"<b>Agents for {html.escape(project['display_name'])}:</b>\n"]
+            lines = [f"<b>Agents for {_escape_name(project['display_name'])}:</b>\n"]
             for a in agents:
                 lines.append(
                     f"  {a['role']} â€” {a['status']} "
                     f"({a.get('tasks_completed', 0)} tasks)"
                 )
-            await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+            await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
         else:
+            esc = html.escape
             lines = ["<b>Available Agent Roles:</b>\n"]
             for role, cfg_data in AGENT_CONFIGS.items():
-                lines.append(f"  <b>{role}</b> â€” {html.escape(cfg_data['description'])}")
-            await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+                lines.append(f"  <b>{role}</b> â€” {esc(cfg_data['description'])}")
+            await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
 
+@_require_auth
 async def cmd_heartbeat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not state._heartbeat:
         await update.message.reply_text("Heartbeat scheduler not configured.")
         return
@@ -1106,6 +1258,7 @@ async def cmd_heartbeat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if not status:
         await update.message.reply_text("No heartbeat tasks registered.")
         return
+    esc = html.escape
     lines = [
         f"<b>SKYNET Heartbeat</b> ({'running' if state._heartbeat.is_running else 'stopped'})\n",
     ]
@@ -1113,18 +1266,17 @@ async def cmd_heartbeat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         enabled = "ON" if t["enabled"] else "OFF"
         next_in = int(t.get("next_run_in", 0))
         lines.append(
-            f"  [{enabled}] <b>{html.escape(t['name'])}</b>\n"
-            f"    {html.escape(t['description'])}\n"
+            f"  [{enabled}] <b>{esc(t['name'])}</b>\n"
+            f"    {esc(t['description'])}\n"
             f"    Every {t['interval_seconds']}s | Runs: {t['run_count']} | Next: {next_in}s"
         )
         if t.get("last_error"):
-            lines.append(f"    Last error: {html.escape(t['last_error'])}")
-    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+            lines.append(f"    Last error: {esc(t['last_error'])}")
+    await update.message.reply_text("\n".join(lines), parse_mode=_HTML)
 
 
+@_require_auth
 async def cmd_sentinel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     if not state._sentinel:
         await update.message.reply_text("Sentinel not configured.")
         return
@@ -1133,15 +1285,27 @@ async def cmd_sentinel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         statuses = await state._sentinel.run_all_checks()
         report = state._sentinel.format_report(statuses)
         await update.message.reply_text(
-            f"<pre>{html.escape(report)}</pre>", parse_mode="HTML",
+            f"<pre>{html.escape(report)}</pre>", parse_mode=_HTML,
         )
     except Exception as exc:
         await update.message.reply_text(f"Sentinel error: {exc}")
 
 
+def _format_skill_row(row: dict[str, Any]) -> str:
+    """One /skills entry: name, description, kind and roles (plus source for prompt skills)."""
+    esc = html.escape
+    roles = esc(", ".join(row.get("allowed_roles", ["all"])))
+    head = f"  <b>{esc(row['name'])}</b> - {esc(row.get('description', ''))}\n"
+    if row.get("kind", "tool") == "prompt":
+        return (
+            f"{head}    Kind: prompt-only | Roles: {roles}\n"
+            f"    Source: <code>{esc(row.get('source', ''))}</code>"
+        )
+    return f"{head}    Kind: tools | Roles: {roles}"
+
+
+@_require_auth
 async def cmd_skills(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     try:
         if not state._skill_registry:
             await update.message.reply_text("Skill registry is not configured.")
@@ -1151,24 +1315,11 @@ async def cmd_skills(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
             await update.message.reply_text("No skills are currently loaded.")
             return
 
-        lines = ["<b>SKYNET Skills:</b>\n"]
-        for row in sorted(rows, key=lambda r: (r.get("kind", "tool"), r["name"])):
-            kind = row.get("kind", "tool")
-            roles = ", ".join(row.get("allowed_roles", ["all"]))
-            description = row.get("description", "")
-            if kind == "prompt":
-                src = row.get("source", "")
-                lines.append(
-                    f"  <b>{html.escape(row['name'])}</b> - {html.escape(description)}\n"
-                    f"    Kind: prompt-only | Roles: {html.escape(roles)}\n"
-                    f"    Source: <code>{html.escape(src)}</code>"
-                )
-            else:
-                lines.append(
-                    f"  <b>{html.escape(row['name'])}</b> - {html.escape(description)}\n"
-                    f"    Kind: tools | Roles: {html.escape(roles)}"
-                )
-        await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+        body = "\n".join(
+            _format_skill_row(row)
+            for row in sorted(rows, key=lambda r: (r.get("kind", "tool"), r["name"]))
+        )
+        await update.message.reply_text("<b>SKYNET Skills:</b>\n\n" + body, parse_mode=_HTML)
     except Exception as exc:
         await update.message.reply_text(f"Error: {exc}")
 
@@ -1178,9 +1329,8 @@ async def cmd_skills(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 # ------------------------------------------------------------------
 
 
+@_require_auth
 async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not _authorised(update):
-        return
     text = update.message.text.strip()
     if not text:
         return
@@ -1215,7 +1365,8 @@ async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         state._last_project_id = None
 
     # 5. Everything else → LLM with all tools including project management
-    await _reply_with_openclaw_capabilities(update, text)
+    async with _typing_indicator(update):
+        await _reply_with_openclaw_capabilities(update, text)
 
 
 # ------------------------------------------------------------------
@@ -1223,6 +1374,49 @@ async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 # ------------------------------------------------------------------
 
 
+_COMMANDS: tuple[tuple[str, Any], ...] = (
+    # v2 project commands.
+    ("start", cmd_start),
+    ("help", cmd_start),
+    ("newproject", cmd_newproject),
+    ("idea", cmd_idea),
+    ("plan", cmd_plan),
+    ("projects", cmd_projects),
+    ("status", cmd_project_status),
+    ("pause", cmd_pause),
+    ("resume_project", cmd_resume_project),
+    ("cancel", cmd_cancel),
+    ("removeproject", cmd_remove_project),
+    ("quota", cmd_quota),
+    ("profile", cmd_profile),
+    ("forget", cmd_forget),
+    ("no_store", cmd_no_store),
+    ("store_on", cmd_store_on),
+
+    # SKYNET system commands.
+    ("agents", cmd_agents),
+    ("heartbeat", cmd_heartbeat),
+    ("sentinel", cmd_sentinel),
+    ("skills", cmd_skills),
+
+    # v1 agent commands.
+    ("agent_status", cmd_agent_status),
+    ("git_status", cmd_git_status),
+    ("run_tests", cmd_run_tests),
+    ("lint", cmd_lint),
+    ("build", cmd_build),
+    ("vscode", cmd_vscode),
+    ("check_agents", cmd_check_agents),
+    ("run_agent", cmd_run_agent),
+    ("cline_provider", cmd_cline_provider),
+    ("git_commit", cmd_git_commit),
+    ("install_deps", cmd_install_deps),
+    ("close_app", cmd_close_app),
+    ("emergency_stop", cmd_emergency_stop),
+    ("resume", cmd_resume),
+)
+
+
 def build_app() -> Application:
     """Create and configure the Telegram bot application."""
     if not cfg.TELEGRAM_BOT_TOKEN:
@@ -1243,45 +1437,8 @@ def build_app() -> Application:
         .build()
     )
 
-    # v2 project commands.
-    app.add_handler(CommandHandler("start", cmd_start))
-    app.add_handler(CommandHandler("help", cmd_start))
-    app.add_handler(CommandHandler("newproject", cmd_newproject))
-    app.add_handler(CommandHandler("idea", cmd_idea))
-    app.add_handler(CommandHandler("plan", cmd_plan))
-    app.add_handler(CommandHandler("projects", cmd_projects))
-    app.add_handler(CommandHandler("status", cmd_project_status))
-    app.add_handler(CommandHandler("pause", cmd_pause))
-    app.add_handler(CommandHandler("resume_project", cmd_resume_project))
-    app.add_handler(CommandHandler("cancel", cmd_cancel))
-    app.add_handler(CommandHandler("removeproject", cmd_remove_project))
-    app.add_handler(CommandHandler("quota", cmd_quota))
-    app.add_handler(CommandHandler("profile", cmd_profile))
-    app.add_handler(CommandHandler("forget", cmd_forget))
-    app.add_handler(CommandHandler("no_store", cmd_no_store))
-    app.add_handler(CommandHandler("store_on", cmd_store_on))
-
-    # SKYNET system commands.
-    app.add_handler(CommandHandler("agents", cmd_agents))
-    app.add_handler(CommandHandler("heartbeat", cmd_heartbeat))
-    app.add_handler(CommandHandler("sentinel", cmd_sentinel))
-    app.add_handler(CommandHandler("skills", cmd_skills))
-
-    # v1 agent commands.
-    app.add_handler(CommandHandler("agent_status", cmd_agent_status))
-    app.add_handler(CommandHandler("git_status", cmd_git_status))
-    app.add_handler(CommandHandler("run_tests", cmd_run_tests))
-    app.add_handler(CommandHandler("lint", cmd_lint))
-    app.add_handler(CommandHandler("build", cmd_build))
-    app.add_handler(CommandHandler("vscode", cmd_vscode))
-    app.add_handler(CommandHandler("check_agents", cmd_check_agents))
-    app.add_handler(CommandHandler("run_agent", cmd_run_agent))
-    app.add_handler(CommandHandler("cline_provider", cmd_cline_provider))
-    app.add_handler(CommandHandler("git_commit", cmd_git_commit))
-    app.add_handler(CommandHandler("install_deps", cmd_install_deps))
-    app.add_handler(CommandHandler("close_app", cmd_close_app))
-    app.add_handler(CommandHandler("emergency_stop", cmd_emergency_stop))
-    app.add_handler(CommandHandler("resume", cmd_resume))
+    for name, handler in _COMMANDS:
+        app.add_handler(CommandHandler(name, handler))
 
     # Inline buttons.
     app.add_handler(CallbackQueryHandler(handle_callback))
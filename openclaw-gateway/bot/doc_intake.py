@@ -20,6 +20,7 @@ from .helpers import (
     _join_project_path,
     _notify_styled,
     _project_display,
+    _router_chat,
     _send_action,
     _spawn_background_task,
 )
@@ -501,7 +502,7 @@ async def _generate_detailed_doc_pack_with_llm(
         ],
     }
     try:
-        response = await state._provider_router.chat(
+        response = await _router_chat(
             [{"role": "user", "content": json.dumps(user_payload)}],
             system=system,
             max_tokens=8000,
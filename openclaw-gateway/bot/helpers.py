@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import contextlib
+import functools
 import html
 import json
 import logging
@@ -16,6 +18,7 @@ from typing import Any
 
 import aiohttp
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.constants import ChatAction, ParseMode
 
 import bot_config as cfg
 from ai.providers.base import ToolCall
@@ -23,6 +26,8 @@ from . import state
 
 logger = logging.getLogger("skynet.telegram")
 
+_HTML = ParseMode.HTML
+
 
 def _authorised(update: Update) -> bool:
     user = update.effective_user
@@ -32,23 +37,73 @@ def _authorised(update: Update) -> bool:
     return False
 
 
+def _require_auth(handler):
+    """Wrap a Telegram handler so unauthorised updates are dropped before it runs."""
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: Any) -> None:
+        if not _authorised(update):
+            return
+        return await handler(update, context)
+    return wrapper
+
+
+def _http_session() -> aiohttp.ClientSession:
+    """Return the shared keep-alive session, opening it on first use."""
+    session = state._http_session
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+        )
+        state._http_session = session
+    return session
+
+
+async def close_http_session() -> None:
+    """Close the shared gateway session (called on shutdown)."""
+    session, state._http_session = state._http_session, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _router_chat(messages: list[dict[str, Any]], **kwargs: Any) -> Any:
+    """Call ``provider_router.chat`` once a chat slot is free (first come, first served)."""
+    async with state._chat_slots:
+        return await state._provider_router.chat(messages, **kwargs)
+
 
 async def _gateway_get(endpoint: str) -> dict:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{cfg.GATEWAY_API_URL}{endpoint}", timeout=aiohttp.ClientTimeout(total=10)
-        ) as resp:
-            return await resp.json()
+    async with _http_session().get(
+        f"{cfg.GATEWAY_API_URL}{endpoint}", timeout=aiohttp.ClientTimeout(total=10)
+    ) as resp:
+        return await resp.json()
+
+
+async def _gateway_get_cached(endpoint: str, *, ttl: float = 3.0) -> dict:
+    """
+    ``_gateway_get`` for idempotent status reads, reusing a response for *ttl* seconds.
+
+    Concurrent callers share one request; the timestamp is taken after the
+    response arrives so a slow fetch is not already stale when cached.
+    """
+    cached = state._gateway_get_cache.get(endpoint)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    async with state._gateway_get_lock:
+        cached = state._gateway_get_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        result = await _gateway_get(endpoint)
+        state._gateway_get_cache[endpoint] = (time.monotonic(), result)
+        return result
 
 
 async def _gateway_post(endpoint: str, body: dict | None = None) -> dict:
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{cfg.GATEWAY_API_URL}{endpoint}",
-            json=body or {},
-            timeout=aiohttp.ClientTimeout(total=130),
-        ) as resp:
-            return await resp.json()
+    async with _http_session().post(
+        f"{cfg.GATEWAY_API_URL}{endpoint}",
+        json=body or {},
+        timeout=aiohttp.ClientTimeout(total=130),
+    ) as resp:
+        return await resp.json()
 
 
 async def _send_action(action: str, params: dict, confirmed: bool = False) -> dict:
@@ -86,8 +141,7 @@ def _parse_path(args: list[str], index: int = 0) -> str:
 
 
 def _store_pending(action: str, params: dict) -> str:
-    state._confirm_counter += 1
-    key = f"c{state._confirm_counter}"
+    key = f"c{next(state._confirm_ids):x}"
     state._pending_confirms[key] = {"action": action, "params": params}
     return key
 
@@ -100,7 +154,7 @@ async def _ask_confirm(update: Update, action: str, params: dict, summary: str)
     ]])
     await update.message.reply_text(
         f"<b>CONFIRM</b> -- {html.escape(action)}\n{summary}\n\nApprove this action?",
-        parse_mode="HTML", reply_markup=keyboard,
+        parse_mode=_HTML, reply_markup=keyboard,
     )
 
 
@@ -140,6 +194,10 @@ async def _build_project_context_block() -> str:
         return ""
 
 
+# Project names repeat across commands; memoize their HTML escaping.
+_escape_name = functools.lru_cache(maxsize=512)(html.escape)
+
+
 def _truncate_for_notice(value: str, *, max_chars: int = 700) -> str:
     text = (value or "").strip()
     if len(text) <= max_chars:
@@ -170,7 +228,60 @@ def _format_notification(level: str, title: str, body: str, *, project: str = ""
 
 
 async def _notify_styled(level: str, title: str, body: str, *, project: str = "") -> None:
-    await _send_to_user(_format_notification(level, title, body, project=project), parse_mode="HTML")
+    await _send_to_user(_format_notification(level, title, body, project=project), parse_mode=_HTML)
+
+
+_NOTIFY_BATCH_WINDOW_SECONDS = 0.3
+
+
+def _queue_notice(level: str, title: str, body: str, *, project: str = "") -> None:
+    """
+    Queue a high-volume notice; bursts are coalesced before sending.
+
+    A single drain task (started on first use) collects everything queued
+    within a short window and merges consecutive notices that share level,
+    title and project into one message.
+    """
+    task = state._notify_drain_task
+    if task is None or task.done():
+        state._notify_queue = asyncio.Queue()
+        task = asyncio.create_task(_drain_notices(state._notify_queue), name="telegram-notify-drain")
+        state._notify_drain_task = task
+        state._background_tasks.add(task)
+        task.add_done_callback(state._background_tasks.discard)
+    state._notify_queue.put_nowait((level, title, body, project))
+
+
+async def _drain_notices(queue: asyncio.Queue) -> None:
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(_NOTIFY_BATCH_WINDOW_SECONDS)
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        for level, title, project, bodies in _coalesce_notices(batch):
+            if len(bodies) == 1:
+                body = bodies[0]
+            else:
+                body = f"{len(bodies)} events:\n" + "\n".join(
+                    f"- {_truncate_for_notice(b, max_chars=200)}" for b in bodies
+                )
+            try:
+                await _notify_styled(level, title, body, project=project)
+            except Exception:
+                logger.exception("Failed to send queued notice: %s", title)
+
+
+def _coalesce_notices(
+    batch: list[tuple[str, str, str, str]],
+) -> list[tuple[str, str, str, list[str]]]:
+    """Merge runs of notices with the same (level, title, project), keeping order."""
+    groups: list[tuple[str, str, str, list[str]]] = []
+    for level, title, body, project in batch:
+        if groups and groups[-1][:3] == (level, title, project):
+            groups[-1][3].append(body)
+        else:
+            groups.append((level, title, project, [body]))
+    return groups
 
 
 async def _run_gateway_action_in_background(
@@ -220,7 +331,7 @@ async def _ask_remove_project_confirmation(update: Update, project: dict[str, An
             "This deletes its tasks/ideas/plans/history from the DB. "
             "Workspace files are not deleted."
         ),
-        parse_mode="HTML",
+        parse_mode=_HTML,
         reply_markup=keyboard,
     )
 
@@ -244,16 +355,38 @@ async def _send_remove_project_confirmation(project: dict[str, Any]) -> None:
             await state._bot_app.bot.send_message(
                 chat_id=cfg.ALLOWED_USER_ID,
                 text=text,
-                parse_mode="HTML",
+                parse_mode=_HTML,
                 reply_markup=keyboard,
             )
         except Exception as exc:
             logger.warning("Failed to send remove confirmation: %s", exc)
 
 
-async def _send_to_user(text: str, parse_mode: str = "HTML") -> None:
+class _SendThrottle:
+    """Space outgoing sends at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self._interval
+
+
+# Telegram allows ~30 bot messages per second; stay under it.
+_send_throttle = _SendThrottle(25)
+
+
+async def _send_to_user(text: str, parse_mode: str = _HTML) -> None:
     """Send a proactive message to the authorised user."""
     if state._bot_app and state._bot_app.bot:
+        await _send_throttle.wait()
         try:
             await state._bot_app.bot.send_message(
                 chat_id=cfg.ALLOWED_USER_ID, text=text, parse_mode=parse_mode,
@@ -261,11 +394,40 @@ async def _send_to_user(text: str, parse_mode: str = "HTML") -> None:
         except Exception as exc:
             logger.warning("Failed to send proactive message: %s", exc)
 
-def _trim_chat_history() -> None:
-    """Keep only the most recent conversation turns in memory."""
-    max_items = state._CHAT_HISTORY_MAX * 2
-    if len(state._chat_history) > max_items:
-        state._chat_history = state._chat_history[-max_items:]
+
+_TYPING_REFRESH_SECONDS = 4.0
+
+
+@contextlib.asynccontextmanager
+async def _typing_indicator(update: Update):
+    """Show "typing..." in the chat until the block exits (Telegram clears it after ~5 s)."""
+    chat = getattr(update, "effective_chat", None)
+    if chat is None:
+        yield
+        return
+
+    async def _keep_typing() -> None:
+        while True:
+            try:
+                await chat.send_action(ChatAction.TYPING)
+            except Exception as exc:
+                logger.debug("Typing indicator failed: %s", exc)
+                return
+            await asyncio.sleep(_TYPING_REFRESH_SECONDS)
+
+    task = asyncio.create_task(_keep_typing(), name="telegram-typing")
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+async def _settle_ack(task: asyncio.Task) -> None:
+    """Wait for an ack reply sent alongside an action; a failed ack is logged, not raised."""
+    try:
+        await task
+    except Exception as exc:
+        logger.warning("Ack reply failed: %s", exc)
 
 
 def _spawn_background_task(coro, *, tag: str) -> None:
@@ -443,6 +605,41 @@ def _norm_project(text: str) -> str:
     return re.sub(r"[^a-z0-9]+", "", text.lower())
 
 
+_PROJECT_INDEX_TTL_SECONDS = 60.0
+_PROJECT_INDEX_FIELDS = ("id", "name", "display_name")
+
+
+async def _project_by_name(name: str) -> dict | None:
+    """
+    Look up a project's id and names by its name, memoized for a minute.
+
+    Only identity fields are cached, so callers needing live status must
+    reload the project by id. Misses are not cached. ``ProjectManager``
+    evicts removed projects through ``invalidate_project``; the TTL only
+    bounds staleness for rows deleted behind its back.
+    """
+    now = time.monotonic()
+    cached = state._project_index.get(name)
+    if cached and now - cached[0] < _PROJECT_INDEX_TTL_SECONDS:
+        return cached[1]
+    from db import store
+
+    project = await store.get_project_by_name(state._project_manager.db, name)
+    if not project:
+        state._project_index.pop(name, None)
+        return None
+    row = {k: project.get(k) for k in _PROJECT_INDEX_FIELDS}
+    state._project_index[name] = (now, row)
+    return row
+
+
+def invalidate_project(project_id: str) -> None:
+    """Evict *project_id* from the name index (``ProjectManager.on_project_removed``)."""
+    for name, (_, row) in list(state._project_index.items()):
+        if row.get("id") == project_id:
+            del state._project_index[name]
+
+
 def _project_display(project: dict) -> str:
     return str(project.get("display_name") or project.get("name") or "project")
 
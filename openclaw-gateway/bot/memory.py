@@ -3,17 +3,31 @@ bot/memory.py -- User profile, memory store/load, no-store commands.
 """
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
 import re
+from collections import deque
 
 from telegram import Update
+from telegram.constants import ParseMode
 
 from . import state
 
 logger = logging.getLogger("skynet.telegram")
 
 
+def _chat_history_for(update: Update | None) -> deque[dict]:
+    """Return the in-process history for this chat and user, creating it if needed."""
+    chat = getattr(update, "effective_chat", None) if update is not None else None
+    user = getattr(update, "effective_user", None) if update is not None else None
+    key = (int(chat.id) if chat else 0, int(user.id) if user else 0)
+    history = state._chat_history.get(key)
+    if history is None:
+        history = state._chat_history[key] = deque(maxlen=state._CHAT_HISTORY_MAX * 2)
+    return history
+
+
 async def _ensure_memory_user(update: Update) -> dict | None:
     user = update.effective_user
     if user is None or state._project_manager is None:
@@ -33,6 +47,10 @@ async def _ensure_memory_user(update: Update) -> dict | None:
         return None
 
 
+_CONVERSATION_FLUSH_SECONDS = 0.5
+_CONVERSATION_BATCH_ROWS = 16
+
+
 async def _append_user_conversation(
     update: Update,
     *,
@@ -40,26 +58,56 @@ async def _append_user_conversation(
     content: str,
     metadata: dict | None = None,
 ) -> None:
+    """
+    Queue a conversation row for the user; rows are written in batches.
+
+    A batch is flushed after a short delay, once it reaches
+    ``_CONVERSATION_BATCH_ROWS`` rows, before history is read back, and on
+    shutdown.
+    """
     if state._project_manager is None:
         return
     user_row = await _ensure_memory_user(update)
     if not user_row:
         return
+    msg = update.message
+    state._conversation_buffer.append({
+        "user_id": int(user_row["id"]),
+        "role": role,
+        "content": content,
+        "chat_id": str(getattr(msg, "chat_id", "")),
+        "telegram_message_id": str(getattr(msg, "message_id", "")),
+        "metadata": metadata or {},
+    })
+    if len(state._conversation_buffer) >= _CONVERSATION_BATCH_ROWS:
+        await flush_user_conversations()
+        return
+    task = state._conversation_flush_task
+    if task is None or task.done():
+        task = asyncio.create_task(
+            _flush_user_conversations_later(), name="telegram-conversation-flush",
+        )
+        state._conversation_flush_task = task
+        state._background_tasks.add(task)
+        task.add_done_callback(state._background_tasks.discard)
+
+
+async def _flush_user_conversations_later() -> None:
+    await asyncio.sleep(_CONVERSATION_FLUSH_SECONDS)
+    await flush_user_conversations()
+
+
+async def flush_user_conversations() -> None:
+    """Write every queued conversation row in one batch."""
+    rows, state._conversation_buffer = state._conversation_buffer, []
+    if not rows or state._project_manager is None:
+        return
     try:
         from db import store
 
-        msg = update.message
-        await store.add_user_conversation(
-            state._project_manager.db,
-            user_id=int(user_row["id"]),
-            role=role,
-            content=content,
-            chat_id=str(getattr(msg, "chat_id", "")),
-            telegram_message_id=str(getattr(msg, "message_id", "")),
-            metadata=metadata or {},
-        )
+        await store.add_user_conversations(state._project_manager.db, rows)
     except Exception:
-        logger.exception("Failed to write user conversation record.")
+        logger.exception("Failed to write %d user conversation records.", len(rows))
 
 
 async def _load_recent_conversation_messages(
@@ -78,14 +126,15 @@ async def _load_recent_conversation_messages(
         or state._project_manager is None
         or not hasattr(state._project_manager, "db")
     ):
-        return state._chat_history[-max_items:]
+        return list(_chat_history_for(update))[-max_items:]
 
     try:
         user_row = await _ensure_memory_user(update)
         if not user_row:
-            return state._chat_history[-max_items:]
+            return list(_chat_history_for(update))[-max_items:]
         from db import store
 
+        await flush_user_conversations()
         rows = await store.list_user_conversations(
             state._project_manager.db,
             user_id=int(user_row["id"]),
@@ -93,7 +142,7 @@ async def _load_recent_conversation_messages(
         )
     except Exception:
         logger.exception("Failed to load persistent conversation history.")
-        return state._chat_history[-max_items:]
+        return list(_chat_history_for(update))[-max_items:]
 
     messages: list[dict] = []
     for row in rows:
@@ -105,7 +154,7 @@ async def _load_recent_conversation_messages(
             continue
         messages.append({"role": role, "content": content[:4000]})
 
-    return messages[-max_items:] if messages else state._chat_history[-max_items:]
+    return messages[-max_items:] if messages else list(_chat_history_for(update))[-max_items:]
 
 
 async def _profile_prompt_context(update: Update) -> str:
@@ -364,7 +413,7 @@ async def _maybe_handle_memory_text_command(update: Update, text: str) -> bool:
 
     if lowered in {"show my profile", "show profile", "what do you know about me"}:
         summary = await _format_profile_summary(update)
-        await update.message.reply_text(summary, parse_mode="HTML")
+        await update.message.reply_text(summary, parse_mode=ParseMode.HTML)
         return True
 
     if lowered.startswith("forget "):
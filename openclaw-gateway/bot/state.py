@@ -4,7 +4,9 @@ bot/state.py -- All module-level mutable globals for the SKYNET Telegram bot.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -57,17 +59,33 @@ _sentinel = None
 _searcher = None
 _skill_registry = None
 
+# Shared HTTP session for gateway calls; created lazily on the bot's loop.
+_http_session = None  # aiohttp.ClientSession | None
+
 # Stores pending CONFIRM actions keyed by a short ID.
 _pending_confirms: _TTLDict = _TTLDict(ttl_seconds=1800)
-_confirm_counter: int = 0
+_confirm_ids = itertools.count(1)
 
 # Stores pending approval futures from the orchestrator worker.
 # { "key": asyncio.Future }
 _pending_approvals: _TTLDict = _TTLDict(ttl_seconds=600)
-_approval_counter: int = 0
+_approval_ids = itertools.count(1)
 # Stores pending destructive remove-project confirmations.
 _pending_project_removals: _TTLDict = _TTLDict(ttl_seconds=300)
 _background_tasks: set[asyncio.Task] = set()
+# Bounds concurrent provider_router.chat calls from the bot (see _router_chat).
+_chat_slots = asyncio.Semaphore(cfg.MAX_CONCURRENT_CHATS)
+# Recent gateway GET responses: {endpoint: (fetched_at, body)}.
+_gateway_get_cache: dict[str, tuple[float, dict]] = {}
+_gateway_get_lock = asyncio.Lock()
+# Project identity (id/name/display_name) by name: {name: (cached_at, row)}.
+_project_index: dict[str, tuple[float, dict]] = {}
+# Conversation rows waiting to be written in one batch (see bot.memory).
+_conversation_buffer: list[dict] = []
+_conversation_flush_task: asyncio.Task | None = None
+# Project progress notices waiting to be coalesced and sent.
+_notify_queue: asyncio.Queue | None = None
+_notify_drain_task: asyncio.Task | None = None
 
 _DOC_LLM_TARGET_PATHS: tuple[str, ...] = (
     "docs/product/PRD.md",
@@ -98,8 +116,9 @@ _FINALIZED_TEMPLATE_PATH = (
 _bot_app = None  # Application | None -- assigned in build_app()
 
 # Short rolling chat history for natural Telegram conversation.
-_chat_history: list[dict] = []
 _CHAT_HISTORY_MAX: int = 12
+# Keyed by (chat_id, user_id) so conversations never bleed into each other.
+_chat_history: dict[tuple[int, int], deque[dict]] = {}
 _CHAT_SYSTEM_PROMPT = """\
 You are OpenClaw, an AI engineering collaborator running in Telegram.
 
@@ -132,10 +151,10 @@ for a brand-new project.
 """
 _last_project_id: str | None = None
 _last_model_signature: str | None = None
-_CHAT_PROVIDER_ALLOWLIST = (
-    ["gemini"]
+_CHAT_PROVIDER_ALLOWLIST: tuple[str, ...] = (
+    ("gemini",)
     if cfg.GEMINI_ONLY_MODE
-    else ["gemini", "groq", "openrouter", "deepseek", "openai", "claude"]
+    else ("gemini", "groq", "openrouter", "deepseek", "openai", "claude")
 )
 _main_persona_agent = MainPersonaAgent()
 _NO_STORE_ONCE_MARKERS = {
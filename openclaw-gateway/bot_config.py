@@ -59,6 +59,14 @@ DEFAULT_WORKING_DIR: str = os.environ.get(
     os.environ.get("OPENCLAW_DEFAULT_WORKING_DIR", _default_working_dir),
 )
 
+# Budget for one Telegram chat turn's tool loop. The loop stops at whichever
+# limit is reached first; token totals are summed across provider rounds.
+CHAT_MAX_TOOL_ROUNDS: int = _int_env("CHAT_MAX_TOOL_ROUNDS", 12)
+CHAT_MAX_INPUT_TOKENS: int = _int_env("CHAT_MAX_INPUT_TOKENS", 30_000)
+CHAT_MAX_OUTPUT_TOKENS: int = _int_env("CHAT_MAX_OUTPUT_TOKENS", 6_000)
+# Model calls the bot runs at once; later ones wait their turn (FIFO).
+MAX_CONCURRENT_CHATS: int = max(1, _int_env("MAX_CONCURRENT_CHATS", 8))
+
 # ---------------------------------------------------------------------------
 # AI Provider API Keys
 # ---------------------------------------------------------------------------
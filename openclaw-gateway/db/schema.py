@@ -230,10 +230,31 @@ _MIGRATIONS = [
 ]
 
 
+# Connection tuning applied to every gateway handle.  WAL lets readers run
+# while heartbeats write; busy_timeout makes writers wait instead of failing
+# with SQLITE_BUSY when the bot and the HTTP API share the file.
+# foreign_keys is deliberately left off: remove_project_cascade deletes
+# parent rows before the agent_runs/task_artifacts that reference them.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+async def configure_connection(db: aiosqlite.Connection) -> None:
+    """Apply the standard PRAGMA bundle to an open connection."""
+    for pragma in _PRAGMAS:
+        await db.execute(pragma)
+
+
 async def init_db(db_path: str) -> aiosqlite.Connection:
     """Open (or create) the database and ensure all tables exist."""
     db = await aiosqlite.connect(db_path)
     db.row_factory = aiosqlite.Row
+    await configure_connection(db)
     await db.executescript(SCHEMA_SQL)
     await db.commit()
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
 import aiosqlite
 
@@ -349,6 +349,8 @@ async def add_event(
     event_type: str,
     summary: str,
     detail: str = "",
+    *,
+    commit: bool = True,
 ) -> int:
     async with db.execute(
         "INSERT INTO project_events (project_id, event_type, summary, detail) "
@@ -356,10 +358,27 @@ async def add_event(
         (project_id, event_type, summary, detail),
     ) as cur:
         event_id = cur.lastrowid
-    await db.commit()
+    if commit:
+        await db.commit()
     return event_id
 
 
+async def add_events(
+    db: aiosqlite.Connection,
+    project_id: str,
+    events: list[tuple[str, str]],
+) -> None:
+    """Insert several ``(event_type, summary)`` rows with a single commit."""
+    if not events:
+        return
+    await db.executemany(
+        "INSERT INTO project_events (project_id, event_type, summary, detail) "
+        "VALUES (?, ?, ?, '')",
+        [(project_id, event_type, summary) for event_type, summary in events],
+    )
+    await db.commit()
+
+
 async def get_events(
     db: aiosqlite.Connection,
     project_id: str,
@@ -465,6 +484,7 @@ async def create_agent_run(
     agent_id: str,
     agent_role: str,
     metadata: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> int:
     now = _now()
     async with db.execute(
@@ -485,7 +505,8 @@ async def create_agent_run(
         ),
     ) as cur:
         run_id = int(cur.lastrowid)
-    await db.commit()
+    if commit:
+        await db.commit()
     return run_id
 
 
@@ -520,6 +541,26 @@ async def heartbeat_agent_run(
     await db.commit()
 
 
+async def heartbeat_agent_runs(
+    db: aiosqlite.Connection,
+    run_ids: Iterable[int],
+) -> None:
+    """Stamp ``heartbeat_at`` on many runs with a single commit."""
+    ids = [int(run_id) for run_id in run_ids]
+    if not ids:
+        return
+    now = _now()
+    # Stay well under SQLite's host-parameter limit.
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        placeholders = ", ".join("?" * len(chunk))
+        await db.execute(
+            f"UPDATE agent_runs SET heartbeat_at = ? WHERE id IN ({placeholders})",
+            (now, *chunk),
+        )
+    await db.commit()
+
+
 async def finish_agent_run(
     db: aiosqlite.Connection,
     *,
@@ -527,6 +568,7 @@ async def finish_agent_run(
     status: str,
     error_message: str = "",
     metadata_patch: dict[str, Any] | None = None,
+    commit: bool = True,
 ) -> None:
     status_norm = (status or "").strip().lower() or "unknown"
     now = _now()
@@ -567,7 +609,8 @@ async def finish_agent_run(
             """,
             (status_norm, now, now, (error_message or "")[:2000], int(run_id)),
         )
-    await db.commit()
+    if commit:
+        await db.commit()
 
 
 async def list_agent_runs(
@@ -949,6 +992,43 @@ async def add_user_conversation(
     return cid
 
 
+async def add_user_conversations(
+    db: aiosqlite.Connection,
+    rows: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Insert several conversation rows with one statement batch and one commit.
+
+    Each row carries the keyword arguments of ``add_user_conversation``.
+    Returns the number of rows written.
+    """
+    now = _now()
+    params = [
+        (
+            int(row["user_id"]),
+            row["role"],
+            row["content"],
+            row.get("chat_id", ""),
+            row.get("telegram_message_id", ""),
+            json.dumps(row.get("metadata") or {}),
+            now,
+        )
+        for row in rows
+    ]
+    if not params:
+        return 0
+    await db.executemany(
+        """
+        INSERT INTO user_conversations (
+            user_id, role, content, chat_id, telegram_message_id, metadata, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        params,
+    )
+    await db.commit()
+    return len(params)
+
+
 async def list_user_conversations(
     db: aiosqlite.Connection,
     *,
@@ -91,8 +91,9 @@ async def send_action(
         await _agent_ws.send(json.dumps(message))
         logger.info("Sent action '%s' (req=%s) to agent.", action, request_id)
 
-        result = await asyncio.wait_for(future, timeout=timeout)
-        return result
+        # Await the future directly under a deadline; wait_for would wrap it.
+        async with asyncio.timeout(timeout):
+            return await future
 
     except asyncio.TimeoutError:
         logger.warning("Timed out waiting for response to req=%s", request_id)
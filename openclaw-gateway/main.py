@@ -247,6 +247,7 @@ async def _main() -> None:
         searcher=searcher,
         scheduler=scheduler,
         project_base_dir=bot_config.PROJECT_BASE_DIR,
+        on_project_removed=telegram_bot.invalidate_project,
     )
 
     logger.info("Project orchestrator ready (max %d parallel).", scheduler.max_parallel)
@@ -299,6 +300,8 @@ async def _main() -> None:
             await bot_app.updater.stop()
             await bot_app.stop()
             await bot_app.shutdown()
+            await telegram_bot.flush_user_conversations()
+            await telegram_bot.close_http_session()
         except Exception:
             logger.exception("Error stopping Telegram bot.")
 
@@ -11,7 +11,7 @@ import asyncio
 import json
 import logging
 import re
-from typing import Any
+from typing import Any, Callable
 
 import aiohttp
 import aiosqlite
@@ -65,12 +65,15 @@ class ProjectManager:
         searcher: WebSearcher,
         scheduler: Scheduler,
         project_base_dir: str,
+        on_project_removed: Callable[[str], None] | None = None,
     ):
         self.db = db
         self.router = router
         self.searcher = searcher
         self.scheduler = scheduler
         self.base_dir = project_base_dir
+        # Lets callers holding project lookups (the bot's name index) drop them.
+        self.on_project_removed = on_project_removed
         self.planner_agent = PlannerAgent(
             router=self.router,
             run_agent_action=self._run_agent_action_for_planner,
@@ -271,6 +274,8 @@ class ProjectManager:
         deleted = await store.remove_project_cascade(self.db, project_id)
         if not deleted:
             raise ValueError("Project could not be removed.")
+        if self.on_project_removed is not None:
+            self.on_project_removed(project_id)
         return project
 
     async def list_projects(self) -> list[dict[str, Any]]:
@@ -8,6 +8,8 @@ load based on their role.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Awaitable
 
@@ -90,6 +92,9 @@ class BaseSkill(ABC):
     # Actions auto-approved when a project plan is approved.
     plan_auto_approved: set[str] = set()
 
+    # Read-only actions that may run concurrently with other such calls.
+    parallel_safe: set[str] = set()
+
     @abstractmethod
     def get_tools(self) -> list[dict[str, Any]]:
         """Return tool definitions in Anthropic tool schema format."""
@@ -108,3 +113,20 @@ class BaseSkill(ABC):
     def get_tool_names(self) -> set[str]:
         """Return all tool names this skill provides."""
         return {t["name"] for t in self.get_tools()}
+
+
+async def run_skill_tool(
+    skill: BaseSkill,
+    tool_name: str,
+    tool_input: dict[str, Any],
+    context: SkillContext,
+) -> str:
+    """
+    Execute a tool call on *skill* without blocking the event loop.
+
+    Built-in skills are async, but a skill whose ``execute`` is a plain
+    function (blocking file or subprocess work) runs in a worker thread.
+    """
+    if inspect.iscoroutinefunction(skill.execute):
+        return await skill.execute(tool_name, tool_input, context)
+    return await asyncio.to_thread(skill.execute, tool_name, tool_input, context)
@@ -10,6 +10,7 @@ class FilesystemSkill(BaseSkill):
     description = "File and directory operations on the laptop agent"
     allowed_roles = []  # All agents can use filesystem
     plan_auto_approved = {"file_write", "file_read", "list_directory", "create_directory"}
+    parallel_safe = {"file_read", "list_directory"}
 
     def get_tools(self) -> list[dict[str, Any]]:
         return [
@@ -12,6 +12,7 @@ class GitSkill(BaseSkill):
     allowed_roles = []  # All agents can use git
     requires_approval = {"git_push", "gh_create_repo"}
     plan_auto_approved = {"git_init", "git_status", "git_add_all", "git_commit"}
+    parallel_safe = {"git_status"}
 
     def get_tools(self) -> list[dict[str, Any]]:
         return [
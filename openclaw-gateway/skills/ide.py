@@ -11,6 +11,7 @@ class IDESkill(BaseSkill):
     allowed_roles = ["frontend", "backend", "devops"]
     plan_auto_approved = {"open_in_vscode", "check_coding_agents", "run_coding_agent"}
     requires_approval = {"configure_coding_agent"}
+    parallel_safe = {"check_coding_agents"}
 
     def get_tools(self) -> list[dict[str, Any]]:
         return [
@@ -37,6 +37,10 @@ class ProjectManagementSkill(BaseSkill):
     requires_approval = {
         "project_remove",
     }
+    parallel_safe = {
+        "project_list",
+        "project_status",
+    }
 
     # ------------------------------------------------------------------
     # Tool definitions
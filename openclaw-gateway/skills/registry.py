@@ -10,12 +10,16 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections import OrderedDict
 from typing import Any
 
 from .base import BaseSkill
 
 logger = logging.getLogger("skynet.skills.registry")
 
+# Distinct chat queries whose prompt-skill context is kept per registry.
+_PROMPT_CONTEXT_CACHE_SIZE = 128
+
 
 class SkillRegistry:
     """Central registry for all available skills."""
@@ -25,6 +29,10 @@ class SkillRegistry:
         self._prompt_skills: list[dict[str, str]] = []
         self._always_on_prompt_skill_names: list[str] = []
         self._always_on_snippet_chars: int = 1200
+        # Derived views, rebuilt lazily after any registration change.
+        self._all_tools: list[dict[str, Any]] | None = None
+        self._tool_index: dict[str, BaseSkill] | None = None
+        self._prompt_context_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
 
     @staticmethod
     def _norm_skill_name(value: str) -> str:
@@ -33,6 +41,8 @@ class SkillRegistry:
     def register(self, skill: BaseSkill) -> None:
         """Register a skill."""
         self._skills[skill.name] = skill
+        self._all_tools = None
+        self._tool_index = None
         logger.debug("Registered skill: %s (%d tools)", skill.name, len(skill.get_tool_names()))
 
     def register_prompt_skill(
@@ -55,6 +65,7 @@ class SkillRegistry:
             "source": source.strip(),
             "search_blob": f"{name}\n{description}\n{content}".lower(),
         })
+        self._prompt_context_cache.clear()
         logger.debug("Registered external prompt skill: %s", name)
 
     def set_always_on_prompt_skills(
@@ -75,6 +86,7 @@ class SkillRegistry:
                 normalized.append(norm)
         self._always_on_prompt_skill_names = normalized
         self._always_on_snippet_chars = max(300, int(snippet_chars or 1200))
+        self._prompt_context_cache.clear()
 
     def get_tools_for_role(self, role: str) -> list[dict[str, Any]]:
         """Return combined tool definitions for an agent role."""
@@ -86,23 +98,34 @@ class SkillRegistry:
 
     def get_all_tools(self) -> list[dict[str, Any]]:
         """Return all tool definitions (for backward compatibility)."""
-        tools = []
-        for skill in self._skills.values():
-            tools.extend(skill.get_tools())
-        return tools
+        if self._all_tools is None:
+            tools = []
+            for skill in self._skills.values():
+                tools.extend(skill.get_tools())
+            self._all_tools = tools
+        # Fresh list so callers can append without touching the cache.
+        return list(self._all_tools)
 
     def get_skill_for_tool(self, tool_name: str) -> BaseSkill | None:
         """Find which skill handles a given tool name."""
-        for skill in self._skills.values():
-            if tool_name in skill.get_tool_names():
-                return skill
-        return None
+        if self._tool_index is None:
+            index: dict[str, BaseSkill] = {}
+            for skill in self._skills.values():
+                for name in skill.get_tool_names():
+                    index.setdefault(name, skill)
+            self._tool_index = index
+        return self._tool_index.get(tool_name)
 
     def is_plan_auto_approved(self, tool_name: str) -> bool:
         """Check if a tool is auto-approved when plan is approved."""
         skill = self.get_skill_for_tool(tool_name)
         return skill is not None and tool_name in skill.plan_auto_approved
 
+    def is_parallel_safe(self, tool_name: str) -> bool:
+        """Check if a tool is read-only and may run alongside other such calls."""
+        skill = self.get_skill_for_tool(tool_name)
+        return skill is not None and tool_name in skill.parallel_safe
+
     def requires_approval(self, tool_name: str) -> bool:
         """Check if a tool always requires Telegram approval."""
         skill = self.get_skill_for_tool(tool_name)
@@ -153,6 +176,18 @@ class SkillRegistry:
             return ""
 
         text = (query or "").strip().lower()
+        key = (text, max_skills, max_chars)
+        cached = self._prompt_context_cache.get(key)
+        if cached is not None:
+            self._prompt_context_cache.move_to_end(key)
+            return cached
+        context = self._build_prompt_skill_context(text, max_skills=max_skills, max_chars=max_chars)
+        self._prompt_context_cache[key] = context
+        if len(self._prompt_context_cache) > _PROMPT_CONTEXT_CACHE_SIZE:
+            self._prompt_context_cache.popitem(last=False)
+        return context
+
+    def _build_prompt_skill_context(self, text: str, *, max_skills: int, max_chars: int) -> str:
         if not text and not self._always_on_prompt_skill_names:
             return ""
 
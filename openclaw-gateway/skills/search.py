@@ -9,6 +9,7 @@ class SearchSkill(BaseSkill):
     name = "search"
     description = "Web search for programming resources and documentation"
     allowed_roles = []
+    parallel_safe = {"web_search"}
 
     def get_tools(self) -> list[dict[str, Any]]:
         return [
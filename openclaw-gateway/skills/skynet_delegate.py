@@ -40,6 +40,7 @@ class SkynetDelegateSkill(BaseSkill):
         "skynet_route_task",
         "skynet_system_state",
     }
+    parallel_safe = {"skynet_system_state"}
 
     def __init__(self):
         self.skynet_api_url = os.getenv("SKYNET_ORCHESTRATOR_URL", "http://localhost:8000")
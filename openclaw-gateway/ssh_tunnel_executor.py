@@ -180,6 +180,8 @@ class SSHTunnelExecutor:
         self._health_cache_seconds = _env_int("OPENCLAW_SSH_HEALTH_CACHE_SECONDS", 15)
         self._last_health_at = 0.0
         self._last_health: tuple[bool, str] = (False, "SSH health not checked yet")
+        # Concurrent /status polls after expiry share one probe.
+        self._health_lock = asyncio.Lock()
         self._cline_auto_switch = _env_bool("OPENCLAW_CLINE_AUTO_SWITCH", True)
         self._cline_provider_priority = _parse_provider_priority(
             os.environ.get("OPENCLAW_CLINE_PROVIDER_PRIORITY", ""),
@@ -199,17 +201,21 @@ class SSHTunnelExecutor:
     async def health_check(self) -> tuple[bool, str]:
         if not self.is_configured():
             return False, "SSH executor not configured"
-        now = time.time()
-        if now - self._last_health_at < max(self._health_cache_seconds, 1):
+        ttl = max(self._health_cache_seconds, 1)
+        if time.time() - self._last_health_at < ttl:
+            return self._last_health
+        async with self._health_lock:
+            now = time.time()
+            if now - self._last_health_at < ttl:
+                return self._last_health
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self._probe_sync)
+                self._last_health = (True, f"{self.username}@{self.host}:{self.port}")
+            except Exception as exc:
+                self._last_health = (False, str(exc))
+            self._last_health_at = now
             return self._last_health
-        loop = asyncio.get_running_loop()
-        try:
-            await loop.run_in_executor(None, self._probe_sync)
-            self._last_health = (True, f"{self.username}@{self.host}:{self.port}")
-        except Exception as exc:
-            self._last_health = (False, str(exc))
-        self._last_health_at = now
-        return self._last_health
 
     async def execute_action(
         self,
@@ -7,6 +7,9 @@ other callers continue to work without changes.
 """
 from bot import (
     build_app,
+    close_http_session,
+    flush_user_conversations,
+    invalidate_project,
     set_dependencies,
     on_project_progress,
     request_worker_approval,
@@ -16,6 +19,9 @@ from bot import (
 
 __all__ = [
     "build_app",
+    "close_http_session",
+    "flush_user_conversations",
+    "invalidate_project",
     "set_dependencies",
     "on_project_progress",
     "request_worker_approval",
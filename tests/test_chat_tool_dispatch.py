@@ -0,0 +1,122 @@
+"""Telegram chat tool-call dispatch tests."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+
+
+def _ensure_gateway_path() -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+
+@pytest.mark.asyncio
+async def test_run_chat_tools_overlaps_read_only_calls_and_keeps_order(monkeypatch) -> None:
+    _ensure_gateway_path()
+    from ai.providers.base import ToolCall
+    from bot import commands, state
+    from skills.base import BaseSkill
+    from skills.registry import SkillRegistry
+
+    events: list[str] = []
+
+    class _Skill(BaseSkill):
+        name = "probe"
+        parallel_safe = {"read"}
+
+        def get_tools(self) -> list[dict[str, Any]]:
+            return [{"name": n, "description": n, "input_schema": {}} for n in ("read", "write")]
+
+        async def execute(self, tool_name, tool_input, context) -> str:
+            tag = f"{tool_name}:{tool_input['n']}"
+            events.append(f"start {tag}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {tag}")
+            return tag
+
+    registry = SkillRegistry()
+    registry.register(_Skill())
+    monkeypatch.setattr(state, "_skill_registry", registry)
+
+    calls = [
+        ToolCall(id="1", name="read", input={"n": 1}),
+        ToolCall(id="2", name="read", input={"n": 2}),
+        ToolCall(id="3", name="write", input={"n": 3}),
+        ToolCall(id="4", name="missing", input={}),
+    ]
+    results = await commands._run_chat_tools(calls, context=None)
+
+    assert [r["tool_use_id"] for r in results] == ["1", "2", "3", "4"]
+    assert [r["content"] for r in results] == ["read:1", "read:2", "write:3", "Unknown tool: missing"]
+    # Both reads start before either finishes; the write waits for them.
+    assert events[:2] == ["start read:1", "start read:2"]
+    assert events.index("start write:3") > events.index("end read:2")
+
+
+@pytest.mark.asyncio
+async def test_run_skill_tool_moves_sync_execute_off_the_loop() -> None:
+    _ensure_gateway_path()
+    import threading
+
+    from skills.base import BaseSkill, run_skill_tool
+
+    loop_thread = threading.get_ident()
+
+    class _SyncSkill(BaseSkill):
+        name = "sync_probe"
+
+        def get_tools(self) -> list[dict[str, Any]]:
+            return [{"name": "probe", "description": "probe", "input_schema": {}}]
+
+        def execute(self, tool_name, tool_input, context) -> str:  # type: ignore[override]
+            return "thread" if threading.get_ident() != loop_thread else "loop"
+
+    assert await run_skill_tool(_SyncSkill(), "probe", {}, None) == "thread"
+
+
+def test_summary_window_keeps_request_and_starts_on_assistant() -> None:
+    _ensure_gateway_path()
+    from bot import commands
+
+    messages = [{"role": "user", "content": "old"}, {"role": "user", "content": "request"}]
+    for i in range(10):
+        messages.append({"role": "assistant", "content": f"call {i}"})
+        messages.append({"role": "user", "content": [{"type": "tool_result", "content": f"result {i}"}]})
+
+    window = commands._summary_window(messages, request_index=1)
+
+    assert window[0] == {"role": "user", "content": "request"}
+    assert window[1]["role"] == "assistant"
+    assert window[-1]["content"][0]["content"] == "result 9"
+    assert len(window) <= commands._SUMMARY_WINDOW_MESSAGES + 1
+
+
+def test_compact_tool_messages_folds_old_rounds_into_request() -> None:
+    _ensure_gateway_path()
+    from bot import commands
+
+    messages: list[dict[str, Any]] = [{"role": "user", "content": "request"}]
+    digest: list[str] = []
+    for i in range(5):
+        messages.append({"role": "assistant", "content": [
+            {"type": "tool_use", "id": f"t{i}", "name": "file_read", "input": {"path": f"f{i}"}},
+        ]})
+        messages.append({"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": f"t{i}", "name": "file_read", "content": f"ok {i}\nmore"},
+        ]})
+        commands._compact_tool_messages(messages, 0, "request", digest, keep_last=3)
+
+    assert len(messages) == 1 + 2 * 3
+    assert messages[1]["content"][0]["id"] == "t2"
+    assert messages[0]["content"].startswith("request\n\n[Earlier tool calls this turn]\n")
+    assert digest == [
+        '- file_read({"path": "f0"}) -> ok 0',
+        '- file_read({"path": "f1"}) -> ok 1',
+    ]
@@ -115,3 +115,80 @@ async def test_agent_runs_and_task_artifacts_roundtrip() -> None:
         assert all_artifacts[0]["id"] == artifact_id
     finally:
         await db.close()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_agent_runs_stamps_every_run() -> None:
+    repo_root = Path(__file__).parent.parent
+    schema_path = repo_root / "openclaw-gateway" / "db" / "schema.py"
+    store_path = repo_root / "openclaw-gateway" / "db" / "store.py"
+
+    schema = _load_module(schema_path, "oc_gateway_schema_agent_runs_hb")
+    store = _load_module(store_path, "oc_gateway_store_agent_runs_hb")
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(
+            db,
+            "heartbeat-project",
+            "Heartbeat Project",
+            "E:/tmp/heartbeat-project",
+        )
+        run_ids = [
+            await store.create_agent_run(
+                db,
+                project_id=project["id"],
+                task_id=None,
+                agent_id=f"agent-{i}",
+                agent_role="backend",
+            )
+            for i in range(3)
+        ]
+        await db.execute("UPDATE agent_runs SET heartbeat_at = '2000-01-01T00:00:00'")
+        await db.commit()
+
+        await store.heartbeat_agent_runs(db, run_ids[:2])
+
+        runs = {
+            run["id"]: run
+            for run in await store.list_agent_runs(db, project_id=project["id"], limit=10)
+        }
+        assert runs[run_ids[0]]["heartbeat_at"] > "2000-01-01T00:00:00"
+        assert runs[run_ids[1]]["heartbeat_at"] > "2000-01-01T00:00:00"
+        assert runs[run_ids[2]]["heartbeat_at"] == "2000-01-01T00:00:00"
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_start_run_rolls_back_when_event_write_fails(monkeypatch) -> None:
+    import sys
+
+    gateway_root = str(Path(__file__).parent.parent / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+    from agents.manager_watcher import ManagerWatcherAgent
+    from db import schema, store
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "rollback-project", "Rollback", "/tmp/rb")
+
+        async def _failing_add_event(*args, **kwargs):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(store, "add_event", _failing_add_event)
+        watcher = ManagerWatcherAgent(db=db)
+        with pytest.raises(RuntimeError):
+            await watcher.start_run(
+                project_id=project["id"],
+                task_id=None,
+                task_title="t",
+                agent_id="a",
+                agent_role="backend",
+            )
+        # A later unrelated commit must not persist the orphaned run row.
+        await db.commit()
+        assert await store.list_agent_runs(db, project_id=project["id"], limit=10) == []
+    finally:
+        await db.close()
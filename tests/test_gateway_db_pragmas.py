@@ -0,0 +1,37 @@
+"""Gateway SQLite connection tuning tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import importlib.util
+
+import pytest
+
+
+def _load_module(path: Path, module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.mark.asyncio
+async def test_init_db_enables_wal_and_busy_timeout(tmp_path: Path) -> None:
+    repo_root = Path(__file__).parent.parent
+    schema = _load_module(
+        repo_root / "openclaw-gateway" / "db" / "schema.py",
+        "oc_gateway_schema_pragmas",
+    )
+
+    db = await schema.init_db(str(tmp_path / "gateway.db"))
+    try:
+        async with db.execute("PRAGMA journal_mode") as cur:
+            assert (await cur.fetchone())[0] == "wal"
+        async with db.execute("PRAGMA busy_timeout") as cur:
+            assert (await cur.fetchone())[0] == 5000
+        async with db.execute("PRAGMA synchronous") as cur:
+            assert (await cur.fetchone())[0] == 1  # NORMAL
+    finally:
+        await db.close()
@@ -0,0 +1,42 @@
+"""Gateway project event storage tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import importlib.util
+
+import pytest
+
+
+def _load_module(path: Path, module_name: str):
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.mark.asyncio
+async def test_add_events_batch_roundtrip() -> None:
+    repo_root = Path(__file__).parent.parent
+    schema = _load_module(repo_root / "openclaw-gateway" / "db" / "schema.py", "oc_gateway_schema_events")
+    store = _load_module(repo_root / "openclaw-gateway" / "db" / "store.py", "oc_gateway_store_events")
+
+    db = await schema.init_db(":memory:")
+    try:
+        project = await store.create_project(db, "events-project", "Events Project", "E:/tmp/events")
+
+        await store.add_events(db, project["id"], [])
+        await store.add_events(
+            db,
+            project["id"],
+            [("task_started", "first"), ("task_completed", "second"), ("paused", "third")],
+        )
+
+        events = await store.get_events(db, project["id"], limit=10)
+        assert len(events) == 3
+        assert {e["summary"] for e in events} == {"first", "second", "third"}
+        assert all(e["detail"] == "" for e in events)
+    finally:
+        await db.close()
@@ -147,7 +147,7 @@ async def _build_state(router: ScriptedRouter):
     )
     state._bot_app = _FakeApp()
     state._last_project_id = None
-    state._chat_history = []
+    state._chat_history.clear()
 
     return db, pm, registry, cfg, original_auth
 
@@ -165,7 +165,7 @@ async def _teardown_state(db, cfg, original_auth):
     state._skill_registry = None
     state._bot_app = None
     state._last_project_id = None
-    state._chat_history = []
+    state._chat_history.clear()
     cfg.ALLOWED_USER_ID = original_auth
     await db.close()
 
@@ -568,3 +568,21 @@ def test_is_new_project_intent_does_not_match_non_creation_phrases() -> None:
     assert _is_new_project_intent("add idea to the project") is False
     assert _is_new_project_intent("list my projects") is False
     assert _is_new_project_intent("hi") is False
+
+
+# ---------------------------------------------------------------------------
+# SCENARIO 14: Unauthorised sender is dropped before the handler runs
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_scenario_unauthorised_user_gets_no_reply() -> None:
+    router = ScriptedRouter([])
+    db, pm, registry, cfg, orig_auth = await _build_state(router)
+    try:
+        from bot.commands import handle_text
+        update = _FakeUpdate(message=_FakeMessage(text="hi"), effective_user=_FakeUser(id=1))
+        await handle_text(update, context=None)
+        assert update.message.replies == []
+        assert handle_text.__name__ == "handle_text"
+    finally:
+        await _teardown_state(db, cfg, orig_auth)
@@ -0,0 +1,56 @@
+"""Main persona delegation policy tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+
+def _ensure_gateway_path() -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+
+def test_should_delegate_matches_work_requests() -> None:
+    _ensure_gateway_path()
+    from agents.main_persona import MainPersonaAgent
+
+    agent = MainPersonaAgent()
+    assert agent.should_delegate("Please IMPLEMENT the login flow") is True
+    assert agent.should_delegate("can you deploy it") is True
+    assert agent.should_delegate("write tests for the parser") is True
+    assert agent.should_delegate("integration with stripe") is True
+    assert agent.should_delegate("create a project called foo") is True
+    assert agent.should_delegate("create the repo") is True
+
+
+def test_should_delegate_ignores_chat() -> None:
+    _ensure_gateway_path()
+    from agents.main_persona import MainPersonaAgent
+
+    agent = MainPersonaAgent()
+    assert agent.should_delegate("") is False
+    assert agent.should_delegate("hi there") is False
+    assert agent.should_delegate("nice buildings in that photo") is False
+    assert agent.should_delegate("what is a builder pattern?") is False
+
+
+def test_should_delegate_long_messages() -> None:
+    _ensure_gateway_path()
+    from agents.main_persona import MainPersonaAgent
+
+    agent = MainPersonaAgent()
+    assert agent.should_delegate("x" * 240) is True
+    assert agent.should_delegate("  " + "x" * 238 + "  ") is False
+
+
+def test_should_delegate_keyword_prefilter_keeps_word_boundaries() -> None:
+    _ensure_gateway_path()
+    from agents.main_persona import MainPersonaAgent
+
+    agent = MainPersonaAgent()
+    # Contains the "build" literal but not as a whole word.
+    assert agent.should_delegate("the rebuilding was slow") is False
+    assert agent.should_delegate("Rebuild? no, just BUILD it") is True
@@ -0,0 +1,48 @@
+"""Planner plan-JSON extraction tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+
+def _ensure_gateway_path() -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+
+def test_parse_plan_json_fenced_and_plain() -> None:
+    _ensure_gateway_path()
+    from agents.planner_agent import PlannerAgent
+
+    assert PlannerAgent.parse_plan_json('{"summary": "x"}') == {"summary": "x"}
+    fenced = 'Here is the plan:\n```json\n{"summary": "y"}\n```\nDone.'
+    assert PlannerAgent.parse_plan_json(fenced) == {"summary": "y"}
+
+
+def test_parse_plan_json_embedded_object_ignores_trailing_braces() -> None:
+    _ensure_gateway_path()
+    from agents.planner_agent import PlannerAgent
+
+    text = 'Plan: {"summary": "a } b", "tasks": [{"title": "t"}]} then {notes}'
+    assert PlannerAgent.parse_plan_json(text) == {
+        "summary": "a } b",
+        "tasks": [{"title": "t"}],
+    }
+    assert PlannerAgent.parse_plan_json('see {this} and {"ok": 1}') is None
+    assert PlannerAgent.parse_plan_json("no plan here") is None
+
+
+def test_parse_plan_json_truncated_plan_is_rejected() -> None:
+    _ensure_gateway_path()
+    from agents.planner_agent import PlannerAgent
+
+    # A reply cut off at max_tokens must not yield a nested milestone.
+    truncated = (
+        'Plan: {"summary": "s", "milestones": '
+        '[{"name": "m1", "tasks": [{"title": "t"}]}'
+    )
+    assert PlannerAgent.parse_plan_json(truncated) is None
+    assert PlannerAgent.parse_plan_json(truncated.split(": ", 1)[1]) is None
@@ -0,0 +1,72 @@
+"""Skill registry lookup cache tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from typing import Any
+
+
+def _ensure_gateway_path() -> None:
+    repo_root = Path(__file__).parent.parent
+    gateway_root = str(repo_root / "openclaw-gateway")
+    if gateway_root not in sys.path:
+        sys.path.insert(0, gateway_root)
+
+
+def _make_skill(skill_name: str, tool_names: list[str]):
+    from skills.base import BaseSkill
+
+    class _Skill(BaseSkill):
+        name = skill_name
+        description = skill_name
+
+        def get_tools(self) -> list[dict[str, Any]]:
+            return [{"name": n, "description": n, "input_schema": {}} for n in tool_names]
+
+        async def execute(self, tool_name, tool_input, context) -> str:
+            return tool_name
+
+    return _Skill()
+
+
+def test_tool_lookups_refresh_after_register() -> None:
+    _ensure_gateway_path()
+    from skills.registry import SkillRegistry
+
+    registry = SkillRegistry()
+    first = _make_skill("first", ["alpha", "shared"])
+    registry.register(first)
+    assert [t["name"] for t in registry.get_all_tools()] == ["alpha", "shared"]
+    assert registry.get_skill_for_tool("alpha") is first
+    assert registry.get_skill_for_tool("beta") is None
+
+    second = _make_skill("second", ["beta", "shared"])
+    registry.register(second)
+    assert [t["name"] for t in registry.get_all_tools()] == ["alpha", "shared", "beta", "shared"]
+    assert registry.get_skill_for_tool("beta") is second
+    # First registered skill still wins for a duplicated tool name.
+    assert registry.get_skill_for_tool("shared") is first
+
+    # Callers get their own list; mutating it leaves the cache intact.
+    registry.get_all_tools().append({"name": "bogus"})
+    assert len(registry.get_all_tools()) == 4
+
+
+def test_prompt_skill_context_cache_invalidates_on_new_skill() -> None:
+    _ensure_gateway_path()
+    from skills.registry import SkillRegistry
+
+    registry = SkillRegistry()
+    registry.register_prompt_skill(
+        name="Docker tips", description="docker", content="multi-stage builds", source="test",
+    )
+    query = "help with docker builds"
+    first = registry.get_prompt_skill_context(query)
+    assert "[Skill: Docker tips]" in first
+    assert registry.get_prompt_skill_context(query) == first
+
+    registry.register_prompt_skill(
+        name="Builds guide", description="builds", content="cache layers", source="test",
+    )
+    assert "[Skill: Builds guide]" in registry.get_prompt_skill_context(query)
@@ -241,3 +241,160 @@ async def test_project_skill_add_idea_no_active_project() -> None:
     finally:
         state._project_manager = original_pm
         state._last_project_id = original_pid
+
+
+# ---------------------------------------------------------------------------
+# _chat_history_for
+# ---------------------------------------------------------------------------
+
+def test_chat_history_is_kept_per_chat_and_user() -> None:
+    _ensure_gateway_path()
+    from types import SimpleNamespace
+
+    from bot import state
+    from bot.memory import _chat_history_for
+
+    def _update(chat_id: int, user_id: int):
+        return SimpleNamespace(effective_chat=SimpleNamespace(id=chat_id), effective_user=SimpleNamespace(id=user_id))
+
+    state._chat_history.clear()
+    try:
+        _chat_history_for(_update(1, 10)).append({"role": "user", "content": "a"})
+        _chat_history_for(_update(2, 20)).append({"role": "user", "content": "b"})
+
+        assert list(_chat_history_for(_update(1, 10))) == [{"role": "user", "content": "a"}]
+        assert list(_chat_history_for(_update(2, 20))) == [{"role": "user", "content": "b"}]
+        assert _chat_history_for(_update(1, 10)).maxlen == state._CHAT_HISTORY_MAX * 2
+    finally:
+        state._chat_history.clear()
+
+
+# ---------------------------------------------------------------------------
+# _coalesce_notices
+# ---------------------------------------------------------------------------
+
+def test_coalesce_notices_merges_consecutive_runs_only() -> None:
+    _ensure_gateway_path()
+    from bot.helpers import _coalesce_notices
+
+    batch = [
+        ("progress", "Project Event: task_started", "a", "p1"),
+        ("progress", "Project Event: task_started", "b", "p1"),
+        ("success", "Project Event: task_completed", "a", "p1"),
+        ("progress", "Project Event: task_started", "c", "p1"),
+    ]
+
+    assert _coalesce_notices(batch) == [
+        ("progress", "Project Event: task_started", "p1", ["a", "b"]),
+        ("success", "Project Event: task_completed", "p1", ["a"]),
+        ("progress", "Project Event: task_started", "p1", ["c"]),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# _project_by_name
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_project_by_name_memoizes_identity_fields() -> None:
+    _ensure_gateway_path()
+    from types import SimpleNamespace
+
+    from bot import state
+    from bot.helpers import _project_by_name, invalidate_project
+    from db import store
+    from db.schema import init_db
+
+    db = await init_db(":memory:")
+    original_pm = state._project_manager
+    state._project_manager = SimpleNamespace(db=db)
+    state._project_index.clear()
+    try:
+        await store.create_project(db, name="demo", display_name="Demo", local_path="/tmp/demo")
+        first = await _project_by_name("demo")
+        assert first is not None and set(first) == {"id", "name", "display_name"}
+        assert await _project_by_name("missing") is None
+
+        await db.execute("DELETE FROM projects")
+        await db.commit()
+        assert await _project_by_name("demo") == first  # served from the index
+
+        state._project_index.clear()
+        assert await _project_by_name("demo") is None
+
+        again = await store.create_project(db, name="demo", display_name="Demo", local_path="/tmp/demo")
+        assert (await _project_by_name("demo"))["id"] == again["id"]
+        invalidate_project(again["id"])
+        assert "demo" not in state._project_index
+    finally:
+        state._project_manager = original_pm
+        state._project_index.clear()
+        await db.close()
+
+
+# ---------------------------------------------------------------------------
+# Action command acks
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_git_status_ack_overlaps_gateway_call(monkeypatch) -> None:
+    _ensure_gateway_path()
+    import asyncio
+    from types import SimpleNamespace
+
+    import bot_config as cfg
+    from bot import commands
+
+    replies: list[str] = []
+    action_started = asyncio.Event()
+
+    async def _reply_text(text: str, **kwargs) -> None:
+        if not replies:
+            # Only completes if the gateway call was started alongside the ack.
+            await action_started.wait()
+        replies.append(text)
+
+    async def _send_action(action: str, params: dict, confirmed: bool = False) -> dict:
+        action_started.set()
+        return {"status": "success", "action": action, "result": {}}
+
+    monkeypatch.setattr(cfg, "ALLOWED_USER_ID", 7)
+    monkeypatch.setattr(commands, "_send_action", _send_action)
+    update = SimpleNamespace(
+        effective_user=SimpleNamespace(id=7),
+        effective_chat=None,
+        message=SimpleNamespace(reply_text=_reply_text),
+    )
+    await asyncio.wait_for(
+        commands.cmd_git_status(update, SimpleNamespace(args=["/tmp/repo"])), timeout=2
+    )
+    assert len(replies) == 2 and replies[0].startswith("Running git_status")
+
+
+@pytest.mark.asyncio
+async def test_run_tests_result_survives_failed_ack(monkeypatch) -> None:
+    _ensure_gateway_path()
+    from types import SimpleNamespace
+
+    import bot_config as cfg
+    from bot import commands
+
+    replies: list[str] = []
+
+    async def _reply_text(text: str, **kwargs) -> None:
+        if text.startswith("Running"):
+            raise RuntimeError("429 Too Many Requests")
+        replies.append(text)
+
+    async def _send_action(action: str, params: dict, confirmed: bool = False) -> dict:
+        return {"status": "success", "action": action, "result": {"stdout": "1 passed"}}
+
+    monkeypatch.setattr(cfg, "ALLOWED_USER_ID", 7)
+    monkeypatch.setattr(commands, "_send_action", _send_action)
+    update = SimpleNamespace(
+        effective_user=SimpleNamespace(id=7),
+        effective_chat=None,
+        message=SimpleNamespace(reply_text=_reply_text),
+    )
+    await commands.cmd_run_tests(update, SimpleNamespace(args=[]))
+    assert len(replies) == 1 and not replies[0].startswith("Error")
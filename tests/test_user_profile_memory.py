@@ -92,3 +92,26 @@ async def test_user_profile_memory_crud() -> None:
         assert int(reloaded["memory_enabled"]) == 0
     finally:
         await db.close()
+
+
+@pytest.mark.asyncio
+async def test_add_user_conversations_batches_rows_in_order() -> None:
+    repo_root = Path(__file__).parent.parent
+    schema = _load_module(repo_root / "openclaw-gateway" / "db" / "schema.py", "oc_gateway_schema")
+    store = _load_module(repo_root / "openclaw-gateway" / "db" / "store.py", "oc_gateway_store")
+
+    db = await schema.init_db(":memory:")
+    try:
+        user = await store.ensure_user(db, telegram_user_id=777)
+        written = await store.add_user_conversations(db, [
+            {"user_id": user["id"], "role": "user", "content": "hi", "metadata": {"channel": "x"}},
+            {"user_id": user["id"], "role": "assistant", "content": "hello"},
+        ])
+        assert written == 2
+        assert await store.add_user_conversations(db, []) == 0
+
+        rows = await store.list_user_conversations(db, user_id=user["id"])
+        assert [(r["role"], r["content"]) for r in rows] == [("user", "hi"), ("assistant", "hello")]
+        assert rows[0]["metadata"] == {"channel": "x"}
+    finally:
+        await db.close()